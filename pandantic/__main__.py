@@ -0,0 +1,5 @@
+import sys
+
+from pandantic.cli import main
+
+sys.exit(main())
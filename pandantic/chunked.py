@@ -0,0 +1,246 @@
+"""
+Chunk by chunk evaluation of DataFrames too large for memory, resumable
+from a local checkpoint written after every chunk.
+"""
+import collections.abc
+import itertools
+import os
+import pickle
+import tempfile
+import time
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Union
+
+import pandas as pd
+
+from pandantic import partitioned, summaries
+
+
+class Checkpoint:
+    """
+    State of a chunked evaluation after its first completed chunks: the
+    decisions of the passes started (see summaries.frame_passes), the
+    summaries merged over the completed passes and over the completed
+    chunks of the current pass, including mergeable validator states, and
+    the rows of the chunks evaluated.
+    """
+
+    __slots__ = (
+        "schema_name",
+        "column_names",
+        "passes",
+        "completed_passes",
+        "completed_chunks",
+        "decisions",
+        "frame_summary",
+        "pass_summary",
+        "missing_columns",
+        "remaining_columns",
+        "rows",
+    )
+
+    def __init__(
+        self,
+        schema_name: str,
+        column_names: List,
+        passes: int = 1,
+        completed_passes: int = 0,
+        completed_chunks: int = 0,
+        decisions: Optional[List[Dict[str, summaries.Decision]]] = None,
+        frame_summary: Optional[Dict[str, Optional[summaries.ColumnSummary]]] = None,
+        pass_summary: Optional[Dict[str, Optional[summaries.ColumnSummary]]] = None,
+        missing_columns: Optional[List] = None,
+        remaining_columns: Optional[List] = None,
+        rows: int = 0,
+    ) -> None:
+        self.schema_name = schema_name
+        self.column_names = column_names
+        self.passes = passes
+        self.completed_passes = completed_passes
+        self.completed_chunks = completed_chunks
+        self.decisions = decisions if decisions is not None else []
+        self.frame_summary = frame_summary if frame_summary is not None else dict()
+        self.pass_summary = pass_summary
+        self.missing_columns = missing_columns
+        self.remaining_columns = remaining_columns
+        self.rows = rows
+
+    @classmethod
+    def for_schema(cls, schema) -> "Checkpoint":
+        return cls(
+            type(schema).__qualname__,
+            list(schema.get_columns()) + list(schema.get_frame_validators()),
+            len(summaries.frame_passes(schema)),
+        )
+
+    def matches(self, schema) -> bool:
+        other = Checkpoint.for_schema(schema)
+        return (self.schema_name, self.column_names, self.passes) == (
+            other.schema_name,
+            other.column_names,
+            other.passes,
+        )
+
+    @classmethod
+    def load(cls, path: str) -> "Checkpoint":
+        with open(path, "rb") as checkpoint_file:
+            return pickle.load(checkpoint_file)
+
+    def save(self, path: str) -> None:
+        directory = os.path.dirname(os.path.abspath(path))
+        descriptor, temporary_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with os.fdopen(descriptor, "wb") as temporary_file:
+            pickle.dump(self, temporary_file, protocol=pickle.HIGHEST_PROTOCOL)
+            temporary_file.flush()
+            os.fsync(temporary_file.fileno())
+        os.replace(temporary_path, path)
+
+
+Chunk = Union[pd.DataFrame, Callable[[], pd.DataFrame], str, os.PathLike]
+
+
+def completed_chunks(checkpoint: str) -> int:
+    """
+    Chunks already evaluated according to the checkpoint, which a resumed
+    run skips: callers may seek past them before passing the others. Chunks
+    evaluated in several passes are all read again, so none is skipped.
+    """
+    if not os.path.exists(checkpoint):
+        return 0
+    state = Checkpoint.load(checkpoint)
+    return state.completed_chunks if state.passes == 1 else 0
+
+
+def load_chunk(chunk: Chunk) -> pd.DataFrame:
+    if isinstance(chunk, pd.DataFrame):
+        return chunk
+    if isinstance(chunk, (str, os.PathLike)):
+        from pandantic import cli
+
+        return cli.read_frame(os.fspath(chunk))
+    return chunk()
+
+
+def _remaining_chunks(chunks: Iterable[Chunk], completed: int) -> Iterator[Chunk]:
+    if isinstance(chunks, collections.abc.Sequence):
+        return (chunks[position] for position in range(completed, len(chunks)))
+    return itertools.islice(chunks, completed, None)
+
+
+def evaluate_chunks(
+    schema,
+    chunks: Iterable[Chunk],
+    name: str,
+    warn: bool = True,
+    checkpoint: Optional[str] = None,
+    on_chunk: Optional[Callable[[int, pd.DataFrame], None]] = None,
+) -> NamedTuple:
+    """
+    Evaluates every chunk, merging their summaries into a single evaluation.
+    Chunks are DataFrames, callables loading one, or paths of files read as
+    by the command line. on_chunk receives the position and the amended
+    version of each chunk.
+
+    Schemas whose mergeable validators decide the following ones are
+    evaluated in several passes over the chunks (see summaries.phases):
+    chunks given as an iterator are then kept in a list, so pass loaders or
+    paths rather than DataFrames. Passes leaving nothing to evaluate are
+    skipped, unless on_chunk must receive the amended chunks.
+
+    With a checkpoint path, the state is saved after every chunk; a run
+    given the same chunks skips those already completed and removes the
+    checkpoint once every chunk has been evaluated. Completed chunks of a
+    sequence are never loaded; those of an iterator are consumed, so pass
+    loaders or paths to skip them without reading them.
+    """
+    started = time.perf_counter()
+    state = None
+    if checkpoint is not None and os.path.exists(checkpoint):
+        state = Checkpoint.load(checkpoint)
+        if not state.matches(schema):
+            raise ValueError(f"Checkpoint {checkpoint} was written by another schema.")
+    if state is None:
+        state = Checkpoint.for_schema(schema)
+
+    frame_passes = summaries.frame_passes(schema)
+    if len(frame_passes) > 1 and not isinstance(chunks, collections.abc.Sequence):
+        chunks = list(chunks)
+
+    for pass_position in range(state.completed_passes, len(frame_passes)):
+        frame_pass = frame_passes[pass_position]
+        last_pass = pass_position == len(frame_passes) - 1
+
+        skipped = None
+        if len(state.decisions) == pass_position:
+            state.decisions.append(
+                summaries.decide_pass(schema, state.frame_summary, frame_pass)
+            )
+            if pass_position and not (last_pass and on_chunk is not None):
+                skipped = summaries.skipped_pass(
+                    schema, frame_pass, state.decisions[pass_position]
+                )
+
+        if skipped is not None:
+            state.pass_summary = skipped
+            remaining_chunks = []
+        else:
+            remaining_chunks = _remaining_chunks(chunks, state.completed_chunks)
+
+        for position, chunk in enumerate(
+            remaining_chunks, start=state.completed_chunks
+        ):
+            chunk = load_chunk(chunk)
+            column_names = schema.transform_column_names(chunk)
+            if state.missing_columns is None:
+                state.missing_columns, state.remaining_columns = schema.check_columns(
+                    pd.DataFrame(columns=column_names)
+                )
+
+            amended_chunk, chunk_summary = partitioned.evaluate_partition(
+                schema,
+                chunk,
+                state.missing_columns,
+                column_names,
+                frame_passes[: pass_position + 1],
+                state.decisions,
+            )
+
+            state.pass_summary = (
+                chunk_summary
+                if state.pass_summary is None
+                else summaries.merge_frame_summaries(
+                    schema, state.pass_summary, chunk_summary
+                )
+            )
+            state.completed_chunks = position + 1
+            if pass_position == 0:
+                state.rows += len(chunk)
+
+            if on_chunk is not None and last_pass:
+                on_chunk(position, amended_chunk)
+            if checkpoint is not None:
+                state.save(checkpoint)
+
+        if state.pass_summary is None:
+            raise ValueError("At least one chunk must be provided.")
+
+        state.frame_summary = summaries.update_frame_summary(
+            schema, state.frame_summary, state.pass_summary
+        )
+        state.pass_summary = None
+        state.completed_chunks = 0
+        state.completed_passes = pass_position + 1
+        if checkpoint is not None and not last_pass:
+            state.save(checkpoint)
+
+    if checkpoint is not None and os.path.exists(checkpoint):
+        os.remove(checkpoint)
+
+    return schema.build_evaluation(
+        name,
+        summaries.evaluation_data(schema, state.frame_summary),
+        state.missing_columns,
+        state.remaining_columns,
+        warn,
+        rows=state.rows,
+        started=started,
+    )
@@ -0,0 +1,359 @@
+"""
+Command-line entry point: pandantic validate module:Schema FILES --jobs N
+
+Files are evaluated in parallel with the schema's evaluate. A manifest
+records the size, modification time and content hash of every file with
+the schema version, so that files unchanged since a successful evaluation
+are skipped by later runs.
+"""
+import argparse
+import concurrent.futures
+import functools
+import glob
+import hashlib
+import importlib
+import json
+import os
+import sys
+import tempfile
+import time
+import types
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from pandantic import evaluations, references, schemas
+
+DEFAULT_MANIFEST = ".pandantic-manifest.json"
+SUCCESSFUL_STATUSES = ("valid", "warning")
+
+READERS = {
+    ".parquet": pd.read_parquet,
+    ".pq": pd.read_parquet,
+    ".csv": pd.read_csv,
+    ".feather": pd.read_feather,
+    ".pkl": pd.read_pickle,
+    ".pickle": pd.read_pickle,
+}
+
+
+@functools.lru_cache(maxsize=None)
+def load_schema(schema_path: str) -> schemas.DataFrameModel:
+    """
+    Imports module:Schema and instantiates it, once per process.
+    """
+    module_name, _, attribute = schema_path.partition(":")
+    if not module_name or not attribute:
+        raise ValueError(f"Schema must be given as module:Schema, got {schema_path}.")
+
+    schema = importlib.import_module(module_name)
+    for name in attribute.split("."):
+        schema = getattr(schema, name)
+
+    if isinstance(schema, type) and issubclass(schema, schemas.DataFrameModel):
+        schema = schema()
+    if not isinstance(schema, schemas.DataFrameModel):
+        raise ValueError(f"{schema_path} is not a DataFrameModel.")
+    return schema
+
+
+def _configuration(value: Any) -> Any:
+    """
+    JSON description of a declaration value for schema_version. Objects are
+    described by their type and public attributes, functions by their code,
+    constants and closure, arrays by a digest of their values.
+    """
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, (list, tuple)):
+        return [_configuration(item) for item in value]
+    if isinstance(value, (set, frozenset)):
+        return sorted((_configuration(item) for item in value), key=repr)
+    if isinstance(value, dict):
+        return sorted(
+            (
+                [_configuration(key), _configuration(item)]
+                for key, item in value.items()
+            ),
+            key=repr,
+        )
+    if isinstance(value, (np.ndarray, pd.Index, pd.Series)):
+        array = np.asarray(value)
+        data = (
+            repr(array.tolist()).encode("utf-8")
+            if array.dtype.kind == "O"
+            else array.tobytes()
+        )
+        return [str(array.dtype), list(array.shape), hashlib.sha256(data).hexdigest()]
+    if isinstance(value, references.ReferenceIndex):
+        # Saved references are data refreshed between evaluations.
+        return ["ReferenceIndex", value.path or _configuration(value.values)]
+    if isinstance(value, functools.partial):
+        return [
+            "partial",
+            _configuration(value.func),
+            _configuration(value.args),
+            _configuration(value.keywords),
+        ]
+    if isinstance(value, types.CodeType):
+        return [value.co_code.hex(), _configuration(value.co_consts)]
+    if isinstance(value, type):
+        return f"{value.__module__}.{value.__qualname__}"
+    if isinstance(value, types.FunctionType):
+        return [
+            f"{value.__module__}.{value.__qualname__}",
+            _configuration(value.__code__),
+            _configuration(value.__defaults__),
+            [_configuration(cell.cell_contents) for cell in value.__closure__ or ()],
+        ]
+
+    name = f"{type(value).__module__}.{type(value).__qualname__}"
+    if hasattr(value, "__dict__"):
+        return [
+            name,
+            _configuration(
+                {
+                    attribute: item
+                    for attribute, item in vars(value).items()
+                    if not attribute.startswith("_")
+                }
+            ),
+        ]
+    description = repr(value)
+    # Default reprs hold addresses, which differ between processes.
+    return [name, description if " at 0x" not in description else None]
+
+
+def schema_version(schema: schemas.DataFrameModel) -> str:
+    """
+    Digest of the full schema declaration: its columns and frame validators
+    with every attribute of their validators and amendments, such as bounds,
+    formats and string storage.
+    """
+    declaration = [
+        f"{type(schema).__module__}.{type(schema).__qualname__}",
+        schema.rejection_reason_column,
+        _configuration(type(schema).transform_column_names),
+        _configuration(schema.get_columns()),
+        _configuration(schema.get_frame_validators()),
+    ]
+    return hashlib.sha256(
+        json.dumps(declaration, sort_keys=True).encode("utf-8")
+    ).hexdigest()[:16]
+
+
+def file_digest(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as data_file:
+        for block in iter(functools.partial(data_file.read, 1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def read_frame(path: str) -> pd.DataFrame:
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in READERS:
+        raise ValueError(f"Unsupported file type {extension}.")
+    return READERS[extension](path)
+
+
+def validate_file(schema_path: str, path: str) -> Dict[str, Any]:
+    schema = load_schema(schema_path)
+    started = time.perf_counter()
+    result: Dict[str, Any] = {"path": path}
+
+    try:
+        result["sha256"] = file_digest(path)
+        dataframe = read_frame(path)
+        result["rows"] = len(dataframe)
+        _, evaluation = schema.evaluate(dataframe, type(schema).__name__, warn=False)
+        result["status"] = evaluations.evaluation_status(evaluation)
+    except schemas.SchemaEvaluationException as error:
+        evaluation = error.evaluation
+        result["status"] = "invalid"
+    except Exception as error:  # pylint: disable=broad-except
+        evaluation = None
+        result["status"] = "error"
+        result["error"] = repr(error)
+
+    if evaluation is not None:
+        result["invalid_columns"] = [
+            column_name
+            for column_name, column_evaluation in zip(evaluation._fields, evaluation)
+            if column_evaluation.valid is False
+        ]
+    result["elapsed"] = time.perf_counter() - started
+    return result
+
+
+def expand_paths(patterns: Sequence[str]) -> List[str]:
+    paths = []
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern, recursive=True)) or [pattern]
+        paths.extend(match for match in matches if match not in paths)
+    return paths
+
+
+def load_manifest(path: str) -> Dict[str, Dict[str, Any]]:
+    if not os.path.exists(path):
+        return dict()
+    with open(path, "r", encoding="utf-8") as manifest_file:
+        return json.load(manifest_file)
+
+
+def save_manifest(path: str, manifest: Dict[str, Dict[str, Any]]) -> None:
+    directory = os.path.dirname(os.path.abspath(path))
+    descriptor, temporary_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    with os.fdopen(descriptor, "w", encoding="utf-8") as temporary_file:
+        json.dump(manifest, temporary_file, indent=2, sort_keys=True)
+    os.replace(temporary_path, path)
+
+
+def file_entry(path: str, digest: Optional[str] = None) -> Dict[str, Any]:
+    stat = os.stat(path)
+    return {
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "sha256": digest if digest is not None else file_digest(path),
+    }
+
+
+def is_unchanged(path: str, entry: Optional[Dict[str, Any]], version: str) -> bool:
+    """
+    Whether the file was successfully evaluated by the same schema version
+    and has not changed since. The content is only hashed when the size is
+    the same but the modification time is not.
+    """
+    if (
+        entry is None
+        or entry.get("schema_version") != version
+        or entry.get("status") not in SUCCESSFUL_STATUSES
+    ):
+        return False
+
+    stat = os.stat(path)
+    if stat.st_size != entry["size"]:
+        return False
+    if stat.st_mtime_ns == entry["mtime_ns"]:
+        return True
+    if file_digest(path) == entry["sha256"]:
+        entry["mtime_ns"] = stat.st_mtime_ns
+        return True
+    return False
+
+
+def validate(
+    schema_path: str,
+    patterns: Sequence[str],
+    jobs: int = 1,
+    manifest_path: Optional[str] = DEFAULT_MANIFEST,
+    force: bool = False,
+) -> Dict[str, Any]:
+    schema = load_schema(schema_path)
+    version = schema_version(schema)
+    manifest = load_manifest(manifest_path) if manifest_path else dict()
+
+    results, pending = [], []
+    for path in expand_paths(patterns):
+        key = os.path.abspath(path)
+        if (
+            os.path.isfile(path)
+            and not force
+            and is_unchanged(path, manifest.get(key), version)
+        ):
+            results.append({"path": path, "status": "skipped"})
+        else:
+            pending.append(path)
+
+    if jobs > 1 and len(pending) > 1:
+        with concurrent.futures.ProcessPoolExecutor(jobs) as executor:
+            evaluated = list(
+                executor.map(functools.partial(validate_file, schema_path), pending)
+            )
+    else:
+        evaluated = [validate_file(schema_path, path) for path in pending]
+
+    for result in evaluated:
+        results.append(result)
+        path = result["path"]
+        if os.path.isfile(path):
+            manifest[os.path.abspath(path)] = {
+                **file_entry(path, result.get("sha256")),
+                "schema_version": version,
+                "status": result["status"],
+            }
+
+    if manifest_path:
+        save_manifest(manifest_path, manifest)
+
+    totals: Dict[str, int] = dict()
+    for result in results:
+        totals[result["status"]] = totals.get(result["status"], 0) + 1
+
+    return {
+        "schema": schema_path,
+        "schema_version": version,
+        "totals": totals,
+        "files": results,
+    }
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="pandantic")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    validate_parser = subparsers.add_parser(
+        "validate", help="Evaluate files with a DataFrameModel."
+    )
+    validate_parser.add_argument("schema", help="Schema as module:Schema.")
+    validate_parser.add_argument(
+        "files", nargs="+", help="Files or glob patterns (** is recursive)."
+    )
+    validate_parser.add_argument(
+        "--jobs", "-j", type=int, default=1, help="Number of worker processes."
+    )
+    validate_parser.add_argument(
+        "--summary", help="Path of the JSON summary. Printed when not given."
+    )
+    validate_parser.add_argument(
+        "--manifest",
+        default=DEFAULT_MANIFEST,
+        help=f"Path of the manifest of evaluated files ({DEFAULT_MANIFEST}).",
+    )
+    validate_parser.add_argument(
+        "--no-manifest", action="store_true", help="Neither read nor write a manifest."
+    )
+    validate_parser.add_argument(
+        "--force", action="store_true", help="Evaluate unchanged files too."
+    )
+
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    arguments = build_parser().parse_args(argv)
+
+    if os.getcwd() not in sys.path:
+        # Lets module:Schema refer to modules of the working directory.
+        sys.path.insert(0, os.getcwd())
+
+    summary = validate(
+        arguments.schema,
+        arguments.files,
+        jobs=arguments.jobs,
+        manifest_path=None if arguments.no_manifest else arguments.manifest,
+        force=arguments.force,
+    )
+
+    output = json.dumps(summary, indent=2)
+    if arguments.summary:
+        with open(arguments.summary, "w", encoding="utf-8") as summary_file:
+            summary_file.write(output + "\n")
+    else:
+        print(output)
+
+    failed = summary["totals"].get("invalid", 0) + summary["totals"].get("error", 0)
+    return 1 if failed else 0
@@ -3,14 +3,22 @@ Declares columns for main pandas datatypes:
 Object, Numbers (float and int), Booleans, Datetime and Categories.
 """
 import abc
+import itertools
 from typing import List, Optional, Tuple, Union
 
 import pandas as pd
 
-from pandantic import datatype_validators, validations, validators, evaluations
+from pandantic import (
+    datatype_validators,
+    evaluations,
+    memory,
+    summaries,
+    validations,
+    validators,
+)
 
 
-class BaseColumn(abc.ABC):
+class BaseColumn(validators.Immutable, abc.ABC):
 
     column_validators: validators.ValidatorSet
 
@@ -49,6 +57,10 @@ class BaseColumn(abc.ABC):
     def check_dtype(self) -> datatype_validators.DatatypeValidator:
         raise NotImplementedError()
 
+    def freeze(self) -> "BaseColumn":
+        self.column_validators.freeze()
+        return super().freeze()
+
     def infer_dtype(self) -> datatype_validators.DatatypeValidator:
         dtype_validators = [
             validator
@@ -67,6 +79,95 @@ class BaseColumn(abc.ABC):
         column_eval = evaluations.ColumnEvaluation(validation)
         return column, column_eval
 
+    def evaluate_blocks(
+        self, column: pd.Series, rows_per_block: int
+    ) -> Tuple[pd.Series, evaluations.ColumnEvaluation]:
+        """
+        Evaluates the column rows_per_block rows at a time and merges the
+        summaries of the blocks into the evaluation of the whole column.
+        Validators that cannot be evaluated in blocks, such as dtype or unique
+        checks, run on the whole column between the blocked ones.
+        """
+        validator_list = list(self.column_validators)
+        validation_summaries = []
+        # Decided on the input column, before any amendment.
+        segments = [
+            (blockable, list(segment))
+            for blockable, segment in itertools.groupby(
+                validator_list, lambda validator: memory.blockable(validator, column)
+            )
+        ]
+
+        for blockable, segment in segments:
+            if summaries.ColumnSummary(validation_summaries).suspends(
+                validator_list[: len(validation_summaries)]
+            ):
+                validation_summaries.extend(
+                    summaries.ValidationSummary(summaries.SUSPENDED) for _ in segment
+                )
+                continue
+
+            if blockable:
+                column, segment_summary = _summarize_blocks(
+                    segment, column, rows_per_block
+                )
+            else:
+                amended_column, segment_summary = summaries.summarize_column(
+                    validators.ValidatorSet(segment), column, states=False
+                )
+                column = as_series(amended_column, column)
+            validation_summaries.extend(segment_summary.validation_summaries)
+
+        validation_set = summaries.ColumnSummary(
+            validation_summaries
+        ).to_validation_set(validator_list)
+        return column, evaluations.ColumnEvaluation(validation_set)
+
+
+def as_series(values, column: pd.Series) -> pd.Series:
+    # Amendments may return arrays, such as the pd.Categorical of categories.
+    if isinstance(values, pd.Series):
+        return values
+    return pd.Series(values, index=column.index, name=column.name)
+
+
+def _summarize_blocks(
+    validator_list: List[validators.Validator], column: pd.Series, rows_per_block: int
+) -> Tuple[pd.Series, summaries.ColumnSummary]:
+    """
+    Summary of the column merged from the summaries of its row blocks,
+    evaluated phase by phase (see summaries). Only the amended blocks are
+    kept until the column is reassembled.
+    """
+    starts = range(0, max(len(column), 1), rows_per_block)
+    amended_blocks = dict()
+
+    def evaluate_phase(phase, decision):
+        for start in starts:
+            if start in amended_blocks:
+                block = amended_blocks[start]
+            else:
+                block = column.iloc[start : start + rows_per_block]
+            amended_block, block_summary = summaries.summarize_phase(
+                validator_list, block, phase, decision
+            )
+            if block_summary.amended:
+                amended_blocks[start] = as_series(amended_block, block)
+            del amended_block
+            yield block_summary
+
+    column_summary = summaries.summarize_parts(validator_list, evaluate_phase)
+
+    if amended_blocks:
+        column = pd.concat(
+            [
+                amended_blocks.get(start, column.iloc[start : start + rows_per_block])
+                for start in range(0, len(column), rows_per_block)
+            ]
+        )
+
+    return column, column_summary
+
 
 class Column(BaseColumn):
     def check_dtype(self) -> datatype_validators.ObjectColumnValidator:
@@ -93,8 +194,16 @@ class FloatColumn(Column):
 
 
 class StringColumn(Column):
+    def __init__(
+        self,
+        column_validations: Optional[Union[List, Tuple]] = None,
+        storage: Optional[str] = None,
+    ) -> None:
+        self.storage = storage
+        super().__init__(column_validations)
+
     def check_dtype(self) -> datatype_validators.StringColumnValidator:
-        return datatype_validators.StringColumnValidator()
+        return datatype_validators.StringColumnValidator(storage=self.storage)
 
 
 class BoolColumn(Column):
@@ -122,4 +231,6 @@ class DatetimeColumn(Column):
         _datetime_format = (
             datetime_format if datetime_format is not None else self.datetime_format
         )
-        return datatype_validators.DatetimeColumnValidator(_datetime_format)
+        return datatype_validators.DatetimeColumnValidator(
+            datetime_format=_datetime_format
+        )
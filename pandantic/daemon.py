@@ -0,0 +1,273 @@
+"""
+Local validation daemon keeping schemas instantiated between requests.
+Clients send DataFrames as Arrow IPC streams over a Unix domain socket and
+receive the amended DataFrame and the evaluation report the same way.
+
+Every message is a sequence of frames, each prefixed by its length as an
+unsigned 64-bit big-endian integer. A request is a JSON header frame, plus
+an Arrow IPC frame for the "evaluate" command. A response is a JSON header
+frame, plus the amended frame and the report frame (see reports.to_arrow)
+when the header status is not "error".
+"""
+import json
+import socket
+import socketserver
+import struct
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+import pandas as pd
+
+from pandantic import evaluations, reports, schemas
+
+try:
+    import pyarrow as pa
+except ImportError:  # pragma: no cover
+    pa = None
+
+_LENGTH = struct.Struct(">Q")
+
+
+def _write_frame(wfile, payload) -> None:
+    payload = memoryview(payload)
+    wfile.write(_LENGTH.pack(payload.nbytes))
+    wfile.write(payload)
+
+
+def _read_exactly(rfile, size: int) -> bytes:
+    data = rfile.read(size)
+    if len(data) != size:
+        raise ConnectionError("Connection closed in the middle of a frame.")
+    return data
+
+
+def _read_frame(rfile) -> Optional[bytes]:
+    prefix = rfile.read(_LENGTH.size)
+    if not prefix:
+        return None
+    if len(prefix) != _LENGTH.size:
+        raise ConnectionError("Connection closed in the middle of a frame.")
+    return _read_exactly(rfile, _LENGTH.unpack(prefix)[0])
+
+
+def _write_json(wfile, header: Dict[str, Any]) -> None:
+    _write_frame(wfile, json.dumps(header).encode("utf-8"))
+
+
+def _read_json(rfile) -> Optional[Dict[str, Any]]:
+    frame = _read_frame(rfile)
+    return json.loads(frame) if frame is not None else None
+
+
+def _table_frame(table: "pa.Table") -> "pa.Buffer":
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue()
+
+
+def _read_table(frame: bytes) -> "pa.Table":
+    return pa.ipc.open_stream(pa.py_buffer(frame)).read_all()
+
+
+class SchemaLatency:
+    """
+    Request count and durations of the evaluations of a registered schema.
+    """
+
+    __slots__ = ("requests", "total_seconds", "max_seconds")
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.requests += 1
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+
+    def as_dict(self) -> Dict[str, float]:
+        return {
+            "requests": self.requests,
+            "total_seconds": self.total_seconds,
+            "mean_seconds": self.total_seconds / self.requests
+            if self.requests
+            else 0.0,
+            "max_seconds": self.max_seconds,
+        }
+
+
+class ValidationRequestHandler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        while True:
+            try:
+                header = _read_json(self.rfile)
+            except (ConnectionError, ValueError):
+                return
+            if header is None:
+                return
+
+            command = header.get("command")
+            if command == "evaluate":
+                self.handle_evaluate(header)
+            elif command == "stats":
+                _write_json(self.wfile, {"status": "ok", **self.server.stats()})
+            else:
+                _write_json(
+                    self.wfile,
+                    {"status": "error", "message": f"Unknown command {command}."},
+                )
+            self.wfile.flush()
+
+    def handle_evaluate(self, header: Dict[str, Any]) -> None:
+        frame = _read_frame(self.rfile)
+        schema_name = header.get("schema")
+        schema = self.server.schemas.get(schema_name)
+        if schema is None or frame is None:
+            _write_json(
+                self.wfile,
+                {"status": "error", "message": f"Unknown schema {schema_name}."},
+            )
+            return
+
+        started = time.perf_counter()
+        try:
+            dataframe = _read_table(frame).to_pandas()
+            status, amended, evaluation = self.server.evaluate(
+                schema, dataframe, header.get("name") or schema_name
+            )
+            amended_frame = _table_frame(pa.Table.from_pandas(amended))
+            report_frame = _table_frame(reports.to_arrow(evaluation))
+        except Exception as error:  # pylint: disable=broad-except
+            _write_json(self.wfile, {"status": "error", "message": repr(error)})
+            return
+        finally:
+            self.server.observe(schema_name, time.perf_counter() - started)
+
+        _write_json(self.wfile, {"status": status})
+        _write_frame(self.wfile, amended_frame)
+        _write_frame(self.wfile, report_frame)
+
+
+class ValidationServer(socketserver.ThreadingUnixStreamServer):
+    """
+    Threaded Unix socket server evaluating DataFrames with the schemas
+    registered by name. Each client connection is served by its own thread.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self, path: str, registered_schemas: Optional[Dict[str, Any]] = None
+    ) -> None:
+        if pa is None:
+            raise ImportError("pyarrow is required to run the validation daemon.")
+
+        super().__init__(path, ValidationRequestHandler)
+        self.schemas: Dict[str, schemas.DataFrameModel] = dict()
+        self.latencies: Dict[str, SchemaLatency] = dict()
+        self._lock = threading.Lock()
+
+        for name, schema in (registered_schemas or {}).items():
+            self.register(name, schema)
+
+    def register(self, name: str, schema: schemas.DataFrameModel) -> None:
+        if not isinstance(schema, schemas.DataFrameModel):
+            raise ValueError(f"DataFrameModel expected, got {type(schema)} instead.")
+        with self._lock:
+            self.schemas[name] = schema
+            self.latencies.setdefault(name, SchemaLatency())
+
+    def evaluate(
+        self, schema: schemas.DataFrameModel, dataframe: pd.DataFrame, name: str
+    ) -> Tuple[str, pd.DataFrame, Any]:
+        try:
+            amended, evaluation = schema.evaluate(dataframe, name, warn=False)
+        except schemas.SchemaEvaluationException as error:
+            # Invalid frames are returned unamended, with their evaluation.
+            return "invalid", dataframe, error.evaluation
+        return evaluations.evaluation_status(evaluation), amended, evaluation
+
+    def observe(self, schema_name: str, seconds: float) -> None:
+        with self._lock:
+            latency = self.latencies.get(schema_name)
+            if latency is not None:
+                latency.observe(seconds)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "schemas": {
+                    name: latency.as_dict() for name, latency in self.latencies.items()
+                }
+            }
+
+
+def start_server(
+    path: str, registered_schemas: Optional[Dict[str, Any]] = None
+) -> ValidationServer:
+    """
+    Serves the schemas on the Unix socket path from a daemon thread.
+    Returns the server; call shutdown() and server_close() to stop it.
+    """
+    server = ValidationServer(path, registered_schemas)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
+
+
+class Client:
+    """
+    Connection to a validation daemon, reusable for several requests.
+    """
+
+    def __init__(self, path: str) -> None:
+        if pa is None:
+            raise ImportError("pyarrow is required to use the validation daemon.")
+
+        self.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.socket.connect(path)
+        self.rfile = self.socket.makefile("rb")
+        self.wfile = self.socket.makefile("wb")
+
+    def __enter__(self) -> "Client":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.rfile.close()
+        self.wfile.close()
+        self.socket.close()
+
+    def evaluate(
+        self, schema_name: str, dataframe: pd.DataFrame, name: Optional[str] = None
+    ) -> Tuple[str, Optional[pd.DataFrame], Optional["pa.Table"]]:
+        """
+        Returns the status (valid, warning, invalid), the amended DataFrame
+        and the evaluation report. Daemon errors raise RuntimeError.
+        """
+        _write_json(
+            self.wfile, {"command": "evaluate", "schema": schema_name, "name": name}
+        )
+        _write_frame(self.wfile, _table_frame(pa.Table.from_pandas(dataframe)))
+        self.wfile.flush()
+
+        header = _read_json(self.rfile)
+        if header is None:
+            raise ConnectionError("The daemon closed the connection.")
+        if header["status"] == "error":
+            raise RuntimeError(header.get("message"))
+
+        amended = _read_table(_read_frame(self.rfile)).to_pandas()
+        report = _read_table(_read_frame(self.rfile))
+        return header["status"], amended, report
+
+    def stats(self) -> Dict[str, Any]:
+        _write_json(self.wfile, {"command": "stats"})
+        self.wfile.flush()
+        header = _read_json(self.rfile)
+        return header["schemas"]
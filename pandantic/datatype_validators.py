@@ -2,6 +2,8 @@
 Specific validators for datatype validation.
 """
 import abc
+import functools
+import operator
 from typing import Optional, Tuple
 
 import numpy as np
@@ -11,7 +13,15 @@ from pandantic import validators
 
 
 class DatatypeValidator(validators.Validator, abc.ABC):
-    pass
+    # Dtypes and their conversions (downcasts, parsing errors) depend on every
+    # value of the column.
+    row_local = False
+
+    def accepts(self, column) -> bool:
+        """
+        Whether the column dtype is valid, in which case no amendment runs.
+        """
+        return bool(self._evaluate(column[:0])[1])
 
 
 class ObjectColumnValidator(DatatypeValidator):
@@ -22,7 +32,7 @@ class ObjectColumnValidator(DatatypeValidator):
 
         super().__init__(mandatory, description)
 
-        self.amendment = lambda column: column.astype("object")
+        self.amendment = operator.methodcaller("astype", "object")
 
     def _evaluate(self, column: pd.Series) -> Tuple[int, bool]:
         valid_dtype = str(column.dtype) == "object"
@@ -38,7 +48,7 @@ class NumericColumnValidator(DatatypeValidator):
 
         super().__init__(mandatory, description)
 
-        self.amendment = lambda column: pd.to_numeric(column, errors="ignore")
+        self.amendment = functools.partial(pd.to_numeric, errors="ignore")
 
     def _evaluate(self, column: pd.Series) -> Tuple[int, bool]:
 
@@ -55,8 +65,8 @@ class IntegerColumnValidator(NumericColumnValidator):
 
         super().__init__(mandatory, description)
 
-        self.amendment = lambda column: pd.to_numeric(
-            column, downcast="integer", errors="ignore"
+        self.amendment = functools.partial(
+            pd.to_numeric, downcast="integer", errors="ignore"
         )
 
     def _evaluate(self, column: pd.Series) -> Tuple[int, bool]:
@@ -73,8 +83,8 @@ class FloatColumnValidator(DatatypeValidator):
 
         super().__init__(mandatory, description)
 
-        self.amendment = lambda column: pd.to_numeric(
-            column, downcast="float", errors="ignore"
+        self.amendment = functools.partial(
+            pd.to_numeric, downcast="float", errors="ignore"
         )
 
     def _evaluate(self, column: pd.Series) -> Tuple[int, bool]:
@@ -89,17 +99,29 @@ class FloatColumnValidator(DatatypeValidator):
 
 
 class StringColumnValidator(DatatypeValidator):
-    def __init__(self, mandatory: bool = True, description: str = None) -> None:
+    def __init__(
+        self,
+        mandatory: bool = True,
+        description: str = None,
+        storage: Optional[str] = None,
+    ) -> None:
 
         if description is None:
-            description = "Column is string dtype."
+            description = (
+                "Column is string dtype."
+                if storage is None
+                else f"Column is string[{storage}] dtype."
+            )
 
         super().__init__(mandatory, description)
 
-        self.amendment = lambda column: column.astype(pd.StringDtype())
+        self.storage = storage
+        self.amendment = operator.methodcaller("astype", pd.StringDtype(storage))
 
     def _evaluate(self, column: pd.Series) -> Tuple[int, bool]:
-        valid_dtype = str(column.dtype) == "string"
+        valid_dtype = str(column.dtype) == "string" and (
+            self.storage is None or column.dtype.storage == self.storage
+        )
 
         return 0 if valid_dtype else len(column), valid_dtype
 
@@ -112,7 +134,7 @@ class BoolColumnValidator(DatatypeValidator):
 
         super().__init__(mandatory, description)
 
-        self.amendment = lambda column: column.astype(bool)
+        self.amendment = operator.methodcaller("astype", bool)
 
     def _evaluate(self, column: pd.Series) -> Tuple[int, bool]:
         valid_dtype = str(column.dtype) == "bool"
@@ -128,8 +150,7 @@ class CategoryColumnValidator(DatatypeValidator):
 
         super().__init__(mandatory, description)
 
-        # pylint: disable=unnecessary-lambda
-        self.amendment = lambda column: pd.Categorical(column)
+        self.amendment = pd.Categorical
 
     def validate_pandas_series(self, column) -> None:
         if not isinstance(column, pd.Series) and not isinstance(
@@ -144,9 +165,6 @@ class CategoryColumnValidator(DatatypeValidator):
 
 
 class DatetimeColumnValidator(DatatypeValidator):
-
-    __datetime_format = None
-
     def __init__(
         self,
         mandatory: bool = True,
@@ -158,10 +176,10 @@ class DatetimeColumnValidator(DatatypeValidator):
             description = "Column is a datetime dtype."
 
         super().__init__(mandatory, description)
-        self.__datetime_format = datetime_format
+        self.datetime_format = datetime_format
 
-        self.amendment = lambda column: pd.to_datetime(
-            column, errors="ignore", format=self.__datetime_format
+        self.amendment = functools.partial(
+            pd.to_datetime, errors="ignore", format=self.datetime_format
         )
 
     def _evaluate(self, column: pd.Series) -> Tuple[int, bool]:
@@ -1,10 +1,13 @@
-from typing import Optional
+from collections.abc import Mapping
+from typing import Dict, Iterator, Optional, Tuple
 
 from pandantic import validations
 
 
 class ColumnEvaluation:
 
+    __slots__ = ("validation_set", "valid", "amended", "warnings")
+
     validation_set: Optional[validations.ValidationSet]
     valid: Optional[bool]
     amended: Optional[bool]
@@ -38,8 +41,75 @@ class ColumnEvaluation:
 
 
 class MissingColumn(ColumnEvaluation):
-    pass
+    __slots__ = ()
 
 
 class UnhandledColumn(ColumnEvaluation):
-    pass
+    __slots__ = ()
+
+
+class FrameEvaluation(ColumnEvaluation):
+    __slots__ = ()
+
+
+class SchemaEvaluation(Mapping):
+    """
+    Evaluation of a whole schema, keyed by column and frame validator names.
+    Unlike the namedtuple evaluations, no type is created per call; entries
+    are also reachable as attributes.
+    """
+
+    __slots__ = ("name", "_evaluations")
+
+    name: str
+
+    def __init__(self, name: str, evaluations: Dict[str, ColumnEvaluation]) -> None:
+        self.name = name
+        self._evaluations = evaluations
+
+    def __getitem__(self, key: str) -> ColumnEvaluation:
+        return self._evaluations[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._evaluations)
+
+    def __len__(self) -> int:
+        return len(self._evaluations)
+
+    def __getattr__(self, key: str) -> ColumnEvaluation:
+        if key.startswith("__") or key == "_evaluations":
+            raise AttributeError(key)
+        try:
+            return self._evaluations[key]
+        except KeyError:
+            raise AttributeError(key) from None
+
+    def __getstate__(self) -> Tuple[str, Dict[str, ColumnEvaluation]]:
+        return self.name, self._evaluations
+
+    def __setstate__(self, state: Tuple[str, Dict[str, ColumnEvaluation]]) -> None:
+        self.name, self._evaluations = state
+
+    @property
+    def _fields(self) -> Tuple[str, ...]:
+        return tuple(self._evaluations)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.name!r}, {len(self)} entries)"
+
+
+def evaluation_status(evaluation) -> str:
+    """
+    "warning" when the evaluation would raise SchemaEvaluationWarning,
+    "valid" otherwise. Invalid evaluations raise before reaching this point.
+    """
+    column_evaluations = (
+        evaluation.values() if isinstance(evaluation, SchemaEvaluation) else evaluation
+    )
+    for column_evaluation in column_evaluations:
+        if (
+            isinstance(column_evaluation, (MissingColumn, UnhandledColumn))
+            or column_evaluation.warnings
+        ):
+            return "warning"
+    return "valid"
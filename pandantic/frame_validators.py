@@ -0,0 +1,393 @@
+"""
+Validators evaluated over a whole DataFrame, for rules involving several columns.
+"""
+import abc
+from numbers import Number
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from pandantic import sketches, validators
+
+
+class FrameValidator(validators.Validator, abc.ABC):
+    def validate_pandas_series(self, column) -> None:
+        if not isinstance(column, pd.DataFrame):
+            raise TypeError("A pandas.DataFrame object must be provided")
+
+    def _working_copy(self, column: pd.DataFrame) -> pd.DataFrame:
+        # Evaluations only read the frame; only amendments need their own copy.
+        if self.amendment is None:
+            return column
+        return column.copy()
+
+
+class ExpressionValidator(FrameValidator):
+
+    row_wise = True
+
+    def __init__(
+        self,
+        expression: str,
+        mandatory: bool = True,
+        description: str = None,
+        engine: Optional[str] = None,
+    ) -> None:
+
+        if not expression:
+            raise ValueError("expression must be provided.")
+
+        if description is None:
+            description = f"Rows satisfy {expression}."
+
+        super().__init__(mandatory, description)
+
+        self.expression = expression
+        self.engine = engine
+
+    def _evaluate(self, column: pd.DataFrame) -> Tuple[int, bool]:
+        failing_rows = int(self.failure_mask(column).sum())
+
+        return failing_rows, not failing_rows
+
+    def failure_mask(self, column: pd.DataFrame) -> np.ndarray:
+        result = column.eval(self.expression, engine=self.engine)
+
+        if not isinstance(result, pd.Series):
+            raise ValueError(f"{self.expression} does not evaluate row-wise.")
+
+        # Missing results of nullable dtypes are left to the column validators.
+        return ~np.asarray(result.fillna(True).astype(bool))
+
+
+class GroupValidator(FrameValidator, abc.ABC):
+    """
+    Validator of a column within the groups of the by columns. Its failing
+    rows are computed for every group at once, and the validation reports
+    the issues of the failing groups as additional info, and the issues of
+    every group as its details.
+    """
+
+    row_wise = True
+    row_local = False
+
+    max_reported_groups = 5
+
+    def __init__(
+        self,
+        by: Union[str, List[str]],
+        column: str,
+        mandatory: bool = True,
+        description: str = None,
+    ) -> None:
+
+        if not by or not column:
+            raise ValueError("by and column must be provided.")
+
+        super().__init__(mandatory, description)
+
+        self.by = [by] if isinstance(by, str) else list(by)
+        self.column = column
+
+    def _group_keys(self, column: pd.DataFrame) -> List[np.ndarray]:
+        return [column[key].to_numpy() for key in self.by]
+
+    def group_issues(
+        self, column: pd.DataFrame, failure_mask: Optional[np.ndarray] = None
+    ) -> pd.Series:
+        """
+        Issue count of every group, indexed by the group keys.
+        """
+        if failure_mask is None:
+            failure_mask = self.failure_mask(column)
+        failure_mask = pd.Series(np.asarray(failure_mask, dtype=np.int64))
+        group_issues = failure_mask.groupby(
+            self._group_keys(column), dropna=False, sort=False
+        ).sum()
+        group_issues.index.names = self.by
+        return group_issues
+
+    def _evaluate(self, column: pd.DataFrame) -> Tuple[int, bool, str, pd.Series]:
+        return self._summarize_groups(self.group_issues(column))
+
+    def _evaluate_failures(
+        self, column: pd.DataFrame, column_statistics: Any
+    ) -> Tuple[Tuple[int, bool, str, pd.Series], np.ndarray]:
+        failure_mask = np.asarray(self.failure_mask(column), dtype=bool)
+        return (
+            self._summarize_groups(self.group_issues(column, failure_mask)),
+            failure_mask,
+        )
+
+    def _summarize_groups(
+        self, group_issues: pd.Series
+    ) -> Tuple[int, bool, str, pd.Series]:
+        failing_groups = group_issues[group_issues > 0].sort_values(ascending=False)
+        issues = int(failing_groups.sum())
+
+        reported = ", ".join(
+            f"{key} ({count})"
+            for key, count in failing_groups.iloc[: self.max_reported_groups].items()
+        )
+        if len(failing_groups) > self.max_reported_groups:
+            reported += ", …"
+
+        return (
+            issues,
+            not issues,
+            f"{len(failing_groups)} of {len(group_issues)} groups failing"
+            + (f": {reported}." if reported else "."),
+            group_issues,
+        )
+
+
+class GroupedValidator(GroupValidator):
+    """
+    Applies a row-local column validator to the column, counting its
+    failures by group in a single pass.
+    """
+
+    row_local = True
+
+    def __init__(
+        self,
+        by: Union[str, List[str]],
+        column: str,
+        validator: validators.Validator,
+        mandatory: bool = None,
+        description: str = None,
+    ) -> None:
+
+        if not (validator.row_wise and validator.row_local):
+            raise ValueError(
+                f"{type(validator).__name__} does not fail row by row independently."
+            )
+
+        if description is None:
+            description = f"{column}: {validator.description} Counted by {', '.join([by] if isinstance(by, str) else by)}."
+
+        super().__init__(
+            by,
+            column,
+            validator.mandatory if mandatory is None else mandatory,
+            description,
+        )
+
+        self.validator = validator
+
+    def failure_mask(self, column: pd.DataFrame) -> np.ndarray:
+        return np.asarray(self.validator.failure_mask(column[self.column]), dtype=bool)
+
+    def freeze(self) -> "GroupedValidator":
+        self.validator.freeze()
+        return super().freeze()
+
+
+class GroupUniqueValidator(GroupValidator):
+    def __init__(
+        self,
+        by: Union[str, List[str]],
+        column: str,
+        mandatory: bool = True,
+        description: str = None,
+    ) -> None:
+
+        if description is None:
+            description = f"{column} values are unique within each group."
+
+        super().__init__(by, column, mandatory, description)
+
+    def failure_mask(self, column: pd.DataFrame) -> np.ndarray:
+        return np.asarray(
+            column.duplicated(subset=self.by + [self.column], keep="first")
+        )
+
+
+class GroupNonNullRatioValidator(GroupValidator):
+    def __init__(
+        self,
+        by: Union[str, List[str]],
+        column: str,
+        min_ratio: float,
+        mandatory: bool = True,
+        description: str = None,
+    ) -> None:
+
+        if min_ratio is None or not 0 <= min_ratio <= 1:
+            raise ValueError("min_ratio must be between 0 and 1.")
+
+        if description is None:
+            description = f"At least {min_ratio:.0%} of {column} values are not null within each group."
+
+        super().__init__(by, column, mandatory, description)
+
+        self.min_ratio = min_ratio
+
+    def failure_mask(self, column: pd.DataFrame) -> np.ndarray:
+        non_null = column[self.column].notna().reset_index(drop=True)
+        group_ratio = non_null.groupby(
+            self._group_keys(column), dropna=False, sort=False
+        ).transform("mean")
+        # The null values of the groups below the ratio are their failures.
+        return np.asarray((group_ratio < self.min_ratio) & ~non_null)
+
+
+class GroupRangeValidator(GroupValidator):
+
+    row_local = True
+
+    def __init__(
+        self,
+        by: Union[str, List[str]],
+        column: str,
+        bounds: Dict[Any, Tuple[Number, Number]],
+        default: Optional[Tuple[Number, Number]] = None,
+        mandatory: bool = True,
+        description: str = None,
+    ) -> None:
+
+        if not bounds:
+            raise ValueError("bounds must be provided.")
+
+        if description is None:
+            description = f"{column} values are between the bounds of their group."
+
+        super().__init__(by, column, mandatory, description)
+
+        self.bounds = bounds
+        self.default = default
+
+    def _group_bounds(self, column: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+        if len(self.by) == 1:
+            keys = pd.Index(column[self.by[0]])
+        else:
+            keys = pd.MultiIndex.from_frame(column[self.by])
+
+        default_min, default_max = (
+            self.default if self.default is not None else (-np.inf, np.inf)
+        )
+        min_values = keys.map(
+            {key: bound[0] for key, bound in self.bounds.items()}
+        ).to_numpy(dtype=np.float64, na_value=default_min)
+        max_values = keys.map(
+            {key: bound[1] for key, bound in self.bounds.items()}
+        ).to_numpy(dtype=np.float64, na_value=default_max)
+        return min_values, max_values
+
+    def failure_mask(self, column: pd.DataFrame) -> np.ndarray:
+        min_values, max_values = self._group_bounds(column)
+        values = column[self.column].to_numpy(dtype=np.float64, na_value=np.nan)
+        # Comparisons with NaN are False, so nulls never fail.
+        return (values < min_values) | (values > max_values)
+
+
+class CompositeKeyValidator(FrameValidator, validators.KeyedValidator):
+    """
+    Uniqueness of the combination of several key columns. Rows are hashed
+    into 64-bit fingerprints; rows sharing a fingerprint are compared by
+    their key values, so collisions never count as duplicates. States
+    (chunks, partitions) hold the fingerprint counts and the distinct keys
+    of each fingerprint, compared when states sharing fingerprints merge.
+    """
+
+    row_wise = True
+    row_local = False
+
+    def __init__(
+        self, columns: List[str], mandatory: bool = True, description: str = None
+    ) -> None:
+
+        if not columns:
+            raise ValueError("Key columns must be provided.")
+
+        if description is None:
+            description = f"Unique combinations of {', '.join(columns)}."
+
+        super().__init__(mandatory, description)
+
+        self.columns = list(columns)
+
+    def _candidates(self, column: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+        fingerprints = sketches.hash_values(column[self.columns])
+        candidates = np.flatnonzero(
+            pd.Series(fingerprints).duplicated(keep=False).to_numpy()
+        )
+        return fingerprints, candidates
+
+    def _exact_duplicates(
+        self, column: pd.DataFrame, candidates: np.ndarray
+    ) -> np.ndarray:
+        # Only the rows sharing a fingerprint have their keys compared.
+        return column[self.columns].iloc[candidates].duplicated(keep="first").to_numpy()
+
+    def failure_mask(self, column: pd.DataFrame) -> np.ndarray:
+        _, candidates = self._candidates(column)
+        failure_mask = np.zeros(len(column), dtype=bool)
+        failure_mask[candidates] = self._exact_duplicates(column, candidates)
+        return failure_mask
+
+    def partial(self, column: pd.DataFrame) -> Tuple[pd.Series, pd.DataFrame]:
+        fingerprints, candidates = self._candidates(column)
+
+        # The first row of every fingerprint, plus the other distinct keys of
+        # colliding fingerprints.
+        distinct = ~pd.Series(fingerprints).duplicated().to_numpy()
+        distinct[candidates] = ~self._exact_duplicates(column, candidates)
+        keys = column[self.columns].iloc[np.flatnonzero(distinct)]
+        keys.index = pd.Index(fingerprints[distinct])
+
+        fingerprint_counts = pd.Series(fingerprints).value_counts(sort=False)
+        return fingerprint_counts, keys
+
+    def merge(
+        self,
+        state: Tuple[pd.Series, pd.DataFrame],
+        other_state: Tuple[pd.Series, pd.DataFrame],
+    ) -> Tuple[pd.Series, pd.DataFrame]:
+        fingerprint_counts, keys = state
+        other_fingerprint_counts, other_keys = other_state
+
+        # Only the keys of fingerprints found in both states are compared;
+        # equal keys have equal fingerprints, so they are compared alone.
+        shared = keys[keys.index.isin(other_keys.index)]
+        other_shared = other_keys.index.isin(keys.index)
+        repeated = (
+            pd.concat([shared, other_keys[other_shared]])
+            .duplicated()
+            .to_numpy()[len(shared) :]
+        )
+        new_keys = other_keys[other_shared][~repeated]
+
+        merged_counts = fingerprint_counts.add(other_fingerprint_counts, fill_value=0)
+        return merged_counts.astype("int64"), pd.concat(
+            [keys, other_keys[~other_shared], new_keys]
+        )
+
+    def split(
+        self, state: Tuple[pd.Series, pd.DataFrame], parts: int
+    ) -> List[Tuple[pd.Series, pd.DataFrame]]:
+        fingerprint_counts, keys = state
+        buckets = self._buckets(fingerprint_counts.index, parts)
+        key_buckets = self._buckets(keys.index, parts)
+        return [
+            (fingerprint_counts[buckets == part], keys[key_buckets == part])
+            for part in range(parts)
+        ]
+
+    def compact(
+        self, state: Tuple[pd.Series, pd.DataFrame]
+    ) -> Tuple[pd.Series, pd.DataFrame]:
+        fingerprint_counts, keys = state
+        repeated = fingerprint_counts[fingerprint_counts > 1]
+        return repeated, keys[keys.index.isin(repeated.index)]
+
+    def finalize(self, state: Tuple[pd.Series, pd.DataFrame]) -> Tuple[int, bool]:
+        fingerprint_counts, keys = state
+        # Each distinct key beyond the first of a fingerprint is a collision.
+        collisions = len(keys) - keys.index.nunique()
+        duplicates = int((fingerprint_counts - 1).sum()) - collisions
+        return duplicates, not duplicates
+
+    def _evaluate(self, column: pd.DataFrame) -> Tuple[int, bool]:
+        return self.finalize(self.partial(column))
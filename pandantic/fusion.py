@@ -0,0 +1,253 @@
+"""
+Fused evaluation of consecutive validators of a numeric column: a single
+traversal of the values counts the issues of every fused check, compiled
+with Numba when available.
+"""
+import math
+from numbers import Number
+from typing import List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+try:
+    import numba
+except ImportError:  # pragma: no cover
+    numba = None
+
+NON_NULL = "non_null"
+RANGE = "range"
+CATEGORIES = "categories"
+
+# Numpy kinds whose values the fused kernel reads directly.
+FUSED_KINDS = "iuf"
+
+_COMPILED_KERNEL = None
+
+
+class FusedCheck:
+    """
+    Row check of a validator, described for the fused kernel: null values,
+    values out of a range or values out of a set of categories. Null values
+    never fail range and categories checks.
+    """
+
+    __slots__ = (
+        "kind",
+        "lower",
+        "upper",
+        "lower_inclusive",
+        "upper_inclusive",
+        "categories",
+    )
+
+    def __init__(
+        self,
+        kind: str,
+        lower: Number = -np.inf,
+        upper: Number = np.inf,
+        lower_inclusive: bool = True,
+        upper_inclusive: bool = True,
+        categories: Optional[np.ndarray] = None,
+    ) -> None:
+        self.kind = kind
+        self.lower, self.upper = lower, upper
+        self.lower_inclusive, self.upper_inclusive = lower_inclusive, upper_inclusive
+        self.categories = categories
+
+    @classmethod
+    def non_null(cls) -> "FusedCheck":
+        return cls(NON_NULL)
+
+    @classmethod
+    def range(
+        cls, lower: Number, upper: Number, lower_inclusive: bool, upper_inclusive: bool
+    ) -> "FusedCheck":
+        return cls(RANGE, lower, upper, lower_inclusive, upper_inclusive)
+
+    def integer_bounds(self, dtype: np.dtype) -> Tuple[int, int]:
+        """
+        Inclusive bounds of the range over the integers of dtype, so that
+        integer values are compared exactly rather than as floats. An empty
+        range gives a lower bound above the upper one.
+        """
+        info = np.iinfo(dtype)
+        if self.lower == -np.inf:
+            lower = info.min
+        elif self.lower == np.inf:
+            lower = info.max + 1
+        elif self.lower_inclusive:
+            lower = math.ceil(self.lower)
+        else:
+            lower = math.floor(self.lower) + 1
+
+        if self.upper == np.inf:
+            upper = info.max
+        elif self.upper == -np.inf:
+            upper = info.min - 1
+        elif self.upper_inclusive:
+            upper = math.floor(self.upper)
+        else:
+            upper = math.ceil(self.upper) - 1
+
+        if lower > upper or lower > info.max or upper < info.min:
+            return info.max, info.min
+        return max(lower, info.min), min(upper, info.max)
+
+    @classmethod
+    def in_categories(cls, categories: List, dtype: np.dtype) -> Optional["FusedCheck"]:
+        """
+        Check of the categories representable in dtype, the others can never
+        match. None when categories are not all numbers.
+        """
+        categories = np.asarray(categories)
+        if categories.dtype.kind not in "biuf":
+            return None
+        with np.errstate(all="ignore"):
+            cast = categories.astype(dtype)
+        representable = cast == categories
+        return cls(CATEGORIES, categories=np.unique(cast[representable]))
+
+
+def column_values(column: pd.Series) -> Optional[np.ndarray]:
+    """
+    Contiguous numpy values of the column, or None when its dtype cannot be
+    read by the fused kernel.
+    """
+    dtype = column.dtype
+    if not isinstance(dtype, np.dtype) or dtype.kind not in FUSED_KINDS:
+        return None
+    return np.ascontiguousarray(column.to_numpy())
+
+
+def _count_issues(
+    values,
+    lower,
+    upper,
+    lower_inclusive,
+    upper_inclusive,
+    category_values,
+    category_offsets,
+):
+    null_count = 0
+    range_issues = np.zeros(lower.shape[0], np.int64)
+    category_issues = np.zeros(category_offsets.shape[0] - 1, np.int64)
+
+    for i in range(values.shape[0]):
+        value = values[i]
+        if value != value:
+            null_count += 1
+            continue
+
+        for k in range(lower.shape[0]):
+            if lower_inclusive[k]:
+                above = value >= lower[k]
+            else:
+                above = value > lower[k]
+            if upper_inclusive[k]:
+                below = value <= upper[k]
+            else:
+                below = value < upper[k]
+            if not (above and below):
+                range_issues[k] += 1
+
+        for k in range(category_issues.shape[0]):
+            start, stop = category_offsets[k], category_offsets[k + 1]
+            position = start + np.searchsorted(category_values[start:stop], value)
+            if position == stop or category_values[position] != value:
+                category_issues[k] += 1
+
+    return null_count, range_issues, category_issues
+
+
+def _count_issues_numpy(
+    values,
+    lower,
+    upper,
+    lower_inclusive,
+    upper_inclusive,
+    category_values,
+    category_offsets,
+):
+    # Same counts as the kernel, one vectorized pass per check.
+    null_mask = values != values
+    non_null = values[~null_mask]
+
+    range_issues = np.zeros(lower.shape[0], np.int64)
+    for k in range(lower.shape[0]):
+        above = non_null >= lower[k] if lower_inclusive[k] else non_null > lower[k]
+        below = non_null <= upper[k] if upper_inclusive[k] else non_null < upper[k]
+        range_issues[k] = np.count_nonzero(~(above & below))
+
+    category_issues = np.zeros(category_offsets.shape[0] - 1, np.int64)
+    for k in range(category_issues.shape[0]):
+        categories = category_values[category_offsets[k] : category_offsets[k + 1]]
+        category_issues[k] = np.count_nonzero(~np.isin(non_null, categories))
+
+    return int(null_mask.sum()), range_issues, category_issues
+
+
+def _kernel():
+    global _COMPILED_KERNEL  # pylint: disable=global-statement
+    if numba is None:
+        return _count_issues_numpy
+    if _COMPILED_KERNEL is None:
+        # Compilations are cached on disk, so only the first process using a
+        # dtype pays for them.
+        _COMPILED_KERNEL = numba.njit(nogil=True, cache=True)(_count_issues)
+    return _COMPILED_KERNEL
+
+
+def count_issues(values: np.ndarray, checks: List[FusedCheck]) -> List[int]:
+    """
+    Issues of every check over the values, in a single traversal.
+    """
+    ranges = [check for check in checks if check.kind == RANGE]
+    category_checks = [check for check in checks if check.kind == CATEGORIES]
+
+    category_values = (
+        np.concatenate([check.categories for check in category_checks])
+        if category_checks
+        else np.empty(0, values.dtype)
+    ).astype(values.dtype)
+    category_offsets = np.cumsum(
+        [0] + [len(check.categories) for check in category_checks], dtype=np.int64
+    )
+
+    if values.dtype.kind in "iu":
+        # Integers are compared in their own dtype: beyond 2**53, float64
+        # cannot tell neighbouring integers apart.
+        bounds = [check.integer_bounds(values.dtype) for check in ranges]
+        lower = np.array([bound[0] for bound in bounds], dtype=values.dtype)
+        upper = np.array([bound[1] for bound in bounds], dtype=values.dtype)
+        lower_inclusive = upper_inclusive = np.ones(len(ranges), dtype=np.bool_)
+    else:
+        lower = np.array([check.lower for check in ranges], dtype=np.float64)
+        upper = np.array([check.upper for check in ranges], dtype=np.float64)
+        lower_inclusive = np.array(
+            [check.lower_inclusive for check in ranges], dtype=np.bool_
+        )
+        upper_inclusive = np.array(
+            [check.upper_inclusive for check in ranges], dtype=np.bool_
+        )
+
+    null_count, range_issues, category_issues = _kernel()(
+        values,
+        lower,
+        upper,
+        lower_inclusive,
+        upper_inclusive,
+        category_values,
+        category_offsets,
+    )
+
+    range_issues, category_issues = iter(range_issues), iter(category_issues)
+    issues = []
+    for check in checks:
+        if check.kind == NON_NULL:
+            issues.append(int(null_count))
+        elif check.kind == RANGE:
+            issues.append(int(next(range_issues)))
+        else:
+            issues.append(int(next(category_issues)))
+    return issues
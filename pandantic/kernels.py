@@ -0,0 +1,150 @@
+"""
+Custom validators compiled with Numba, with a pure Python fallback.
+"""
+from typing import Callable, Dict, Tuple, Type
+
+import numpy as np
+import pandas as pd
+
+from pandantic import statistics, validators
+
+try:
+    import numba
+except ImportError:  # pragma: no cover
+    numba = None
+
+
+_KERNEL_CACHE: Dict[Tuple[Callable, bool, str], Callable] = {}
+
+
+def _python_kernel(predicate: Callable, vectorized: bool) -> Callable:
+    if vectorized:
+
+        def kernel(values: np.ndarray, null_mask: np.ndarray) -> int:
+            valid = np.asarray(predicate(values, null_mask), dtype=bool)
+            return int(np.count_nonzero(~valid & ~null_mask))
+
+    else:
+
+        def kernel(values: np.ndarray, null_mask: np.ndarray) -> int:
+            return sum(1 for value in values[~null_mask] if not predicate(value))
+
+    return kernel
+
+
+def _numba_kernel(predicate: Callable, vectorized: bool, dtype: np.dtype) -> Callable:
+    compiled_predicate = numba.njit(predicate)
+
+    if vectorized:
+
+        def count_failures(values, null_mask):
+            valid = compiled_predicate(values, null_mask)
+            failures = 0
+            for i in range(values.shape[0]):
+                if not null_mask[i] and not valid[i]:
+                    failures += 1
+            return failures
+
+    else:
+
+        def count_failures(values, null_mask):
+            failures = 0
+            for i in range(values.shape[0]):
+                if not null_mask[i] and not compiled_predicate(values[i]):
+                    failures += 1
+            return failures
+
+    signature = numba.int64(numba.from_dtype(dtype)[::1], numba.boolean[::1])
+    return numba.njit(signature)(count_failures)
+
+
+def compile_kernel(predicate: Callable, vectorized: bool, dtype: np.dtype) -> Callable:
+    key = (predicate, vectorized, dtype.str)
+    kernel = _KERNEL_CACHE.get(key)
+
+    if kernel is None:
+        if numba is not None and dtype.kind in "biufcmM":
+            try:
+                kernel = _numba_kernel(predicate, vectorized, dtype)
+            except Exception:  # pylint: disable=broad-except
+                # Predicates Numba cannot type still run through the fallback.
+                kernel = None
+        if kernel is None:
+            kernel = _python_kernel(predicate, vectorized)
+        _KERNEL_CACHE[key] = kernel
+
+    return kernel
+
+
+def column_buffer(column: pd.Series) -> np.ndarray:
+    dtype = column.dtype
+    if isinstance(dtype, pd.api.extensions.ExtensionDtype) and hasattr(
+        dtype, "numpy_dtype"
+    ):
+        # Masked arrays: null positions are skipped through the null mask.
+        return column.to_numpy(dtype=dtype.numpy_dtype, na_value=0)
+    return np.ascontiguousarray(column.to_numpy())
+
+
+class KernelValidator(validators.StatisticsValidator):
+
+    predicate: Callable = None
+    vectorized: bool = False
+
+    def __init__(
+        self,
+        predicate: Callable = None,
+        vectorized: bool = None,
+        mandatory: bool = True,
+        description: str = None,
+    ) -> None:
+
+        if predicate is not None:
+            self.predicate = predicate
+        if vectorized is not None:
+            self.vectorized = vectorized
+
+        if self.predicate is None:
+            raise ValueError("predicate must be provided.")
+
+        if description is None:
+            description = f"Values satisfy {self.predicate.__name__}."
+
+        super().__init__(mandatory, description)
+
+    def _evaluate_statistics(
+        self, column: pd.Series, column_statistics: statistics.ColumnStatistics
+    ) -> Tuple[int, bool]:
+        values = column_buffer(column)
+        null_mask = np.ascontiguousarray(column_statistics.null_mask)
+
+        kernel = compile_kernel(self.predicate, self.vectorized, values.dtype)
+        failures = int(kernel(values, null_mask))
+
+        return failures, not failures
+
+
+def kernel_validator(
+    predicate: Callable = None, vectorized: bool = False
+) -> Type[KernelValidator]:
+    def decorator(function: Callable) -> Type[KernelValidator]:
+        def __init__(self, mandatory: bool = True, description: str = None) -> None:
+            KernelValidator.__init__(self, mandatory=mandatory, description=description)
+
+        # The predicate lives on a named class so validators pickle by reference.
+        return type(
+            function.__name__,
+            (KernelValidator,),
+            {
+                "__init__": __init__,
+                "__module__": function.__module__,
+                "__qualname__": function.__qualname__,
+                "__doc__": function.__doc__,
+                "predicate": staticmethod(function),
+                "vectorized": vectorized,
+            },
+        )
+
+    if predicate is not None:
+        return decorator(predicate)
+    return decorator
@@ -0,0 +1,137 @@
+"""
+Estimates of the peak memory of column evaluations, used to evaluate large
+columns in row blocks that fit within a memory limit.
+"""
+import math
+import re
+from typing import Optional, Union
+
+import pandas as pd
+
+from pandantic import datatype_validators, validators
+
+UNITS = {
+    "B": 1,
+    "KB": 10**3,
+    "MB": 10**6,
+    "GB": 10**9,
+    "TB": 10**12,
+    "KIB": 2**10,
+    "MIB": 2**20,
+    "GIB": 2**30,
+    "TIB": 2**40,
+}
+
+# Copies of the column alive while its validators run: the one made by the
+# column declaration, the one made by the validator set, and the distinct
+# values cached by the column statistics (at most as large as the column).
+PIPELINE_COPIES = 3
+# Null mask (1 byte) and factorization codes (8 bytes) cached by the column
+# statistics.
+STATISTICS_ROW_BYTES = 9
+
+_SIZE = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([a-zA-Z]*)\s*$")
+
+
+def parse_size(size: Union[int, float, str]) -> int:
+    """
+    Bytes of a size given as a number of bytes or as a string such as "4GB",
+    "512MiB" or "1e6" (decimal and binary units are both accepted).
+    """
+    if isinstance(size, (int, float)) and not isinstance(size, bool):
+        if size <= 0:
+            raise ValueError("Memory sizes must be positive.")
+        return int(size)
+
+    match = _SIZE.match(str(size))
+    if match is None or match.group(2).upper() not in UNITS:
+        try:
+            return parse_size(float(size))
+        except ValueError:
+            raise ValueError(f"Invalid memory size {size!r}.") from None
+
+    number, unit = match.groups()
+    return parse_size(float(number) * UNITS[unit.upper()])
+
+
+def row_bytes(column: pd.Series) -> float:
+    """
+    Bytes per row of a copy of the column. Copies of object columns only
+    copy their pointers, so the shallow memory usage is the right measure.
+    """
+    if not len(column):
+        return 0.0
+    return column.memory_usage(index=False, deep=False) / len(column)
+
+
+def row_peak(validator_set: validators.ValidatorSet, column: pd.Series) -> float:
+    column_row_bytes = row_bytes(column)
+    validator_peak = max(
+        (validator.memory_per_row(column_row_bytes) for validator in validator_set),
+        default=0.0,
+    )
+    return PIPELINE_COPIES * column_row_bytes + STATISTICS_ROW_BYTES + validator_peak
+
+
+def estimate_peak(validator_set: validators.ValidatorSet, column: pd.Series) -> int:
+    """
+    Estimated peak bytes allocated to evaluate the whole column, besides the
+    column itself.
+    """
+    return int(math.ceil(len(column) * row_peak(validator_set, column)))
+
+
+def blockable(validator: validators.Validator, column: pd.Series) -> bool:
+    """
+    Whether evaluating the validator in row blocks and merging the summaries
+    of the blocks gives its evaluation of the whole column within the memory
+    of a block: it either decides each row on its own, merges partial states
+    of bounded size (sketches), or is a dtype validator that accepts the
+    column dtype as it is. Keyed states, such as the value counts of unique
+    checks, grow with the distinct values of the whole column, so those
+    validators run on the whole column.
+    """
+    if validator.row_local:
+        return True
+    return isinstance(
+        validator, datatype_validators.DatatypeValidator
+    ) and validator.accepts(column)
+
+
+def rows_per_block(
+    validator_set: validators.ValidatorSet, column: pd.Series, memory_limit: int
+) -> Optional[int]:
+    """
+    Rows per block keeping the evaluation of the blockable validators under
+    memory_limit bytes, or None when the whole column fits. The others are
+    evaluated on the whole column, which must fit on its own.
+    """
+    if estimate_peak(validator_set, column) <= memory_limit:
+        return None
+
+    for validator in validator_set:
+        if blockable(validator, column):
+            continue
+        peak = estimate_peak(validators.ValidatorSet([validator]), column)
+        if peak > memory_limit:
+            raise ValueError(
+                f"Evaluating {type(validator).__name__} on column {column.name} "
+                f"needs about {peak} bytes, more than the memory limit of "
+                f"{memory_limit} bytes, and it cannot be evaluated in row blocks."
+            )
+
+    rows = int(
+        memory_limit
+        // row_peak(
+            validators.ValidatorSet(
+                validator for validator in validator_set if blockable(validator, column)
+            ),
+            column,
+        )
+    )
+    if rows < 1:
+        raise ValueError(
+            f"The memory limit of {memory_limit} bytes cannot fit a single row "
+            f"of column {column.name}."
+        )
+    return rows
@@ -0,0 +1,351 @@
+"""
+In-process metrics of the validation stage, rendered in the Prometheus text
+exposition format. Recording is disabled until enable() is called; the
+durations of every column, one label set per schema and column, are only
+recorded when enabled with column_labels.
+"""
+import bisect
+import http.server
+import threading
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+DEFAULT_BUCKETS = (
+    0.0005,
+    0.001,
+    0.005,
+    0.01,
+    0.05,
+    0.1,
+    0.5,
+    1.0,
+    5.0,
+    10.0,
+    60.0,
+)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labelnames: Sequence[str], labelvalues: Sequence[str]) -> str:
+    if not labelnames:
+        return ""
+    pairs = ",".join(
+        f'{name}="{_escape(value)}"' for name, value in zip(labelnames, labelvalues)
+    )
+    return "{" + pairs + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Metric:
+
+    metric_type = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> Tuple[str, ...]:
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def samples(self) -> Iterable[Tuple[str, Tuple[str, ...], Tuple[str, ...], float]]:
+        raise NotImplementedError()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values = {}
+
+    def render(self) -> List[str]:
+        lines = [
+            f"# HELP {self.name} {_escape(self.documentation)}",
+            f"# TYPE {self.name} {self.metric_type}",
+        ]
+        for sample_name, labelnames, labelvalues, value in self.samples():
+            lines.append(
+                f"{sample_name}{_format_labels(labelnames, labelvalues)} {_format_value(value)}"
+            )
+        return lines
+
+
+class Counter(Metric):
+
+    metric_type = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, value: float = 1, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + value
+
+    def get(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0)
+
+    def samples(self):
+        with self._lock:
+            values = list(self._values.items())
+        for labelvalues, value in values:
+            yield f"{self.name}_total", self.labelnames, labelvalues, value
+
+
+class Gauge(Metric):
+
+    metric_type = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def set(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def get(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0)
+
+    def samples(self):
+        with self._lock:
+            values = list(self._values.items())
+        for labelvalues, value in values:
+            yield self.name, self.labelnames, labelvalues, value
+
+
+class Histogram(Metric):
+
+    metric_type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: [bucket counts..., +Inf count, sum]
+        self._values: Dict[Tuple[str, ...], List[float]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        position = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            values = self._values.get(key)
+            if values is None:
+                values = self._values[key] = [0] * (len(self.buckets) + 1) + [0.0]
+            values[position] += 1
+            values[-1] += value
+
+    def count(self, **labels: str) -> int:
+        values = self._values.get(self._key(labels))
+        return sum(values[:-1]) if values is not None else 0
+
+    def samples(self):
+        with self._lock:
+            values = [(key, list(value)) for key, value in self._values.items()]
+        labelnames = self.labelnames + ("le",)
+        for labelvalues, counts in values:
+            cumulative = 0
+            for upper_bound, bucket_count in zip(
+                self.buckets + (float("inf"),), counts[:-1]
+            ):
+                cumulative += bucket_count
+                yield f"{self.name}_bucket", labelnames, labelvalues + (
+                    _format_value(upper_bound),
+                ), cumulative
+            yield f"{self.name}_count", self.labelnames, labelvalues, cumulative
+            yield f"{self.name}_sum", self.labelnames, labelvalues, counts[-1]
+
+
+class Registry:
+    def __init__(self) -> None:
+        self.enabled = False
+        self.column_labels = False
+        self.metrics: Dict[str, Metric] = {}
+
+        self.rows_validated = self.register(
+            Counter(
+                "pandantic_rows_validated",
+                "Rows evaluated by the schemas.",
+                ["schema"],
+            )
+        )
+        self.schema_evaluations = self.register(
+            Counter(
+                "pandantic_schema_evaluations",
+                "Schema evaluations by result (valid, warning, invalid, error).",
+                ["schema", "result"],
+            )
+        )
+        self.schema_seconds = self.register(
+            Histogram(
+                "pandantic_schema_evaluation_seconds",
+                "Duration of the evaluations of the schemas.",
+                ["schema"],
+            )
+        )
+        self.rows_per_second = self.register(
+            Gauge(
+                "pandantic_rows_per_second",
+                "Throughput of the last evaluation of each schema.",
+                ["schema"],
+            )
+        )
+        self.column_seconds = self.register(
+            Histogram(
+                "pandantic_column_evaluation_seconds",
+                "Duration of the evaluation of a column.",
+                ["schema", "column"],
+            )
+        )
+        self.validator_seconds = self.register(
+            Histogram(
+                "pandantic_validator_seconds",
+                "Duration of Validator.evaluate.",
+                ["validator"],
+            )
+        )
+        self.validations = self.register(
+            Counter(
+                "pandantic_validations",
+                "Validations evaluated.",
+                ["validator", "valid"],
+            )
+        )
+        self.amendments = self.register(
+            Counter(
+                "pandantic_amendments",
+                "Validations whose amendment was applied.",
+                ["validator"],
+            )
+        )
+        self.issues = self.register(
+            Counter(
+                "pandantic_validation_issues",
+                "Issues found before amendment.",
+                ["validator"],
+            )
+        )
+        self.validation_errors = self.register(
+            Counter(
+                "pandantic_validation_errors",
+                "Validators raising an error while evaluating.",
+                ["validator"],
+            )
+        )
+
+    def register(self, metric: Metric) -> Metric:
+        if metric.name in self.metrics:
+            raise ValueError(f"Metric {metric.name} is already registered.")
+        self.metrics[metric.name] = metric
+        return metric
+
+    def clear(self) -> None:
+        for metric in self.metrics.values():
+            metric.clear()
+
+    def render(self) -> str:
+        lines = []
+        for metric in self.metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+
+def enable(registry: Registry = REGISTRY, column_labels: bool = False) -> None:
+    registry.enabled = True
+    registry.column_labels = column_labels
+
+
+def disable(registry: Registry = REGISTRY) -> None:
+    registry.enabled = False
+
+
+def record_validation(validator, validation, registry: Registry = REGISTRY) -> None:
+    if not registry.enabled:
+        return
+    validator_name = type(validator).__name__
+    registry.validator_seconds.observe(
+        validation.elapsed or 0.0, validator=validator_name
+    )
+    registry.validations.inc(
+        validator=validator_name, valid=str(bool(validation.valid))
+    )
+    if validation.amended:
+        registry.amendments.inc(validator=validator_name)
+    if validation.original_issues:
+        registry.issues.inc(int(validation.original_issues), validator=validator_name)
+
+
+def record_validation_error(validator, registry: Registry = REGISTRY) -> None:
+    if not registry.enabled:
+        return
+    registry.validation_errors.inc(validator=type(validator).__name__)
+
+
+def record_column(
+    schema_name: str, column_name: str, elapsed: float, registry: Registry = REGISTRY
+) -> None:
+    if not (registry.enabled and registry.column_labels):
+        return
+    registry.column_seconds.observe(elapsed, schema=schema_name, column=column_name)
+
+
+def record_schema(
+    schema_name: str,
+    rows: int,
+    elapsed: float,
+    result: str,
+    registry: Registry = REGISTRY,
+) -> None:
+    if not registry.enabled:
+        return
+    registry.rows_validated.inc(rows, schema=schema_name)
+    registry.schema_evaluations.inc(schema=schema_name, result=result)
+    registry.schema_seconds.observe(elapsed, schema=schema_name)
+    if elapsed > 0:
+        registry.rows_per_second.set(rows / elapsed, schema=schema_name)
+
+
+def start_http_server(
+    port: int = 0, addr: str = "127.0.0.1", registry: Registry = REGISTRY
+) -> http.server.ThreadingHTTPServer:
+    """
+    Serves the registry on /metrics from a daemon thread. Returns the server,
+    whose server_address holds the bound port; call shutdown() to stop it.
+    """
+
+    class MetricsHandler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self) -> None:  # pylint: disable=invalid-name
+            if self.path.split("?")[0] not in ("/", "/metrics"):
+                self.send_error(404)
+                return
+            body = registry.render().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args) -> None:
+            pass
+
+    server = http.server.ThreadingHTTPServer((addr, port), MetricsHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
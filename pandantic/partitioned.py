@@ -0,0 +1,262 @@
+"""
+Lazy, partition-wise evaluation of dask DataFrames.
+"""
+import copy
+import functools
+import time
+from typing import Any, Callable, Dict, List, NamedTuple, Tuple
+
+import pandas as pd
+
+from pandantic import summaries, validators
+
+STATES = ("original_state", "pending_state")
+
+
+def is_dask_frame(dataframe: Any) -> bool:
+    return type(dataframe).__module__.split(".")[0] in (
+        "dask",
+        "dask_expr",
+    ) and hasattr(dataframe, "to_delayed")
+
+
+def evaluate_partition(
+    schema,
+    partition: pd.DataFrame,
+    missing_columns: List,
+    column_names: List,
+    frame_passes: List[summaries.FramePass],
+    decisions: List[Dict[str, summaries.Decision]],
+) -> Tuple[pd.DataFrame, dict]:
+    """
+    Evaluates the passes on the partition given their decisions, returning
+    the amended partition and the summary of the last pass. A chunk read
+    again for a later pass is evaluated again by the earlier ones.
+    """
+    original_column_names = list(partition.columns)
+    partition = partition.copy()
+    partition.columns = column_names
+
+    for frame_pass, pass_decisions in zip(frame_passes, decisions):
+        partition, pass_summary = summaries.summarize_pass(
+            schema, partition, missing_columns, frame_pass, pass_decisions
+        )
+
+    partition.columns = original_column_names
+    return partition, pass_summary
+
+
+def _amended_partition(result: Tuple[pd.DataFrame, dict]) -> pd.DataFrame:
+    return result[0]
+
+
+def _partition_summary(result: Tuple[pd.DataFrame, dict]) -> dict:
+    return result[1]
+
+
+def _empty_partition(partition: pd.DataFrame) -> pd.DataFrame:
+    return partition.iloc[:0]
+
+
+def _keyed_summaries(schema, frame_summary: dict):
+    for name, column_summary in frame_summary.items():
+        if column_summary is None:
+            continue
+        for position, (validator, summary) in enumerate(
+            zip(
+                summaries.validator_list(schema, name),
+                column_summary.validation_summaries,
+            )
+        ):
+            if summary is not None and isinstance(validator, validators.KeyedValidator):
+                yield (name, position), validator, summary
+
+
+def split_keyed_states(
+    schema, frame_summary: dict, parts: int
+) -> Tuple[dict, List[Dict[Tuple, Any]]]:
+    """
+    Takes the states of keyed validators out of a partition summary. Returns
+    the summary without them and, for each of parts buckets of values, the
+    states of the values hashed to it.
+    """
+    frame_summary = {
+        name: summaries.ColumnSummary(
+            [
+                copy.copy(summary) if summary is not None else None
+                for summary in column_summary.validation_summaries
+            ]
+        )
+        if column_summary is not None
+        else None
+        for name, column_summary in frame_summary.items()
+    }
+    buckets = [dict() for _ in range(parts)]
+
+    for key, validator, summary in _keyed_summaries(schema, frame_summary):
+        for attribute in STATES:
+            state = getattr(summary, attribute)
+            if state is None:
+                continue
+            for bucket, bucket_state in zip(buckets, validator.split(state, parts)):
+                bucket[key + (attribute,)] = bucket_state
+            setattr(summary, attribute, None)
+
+    return frame_summary, buckets
+
+
+def _keyed_validator(schema, key: Tuple) -> validators.KeyedValidator:
+    name, position, _ = key
+    return summaries.validator_list(schema, name)[position]
+
+
+def merge_keyed_states(
+    schema, states: Dict[Tuple, Any], other_states: Dict[Tuple, Any]
+) -> Dict[Tuple, Any]:
+    merged_states = dict(states)
+    for key, state in other_states.items():
+        merged_states[key] = (
+            _keyed_validator(schema, key).merge(merged_states[key], state)
+            if key in merged_states
+            else state
+        )
+    return merged_states
+
+
+def compact_keyed_states(schema, states: Dict[Tuple, Any]) -> Dict[Tuple, Any]:
+    return {
+        key: _keyed_validator(schema, key).compact(state)
+        for key, state in states.items()
+    }
+
+
+def restore_keyed_states(schema, frame_summary: dict, states: Dict[Tuple, Any]) -> dict:
+    for key, _, summary in _keyed_summaries(schema, frame_summary):
+        for attribute in STATES:
+            if key + (attribute,) in states:
+                setattr(summary, attribute, states[key + (attribute,)])
+    return frame_summary
+
+
+def tree_reduce(items: List, combine: Callable) -> Any:
+    from dask import delayed
+
+    combine = delayed(combine)
+    while len(items) > 1:
+        items = [
+            combine(items[position], items[position + 1])
+            if position + 1 < len(items)
+            else items[position]
+            for position in range(0, len(items), 2)
+        ]
+    return items[0]
+
+
+def merge_partition_summaries(schema, partition_summaries: List) -> Any:
+    """
+    Delayed merge of the pass summaries of every partition. States of keyed
+    validators, such as value counts for uniqueness, are hash-partitioned
+    by value: each bucket is merged across partitions on its own and
+    compacted to the values seen more than once, so no task holds every
+    distinct value.
+    """
+    from dask import delayed
+
+    parts = len(partition_summaries)
+    split_summaries = [
+        delayed(split_keyed_states, nout=2)(schema, partition_summary, parts)
+        for partition_summary in partition_summaries
+    ]
+    merge_states = functools.partial(merge_keyed_states, schema)
+    bucket_states = [
+        delayed(compact_keyed_states)(
+            schema,
+            tree_reduce(
+                [split_summary[1][part] for split_summary in split_summaries],
+                merge_states,
+            ),
+        )
+        for part in range(parts)
+    ]
+
+    return delayed(restore_keyed_states)(
+        schema,
+        tree_reduce(
+            [split_summary[0] for split_summary in split_summaries],
+            functools.partial(summaries.merge_frame_summaries, schema),
+        ),
+        tree_reduce(bucket_states, merge_states),
+    )
+
+
+def evaluate_dask(
+    schema, dataframe, name: str, warn: bool = True
+) -> Tuple[Any, NamedTuple]:
+    """
+    Applies the schema to every partition of a dask DataFrame, in the passes
+    of summaries.frame_passes. Validation counts and mergeable validator
+    states of each pass are combined through a tree reduction (see
+    merge_partition_summaries), and the decisions of the next pass are taken
+    from them, within the same computation.
+
+    The amended DataFrame is returned lazily, built from the same partition
+    evaluations: computing it evaluates every partition again, so persist it
+    when it is used more than once.
+    """
+    import dask
+    import dask.dataframe as dd
+    from dask import delayed
+
+    started = time.perf_counter()
+    column_names = schema.transform_column_names(dataframe)
+    missing_columns, remaining_columns = schema.check_columns(
+        pd.DataFrame(columns=column_names)
+    )
+
+    evaluate = delayed(evaluate_partition)
+    source_partitions = partitions = dataframe.to_delayed()
+    frame_summary = dict()
+
+    for frame_pass in summaries.frame_passes(schema):
+        decisions = delayed(summaries.decide_pass)(schema, frame_summary, frame_pass)
+        results = [
+            evaluate(
+                schema,
+                partition,
+                missing_columns,
+                column_names,
+                [frame_pass],
+                [decisions],
+            )
+            for partition in partitions
+        ]
+        partitions = [delayed(_amended_partition)(result) for result in results]
+        frame_summary = delayed(summaries.update_frame_summary)(
+            schema,
+            frame_summary,
+            merge_partition_summaries(
+                schema, [delayed(_partition_summary)(result) for result in results]
+            ),
+        )
+
+    frame_summary, meta, rows = dask.compute(
+        frame_summary,
+        delayed(_empty_partition)(partitions[0]),
+        [delayed(len)(partition) for partition in source_partitions],
+    )
+
+    amended_dataframe = dd.from_delayed(
+        partitions, meta=meta, divisions=dataframe.divisions
+    )
+
+    evaluation = schema.build_evaluation(
+        name,
+        summaries.evaluation_data(schema, frame_summary),
+        missing_columns,
+        remaining_columns,
+        warn,
+        rows=sum(rows),
+        started=started,
+    )
+
+    return amended_dataframe, evaluation
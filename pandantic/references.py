@@ -0,0 +1,584 @@
+"""
+Reusable indexes over reference values, for foreign-key validations.
+"""
+import contextlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+import uuid
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+except ImportError:  # pragma: no cover
+    pa = None
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+    import msvcrt
+
+NUMBERS = "numbers"
+STRINGS = "strings"
+
+MANIFEST = "manifest.json"
+LOCK = "manifest.lock"
+# Deltas appended by update() before they are merged into the base values.
+MAX_DELTAS = 16
+# Values searched at once; bounds the temporary arrays of string searches.
+SEARCH_BLOCK = 2**20
+
+_NO_BYTES = np.empty(0, dtype=np.uint8)
+
+
+def _key_string(value: Any) -> str:
+    # Integral floats are written as integers, so 1.0 matches the key "1".
+    if isinstance(value, (float, np.floating)) and float(value).is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def _key_strings(values: np.ndarray) -> np.ndarray:
+    if values.dtype.kind in "biu":
+        return values.astype(str).astype(object)
+    if values.dtype.kind == "f":
+        keys = values.astype(str).astype(object)
+        integral = np.isfinite(values) & (np.trunc(values) == values)
+        small = integral & (np.abs(values) < 2**63)
+        keys[small] = values[small].astype(np.int64).astype(str)
+        large = np.flatnonzero(integral & ~small)
+        keys[large] = [_key_string(value) for value in values[large]]
+        return keys
+    if (
+        values.dtype.kind == "O"
+        and pd.api.types.infer_dtype(values, skipna=False) == "string"
+    ):
+        return values
+    return np.array([_key_string(value) for value in values], dtype=object)
+
+
+def _key_numbers(values: np.ndarray) -> np.ndarray:
+    if values.dtype.kind in "biuf":
+        return values
+    # Values which are not numbers become NaN, which matches nothing.
+    return np.asarray(pd.to_numeric(pd.Series(values), errors="coerce"))
+
+
+def _encode(strings: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    UTF-8 bytes of the strings, concatenated, and the offsets of each one.
+    """
+    if pa is not None:
+        try:
+            array = pa.array(strings, pa.large_string())
+        except (pa.ArrowException, UnicodeEncodeError):
+            # Lone surrogates, which Arrow rejects.
+            pass
+        else:
+            _, offsets, data = array.buffers()
+            return (
+                np.frombuffer(data, dtype=np.uint8) if data is not None else _NO_BYTES,
+                np.frombuffer(offsets, dtype=np.int64)[: len(strings) + 1],
+            )
+
+    encoded = [string.encode("utf-8", "surrogatepass") for string in strings]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum(np.fromiter(map(len, encoded), np.int64, len(encoded)), out=offsets[1:])
+    return np.frombuffer(b"".join(encoded), dtype=np.uint8), offsets
+
+
+def _decode(data: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    if pa is not None:
+        try:
+            return (
+                pa.Array.from_buffers(
+                    pa.large_string(),
+                    len(offsets) - 1,
+                    [None, pa.py_buffer(offsets), pa.py_buffer(data)],
+                )
+                .to_numpy(zero_copy_only=False)
+                .astype(object)
+            )
+        except pa.ArrowException:
+            pass
+
+    data = np.asarray(data).tobytes()
+    return np.array(
+        [
+            data[start:stop].decode("utf-8", "surrogatepass")
+            for start, stop in zip(offsets[:-1], offsets[1:])
+        ],
+        dtype=object,
+    )
+
+
+class NumberKeys:
+    """
+    Sorted array of unique numbers, searched with searchsorted.
+    """
+
+    __slots__ = ("keys",)
+
+    files = ("keys",)
+
+    def __init__(self, keys: np.ndarray) -> None:
+        self.keys = keys
+
+    @classmethod
+    def from_keys(cls, keys: np.ndarray) -> "NumberKeys":
+        return cls(np.unique(keys))
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def contains(self, keys: np.ndarray) -> np.ndarray:
+        if not len(self.keys):
+            return np.zeros(len(keys), dtype=bool)
+        positions = np.searchsorted(self.keys, keys)
+        positions[positions == len(self.keys)] = 0
+        return np.asarray(self.keys[positions] == keys)
+
+    def values(self) -> np.ndarray:
+        return self.keys
+
+
+class StringKeys:
+    """
+    Unique strings sorted by their 64-bit hash, stored as UTF-8 bytes and
+    offsets instead of fixed-width strings. Searches find the hash with
+    searchsorted, then compare the bytes, so hash collisions never match.
+    """
+
+    __slots__ = ("hashes", "offsets", "data")
+
+    files = ("hashes", "offsets", "data")
+
+    def __init__(self, hashes: np.ndarray, offsets: np.ndarray, data: np.ndarray):
+        self.hashes = hashes
+        self.offsets = offsets
+        self.data = data
+
+    @classmethod
+    def from_keys(cls, keys: np.ndarray) -> "StringKeys":
+        keys = pd.unique(keys)
+        hashes = pd.util.hash_array(keys, categorize=False)
+        order = np.argsort(hashes, kind="stable")
+        data, offsets = _encode(keys[order])
+        return cls(hashes[order], offsets, data)
+
+    def __len__(self) -> int:
+        return len(self.hashes)
+
+    def contains(self, keys: np.ndarray) -> np.ndarray:
+        found = np.zeros(len(keys), dtype=bool)
+        if not len(self.hashes):
+            return found
+        for start in range(0, len(keys), SEARCH_BLOCK):
+            block = keys[start : start + SEARCH_BLOCK]
+            found[start : start + len(block)] = self._contains_block(block)
+        return found
+
+    def _contains_block(self, keys: np.ndarray) -> np.ndarray:
+        hashes = pd.util.hash_array(keys, categorize=False)
+        data, offsets = _encode(keys)
+
+        found = np.zeros(len(keys), dtype=bool)
+        pending = np.arange(len(keys))
+        # Sorted hashes are searched in order, which is much faster.
+        order = np.argsort(hashes)
+        positions = np.empty(len(keys), dtype=np.int64)
+        positions[order] = np.searchsorted(self.hashes, hashes[order])
+        # Distinct strings sharing a hash are adjacent: each is compared in turn.
+        while len(pending):
+            in_bounds = positions < len(self.hashes)
+            pending, positions = pending[in_bounds], positions[in_bounds]
+            same_hash = self.hashes[positions] == hashes[pending]
+            pending, positions = pending[same_hash], positions[same_hash]
+
+            equal = self._equal(positions, data, offsets, pending)
+            found[pending[equal]] = True
+            pending, positions = pending[~equal], positions[~equal] + 1
+        return found
+
+    def _equal(
+        self,
+        positions: np.ndarray,
+        data: np.ndarray,
+        offsets: np.ndarray,
+        indices: np.ndarray,
+    ) -> np.ndarray:
+        starts = self.offsets[positions]
+        lengths = self.offsets[positions + 1] - starts
+        other_starts = offsets[indices]
+        other_lengths = offsets[indices + 1] - other_starts
+
+        equal = lengths == other_lengths
+        compared = np.flatnonzero(equal & (lengths > 0))
+        if not len(compared):
+            return equal
+
+        lengths = lengths[compared]
+        first_bytes = np.cumsum(lengths) - lengths
+        # Position of every compared byte within its string.
+        within = np.arange(lengths.sum()) - np.repeat(first_bytes, lengths)
+        same_bytes = (
+            self.data[np.repeat(starts[compared], lengths) + within]
+            == data[np.repeat(other_starts[compared], lengths) + within]
+        )
+        equal[compared] = np.logical_and.reduceat(same_bytes, first_bytes)
+        return equal
+
+    def values(self) -> np.ndarray:
+        return _decode(self.data, self.offsets)
+
+
+KEYS = {NUMBERS: NumberKeys, STRINGS: StringKeys}
+
+
+def _kind(values: np.ndarray) -> str:
+    return NUMBERS if values.dtype.kind in "biuf" else STRINGS
+
+
+def _as_keys(kind: str, values: Any) -> np.ndarray:
+    values = np.asarray(values)
+    return _key_numbers(values) if kind == NUMBERS else _key_strings(values)
+
+
+def _as_index_keys(kind: str, values: Any):
+    values = pd.Series(values).dropna().to_numpy()
+    keys = _as_keys(kind, values)
+    if kind == NUMBERS and keys.dtype.kind == "f" and np.isnan(keys).any():
+        raise ValueError("References of numbers cannot hold other values.")
+    return KEYS[kind].from_keys(keys)
+
+
+def _save_keys(directory: str, keys) -> str:
+    name = f"keys-{uuid.uuid4().hex}"
+    temporary_path = tempfile.mkdtemp(dir=directory, suffix=".tmp")
+    for file_name in keys.files:
+        np.save(
+            os.path.join(temporary_path, f"{file_name}.npy"),
+            np.asarray(getattr(keys, file_name)),
+        )
+    os.replace(temporary_path, os.path.join(directory, name))
+    return name
+
+
+def _load_keys(directory: str, kind: str, name: str):
+    keys_class = KEYS[kind]
+    return keys_class(
+        *(
+            np.load(os.path.join(directory, name, f"{file_name}.npy"), mmap_mode="r")
+            for file_name in keys_class.files
+        )
+    )
+
+
+@contextlib.contextmanager
+def _locked(path: str):
+    """
+    Holds the lock of the saved index at path, which serializes its writers
+    across processes.
+    """
+    with open(os.path.join(path, LOCK), "a+b") as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        else:  # pragma: no cover
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+            else:  # pragma: no cover
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def _manifest_names(manifest: Dict[str, Any]) -> List[str]:
+    return [manifest["base"]] + [
+        name for delta in manifest["deltas"] for name in delta if name
+    ]
+
+
+class ReferenceIndex:
+    """
+    Index of unique reference values: numbers in a sorted array, strings as
+    bytes sorted by hash (see StringKeys). Searched values are compared as
+    numbers or as strings, following the reference values.
+
+    A saved index is a directory of memory-mapped arrays, so processes
+    loading it share their pages. update() appends its added and removed
+    values as deltas, merged into the base values once MAX_DELTAS are
+    pending, and refresh() loads the deltas written by other processes.
+    Writers hold a file lock; the keys a merge replaces are only deleted by
+    the following merge, once readers have moved on. Threads may search the
+    index while it is refreshed: its state is replaced, never modified in
+    place.
+    """
+
+    def __init__(
+        self,
+        kind: str,
+        base,
+        deltas: Optional[List[Tuple[Any, Any]]] = None,
+        length: Optional[int] = None,
+        path: Optional[str] = None,
+    ) -> None:
+        # A single attribute, read once by searches.
+        self.state = (
+            kind,
+            base,
+            list(deltas or []),
+            length if length is not None else len(base),
+        )
+        self.path = path
+        self.modified = None
+        self.names = dict()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_values(cls, values: Iterable) -> "ReferenceIndex":
+        values = pd.Series(values).dropna().infer_objects().to_numpy()
+        kind = _kind(values)
+        return cls(kind, _as_index_keys(kind, values))
+
+    @classmethod
+    def from_frame(cls, dataframe: pd.DataFrame, column_name: str) -> "ReferenceIndex":
+        return cls.from_values(dataframe[column_name])
+
+    @classmethod
+    def load(cls, path: str) -> "ReferenceIndex":
+        reference = cls(NUMBERS, NumberKeys(np.empty(0)), path=path)
+        reference.refresh()
+        return reference
+
+    @property
+    def kind(self) -> str:
+        return self.state[0]
+
+    @property
+    def values(self) -> np.ndarray:
+        """
+        Sorted reference values.
+        """
+        _, base, deltas, _ = self.state
+        if not deltas and isinstance(base, NumberKeys):
+            return base.keys
+
+        values = np.sort(base.values())
+        for added, removed in deltas:
+            if removed is not None:
+                values = values[~removed.contains(values)]
+            if added is not None:
+                values = np.union1d(values, added.values())
+        return values
+
+    def __len__(self) -> int:
+        return self.state[3]
+
+    def __getstate__(self) -> Dict[str, Any]:
+        if self.path is not None:
+            return {"path": self.path}
+        return {"state": self.state}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        if "path" in state:
+            self.__init__(NUMBERS, NumberKeys(np.empty(0)), path=state["path"])
+            self.refresh()
+        else:
+            self.__init__(*state["state"])
+
+    def save(self, path: str) -> None:
+        """
+        Writes the index, with its deltas merged, to the path directory.
+        """
+        os.makedirs(path, exist_ok=True)
+        with _locked(path):
+            self._save(path)
+        self.path = path
+        self.refresh()
+
+    def _save(self, path: str) -> None:
+        kind, _, _, length = self.state
+        with self._lock:
+            base = KEYS[kind].from_keys(self.values)
+            self._write(path, kind, _save_keys(path, base), [], length)
+
+    def _write(
+        self,
+        path: str,
+        kind: str,
+        base_name: str,
+        delta_names: List[Tuple[Optional[str], Optional[str]]],
+        length: int,
+    ) -> None:
+        previous = self._manifest(path)
+        retired, deleted = [], []
+        if previous is not None:
+            retired = previous.get("retired", [])
+            if previous["base"] != base_name:
+                retired, deleted = _manifest_names(previous), retired
+
+        manifest = {
+            "kind": kind,
+            "length": length,
+            "base": base_name,
+            "deltas": delta_names,
+            "retired": retired,
+        }
+        descriptor, temporary_path = tempfile.mkstemp(dir=path, suffix=".tmp")
+        with os.fdopen(descriptor, "w") as temporary_file:
+            json.dump(manifest, temporary_file)
+        os.replace(temporary_path, os.path.join(path, MANIFEST))
+
+        # Keys replaced by the previous merge; processes which mapped them
+        # keep their pages.
+        for name in deleted:
+            shutil.rmtree(os.path.join(path, name), ignore_errors=True)
+
+    @staticmethod
+    def _manifest(path: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(os.path.join(path, MANIFEST)) as manifest_file:
+                return json.load(manifest_file)
+        except FileNotFoundError:
+            return None
+
+    def refresh(self) -> bool:
+        """
+        Loads the deltas, or the merged values, written to the saved index
+        since it was last read. Keys already loaded are kept.
+        """
+        if self.path is None:
+            return False
+        with self._lock:
+            while True:
+                manifest_stat = os.stat(os.path.join(self.path, MANIFEST))
+                # The manifest is replaced, never rewritten, by writers.
+                modified = (manifest_stat.st_ino, manifest_stat.st_mtime_ns)
+                if modified == self.modified:
+                    return False
+
+                manifest = self._manifest(self.path)
+                kind = manifest["kind"]
+                try:
+                    names = {
+                        name: self.names.get(name) or _load_keys(self.path, kind, name)
+                        for name in _manifest_names(manifest)
+                    }
+                except FileNotFoundError:
+                    # Keys deleted by a writer since the manifest was read.
+                    if self._manifest(self.path) == manifest:
+                        raise
+                    continue
+                break
+
+            self.state = (
+                kind,
+                names[manifest["base"]],
+                [
+                    tuple(names[name] if name else None for name in delta)
+                    for delta in manifest["deltas"]
+                ],
+                manifest["length"],
+            )
+            self.names = names
+            self.modified = modified
+            return True
+
+    def update(
+        self, added: Optional[Iterable] = None, removed: Optional[Iterable] = None
+    ) -> None:
+        """
+        Removes, then adds, values. A saved index appends them as a delta
+        rather than rewriting its values, which are merged once MAX_DELTAS
+        deltas are pending, so that other processes can refresh.
+        """
+        if self.path is None:
+            self._update(added, removed)
+            return
+
+        with _locked(self.path):
+            # Deltas of other writers are read under the lock, so none is lost.
+            self.refresh()
+            self._update(added, removed)
+        self.refresh()
+
+    def _update(self, added: Optional[Iterable], removed: Optional[Iterable]) -> None:
+        kind, base, deltas, length = self.state
+
+        removed = _as_index_keys(kind, removed) if removed is not None else None
+        added = _as_index_keys(kind, added) if added is not None else None
+        if removed is not None:
+            length -= int(self.contains(removed.values()).sum())
+        if added is not None:
+            present = self.contains(added.values())
+            if removed is not None:
+                present &= ~removed.contains(added.values())
+            length += int((~present).sum())
+
+        delta = (
+            added if added is not None and len(added) else None,
+            removed if removed is not None and len(removed) else None,
+        )
+        if all(keys is None for keys in delta):
+            return
+
+        with self._lock:
+            self.state = (kind, base, deltas + [delta], length)
+
+        if len(deltas) + 1 >= MAX_DELTAS:
+            if self.path is not None:
+                self._save(self.path)
+            else:
+                self.state = (kind, KEYS[kind].from_keys(self.values), [], length)
+            return
+        if self.path is None:
+            return
+
+        with self._lock:
+            names = {id(keys): name for name, keys in self.names.items()}
+            self._write(
+                self.path,
+                kind,
+                names[id(base)],
+                [
+                    tuple(
+                        None
+                        if keys is None
+                        else names.get(id(keys)) or _save_keys(self.path, keys)
+                        for keys in delta
+                    )
+                    for delta in self.state[2]
+                ],
+                length,
+            )
+
+    def contains(self, values: Any) -> np.ndarray:
+        # A single read, in case a refresh replaces the state meanwhile.
+        kind, base, deltas, _ = self.state
+        values = np.asarray(values)
+        if kind == STRINGS or values.dtype.kind == "O":
+            # Keys are built and searched once per distinct value.
+            codes, uniques = pd.factorize(values, use_na_sentinel=False)
+            return self._contains(kind, base, deltas, uniques)[codes]
+        return self._contains(kind, base, deltas, values)
+
+    @staticmethod
+    def _contains(kind: str, base, deltas, values: np.ndarray) -> np.ndarray:
+        keys = _as_keys(kind, values)
+
+        found = base.contains(keys)
+        for added, removed in deltas:
+            if removed is not None:
+                found &= ~removed.contains(keys)
+            if added is not None:
+                found |= added.contains(keys)
+        return found
@@ -0,0 +1,122 @@
+"""
+Columnar export of evaluations, with one row per (column, validator).
+"""
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from pandantic import evaluations, validations
+
+try:
+    import pyarrow as pa
+except ImportError:  # pragma: no cover
+    pa = None
+
+
+def _report_schema() -> "pa.Schema":
+    dictionary = pa.dictionary(pa.int32(), pa.string())
+    return pa.schema(
+        [
+            ("evaluation", dictionary),
+            ("column", dictionary),
+            ("kind", dictionary),
+            ("position", pa.int16()),
+            ("validator", dictionary),
+            ("status", dictionary),
+            ("mandatory", pa.bool_()),
+            ("valid", pa.bool_()),
+            ("amended", pa.bool_()),
+            ("original_issues", pa.int64()),
+            ("pending_issues", pa.int64()),
+            ("elapsed", pa.float64()),
+        ]
+    )
+
+
+def _kind(column_evaluation: evaluations.ColumnEvaluation) -> str:
+    if isinstance(column_evaluation, evaluations.MissingColumn):
+        return "missing"
+    if isinstance(column_evaluation, evaluations.UnhandledColumn):
+        return "unhandled"
+    if isinstance(column_evaluation, evaluations.FrameEvaluation):
+        return "frame"
+    return "column"
+
+
+def _status(validation: validations.Validation) -> str:
+    if isinstance(validation, validations.ValidationError):
+        return "error"
+    if isinstance(validation, validations.SuspendedValidation):
+        return "suspended"
+    return "evaluated"
+
+
+def _evaluation_items(
+    evaluation: NamedTuple,
+) -> Tuple[str, List[Tuple[str, evaluations.ColumnEvaluation]]]:
+    if isinstance(evaluation, evaluations.SchemaEvaluation):
+        return evaluation.name, list(evaluation.items())
+    return type(evaluation).__name__, list(zip(evaluation._fields, evaluation))
+
+
+def to_records(evaluation: NamedTuple) -> Dict[str, List[Any]]:
+    evaluation_name, evaluation_items = _evaluation_items(evaluation)
+    records = {field.name: [] for field in _report_schema()}
+
+    def append(column_name, kind, position, validation: Optional[Any]) -> None:
+        records["evaluation"].append(evaluation_name)
+        records["column"].append(column_name)
+        records["kind"].append(kind)
+        records["position"].append(position)
+        if validation is None:
+            for field in (
+                "validator",
+                "status",
+                "mandatory",
+                "valid",
+                "amended",
+                "original_issues",
+                "pending_issues",
+                "elapsed",
+            ):
+                records[field].append(None)
+            return
+        records["validator"].append(validation.description)
+        records["status"].append(_status(validation))
+        records["mandatory"].append(validation.mandatory)
+        records["valid"].append(validation.valid)
+        records["amended"].append(validation.amended)
+        records["original_issues"].append(validation.original_issues)
+        records["pending_issues"].append(validation.pending_issues)
+        records["elapsed"].append(validation.elapsed)
+
+    for column_name, column_evaluation in evaluation_items:
+        kind = _kind(column_evaluation)
+        if column_evaluation.validation_set is None:
+            append(column_name, kind, None, None)
+            continue
+        for position, validation in enumerate(column_evaluation.validation_set):
+            append(column_name, kind, position, validation)
+
+    return records
+
+
+def to_arrow(evaluation: NamedTuple) -> "pa.Table":
+    """
+    Builds a pyarrow Table from an evaluation returned by
+    DataFrameModel.evaluate, suitable to append to a parquet history.
+    """
+    if pa is None:
+        raise ImportError("pyarrow is required to export evaluations to Arrow.")
+
+    schema = _report_schema()
+    records = to_records(evaluation)
+
+    arrays = []
+    for field in schema:
+        if pa.types.is_dictionary(field.type):
+            arrays.append(
+                pa.array(records[field.name], type=pa.string()).dictionary_encode()
+            )
+        else:
+            arrays.append(pa.array(records[field.name], type=field.type))
+
+    return pa.Table.from_arrays(arrays, schema=schema)
@@ -2,15 +2,42 @@
 Declares the base schema to evaluate and process pandas DataFrames.
 """
 import abc
-from typing import Dict, List, NamedTuple, Tuple
+import contextlib
+import time
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
 
+import numpy as np
 import pandas as pd
 from collections import namedtuple
 
-from pandantic import columns, evaluations
+from pandantic import (
+    chunked,
+    columns,
+    evaluations,
+    frame_validators,
+    memory,
+    metrics,
+    partitioned,
+    shared,
+    validations,
+    validators,
+)
 
 
 class DataFrameModel(abc.ABC):
+
+    rejection_reason_column = "rejection_reason"
+
     def __init__(self) -> None:
         all_attributes = dir(self)
         column_attributes = [
@@ -21,40 +48,349 @@ class DataFrameModel(abc.ABC):
         column_attributes = dict(column_attributes)
         self.columns = column_attributes
 
+        frame_validator_attributes = [
+            (attr, getattr(self, attr))
+            for attr in all_attributes
+            if isinstance(getattr(self, attr), frame_validators.FrameValidator)
+        ]
+        self.frame_validators = dict(frame_validator_attributes)
+
+        # Frozen declarations make evaluate reentrant: concurrent evaluations
+        # of this instance only share read-only state.
+        for declaration in list(self.columns.values()) + list(
+            self.frame_validators.values()
+        ):
+            declaration.freeze()
+
     def evaluate(
-        self, dataframe: pd.DataFrame, name: str, warn: bool = True
+        self,
+        dataframe: pd.DataFrame,
+        name: str,
+        warn: bool = True,
+        wide: bool = False,
+        processes: Optional[int] = None,
+        memory_limit: Optional[Union[int, str]] = None,
     ) -> Tuple[pd.DataFrame, NamedTuple]:
+        """
+        With wide=True, meant for frames with thousands of columns, the output
+        frame is built once from the evaluated columns and the evaluation is a
+        SchemaEvaluation mapping instead of a namedtuple. With processes, the
+        columns are evaluated by that many worker processes over shared memory.
+        With memory_limit (bytes, or a size such as "4GB"), columns whose
+        estimated evaluation peak exceeds it are evaluated in row blocks; the
+        limit excludes the input and output frames.
+        """
         if not name or name is None:
             raise ValueError("name should be correctly declared.")
 
-        dataframe = dataframe.copy()
+        if memory_limit is not None:
+            memory_limit = memory.parse_size(memory_limit)
+            if processes is not None or partitioned.is_dask_frame(dataframe):
+                raise ValueError(
+                    "memory_limit only applies to in-process pandas evaluations."
+                )
 
-        original_column_names = list(dataframe.columns)
-        dataframe.columns = self.transform_column_names(dataframe)
+        if partitioned.is_dask_frame(dataframe):
+            with self._recording_errors(0):
+                return partitioned.evaluate_dask(self, dataframe, name, warn)
+
+        if processes is not None:
+            with self._recording_errors(len(dataframe)):
+                return shared.evaluate_shared(self, dataframe, name, warn, processes)
+
+        started = time.perf_counter()
+        with self._recording_errors(len(dataframe)):
+            # The wide path never writes into the frame, so it is not copied.
+            dataframe = dataframe.copy(deep=not wide)
+
+            original_column_names = list(dataframe.columns)
+            dataframe.columns = self.transform_column_names(dataframe)
+
+            missing_columns, remaining_columns = self.check_columns(dataframe)
+
+            if wide:
+                dataframe, evaluation_data = self.evaluate_wide_columns(
+                    dataframe, missing_columns, memory_limit
+                )
+            else:
+                dataframe, evaluation_data = self.evaluate_columns(
+                    dataframe, missing_columns, memory_limit
+                )
+
+            dataframe.columns = original_column_names
+
+            evaluation = self.build_evaluation(
+                name,
+                evaluation_data,
+                missing_columns,
+                remaining_columns,
+                warn,
+                wide=wide,
+                rows=len(dataframe),
+                started=started,
+            )
+
+        return dataframe, evaluation
+
+    def evaluate_chunks(
+        self,
+        chunks: Iterable[chunked.Chunk],
+        name: str,
+        warn: bool = True,
+        checkpoint: Optional[str] = None,
+        on_chunk: Optional[Callable[[int, pd.DataFrame], None]] = None,
+    ) -> NamedTuple:
+        """
+        Evaluates an iterable of DataFrame chunks, chunk loaders or chunk
+        paths into a single evaluation, resumable from the checkpoint file
+        when given (see chunked).
+        """
+        if not name or name is None:
+            raise ValueError("name should be correctly declared.")
 
-        declared_columns = self.get_columns()
-        missing_columns, remaining_columns = self.check_columns(dataframe)
+        with self._recording_errors(0):
+            return chunked.evaluate_chunks(
+                self, chunks, name, warn, checkpoint, on_chunk
+            )
+
+    def evaluate_split(
+        self, dataframe: pd.DataFrame, name: str, warn: bool = True
+    ) -> Tuple[pd.DataFrame, pd.DataFrame, NamedTuple]:
+        """
+        Evaluates the DataFrame and sets apart the rows failing any mandatory
+        validation instead of raising SchemaEvaluationException. Failing
+        row-wise validators do not suspend the following ones; other failures
+        reject every row. Returns the valid rows, the rejected rows with the
+        reason of their first failure, and the evaluation.
+        """
+        if not name or name is None:
+            raise ValueError("name should be correctly declared.")
+
+        started = time.perf_counter()
+        with self._recording_errors(len(dataframe)):
+            dataframe = dataframe.copy()
+
+            original_column_names = list(dataframe.columns)
+            dataframe.columns = self.transform_column_names(dataframe)
+
+            missing_columns, remaining_columns = self.check_columns(dataframe)
+
+            rejections = RowRejections(len(dataframe))
+            evaluation_data = dict()
+            for column_name, column_declaration in self.get_columns().items():
+                if column_name in missing_columns:
+                    evaluation_data[column_name] = evaluations.MissingColumn()
+                    continue
+
+                column = dataframe.loc[:, column_name].copy()
+                validation_set = validations.ValidationSet()
+                for (
+                    validator,
+                    evaluated,
+                    column,
+                    validation,
+                    failure_mask,
+                ) in column_declaration.column_validators.iter_quarantine(column):
+                    validation_set.add_validation(validation)
+                    rejections.add(
+                        column_name, validator, evaluated, validation, failure_mask
+                    )
+
+                dataframe.loc[:, column_name] = column
+                evaluation_data[column_name] = evaluations.ColumnEvaluation(
+                    validation_set
+                )
+
+            for validator_name, frame_validator in self.get_frame_validators().items():
+                evaluated = dataframe
+                failure_mask = None
+                try:
+                    (
+                        dataframe,
+                        validation,
+                        failure_mask,
+                    ) = frame_validator.evaluate_failures(
+                        dataframe, failure_mask=frame_validator.mandatory
+                    )
+                except validations.ValidationError as error:
+                    validation = error
+                rejections.add(
+                    validator_name, frame_validator, evaluated, validation, failure_mask
+                )
+                validation_set = validations.ValidationSet()
+                validation_set.add_validation(validation)
+                evaluation_data[validator_name] = evaluations.FrameEvaluation(
+                    validation_set
+                )
+
+            dataframe.columns = original_column_names
 
-        dataframe_evaluation = namedtuple(
-            name, list(declared_columns.keys()) + remaining_columns
+            evaluation = self.build_evaluation(
+                name,
+                evaluation_data,
+                missing_columns,
+                remaining_columns,
+                warn,
+                raise_invalid=False,
+                rows=len(dataframe),
+                started=started,
+            )
+
+        valid_dataframe, rejected_dataframe = rejections.split(
+            dataframe, self.rejection_reason_column
+        )
+
+        return valid_dataframe, rejected_dataframe, evaluation
+
+    def estimate_memory(self, dataframe: pd.DataFrame) -> Dict[str, int]:
+        """
+        Estimated peak bytes of the evaluation of every declared column of the
+        DataFrame, including column copies, masks and amendments.
+        """
+        dataframe = dataframe.copy(deep=False)
+        dataframe.columns = self.transform_column_names(dataframe)
+        return {
+            column_name: memory.estimate_peak(
+                column_declaration.column_validators, dataframe[column_name]
+            )
+            for column_name, column_declaration in self.get_columns().items()
+            if column_name in dataframe.columns
+        }
+
+    def evaluate_column(
+        self,
+        column_declaration: columns.Column,
+        column: pd.Series,
+        memory_limit: Optional[int] = None,
+    ) -> Tuple[pd.Series, evaluations.ColumnEvaluation]:
+        rows_per_block = (
+            memory.rows_per_block(
+                column_declaration.column_validators, column, memory_limit
+            )
+            if memory_limit is not None
+            else None
         )
+        if rows_per_block is None:
+            return column_declaration.evaluate(column)
+        return column_declaration.evaluate_blocks(column, rows_per_block)
 
+    def evaluate_columns(
+        self,
+        dataframe: pd.DataFrame,
+        missing_columns: List,
+        memory_limit: Optional[int] = None,
+    ) -> Tuple[pd.DataFrame, Dict[str, evaluations.ColumnEvaluation]]:
+        missing_columns = set(missing_columns)
         evaluation_data = dict()
-        for column_name, column_declaration in declared_columns.items():
+        for column_name, column_declaration in self.get_columns().items():
             if column_name not in missing_columns:
+                started = time.perf_counter()
                 column = dataframe.loc[:, column_name]
-                result_column, column_evaluation = column_declaration.evaluate(column)
+                result_column, column_evaluation = self.evaluate_column(
+                    column_declaration, column, memory_limit
+                )
                 dataframe.loc[:, column_name] = result_column
+                metrics.record_column(
+                    type(self).__name__, column_name, time.perf_counter() - started
+                )
             else:
                 column_evaluation = evaluations.MissingColumn()
             evaluation_data[column_name] = column_evaluation
 
+        for validator_name, frame_validator in self.get_frame_validators().items():
+            dataframe, frame_evaluation = self.evaluate_frame_validator(
+                dataframe, frame_validator
+            )
+            evaluation_data[validator_name] = frame_evaluation
+
+        return dataframe, evaluation_data
+
+    def evaluate_wide_columns(
+        self,
+        dataframe: pd.DataFrame,
+        missing_columns: List,
+        memory_limit: Optional[int] = None,
+    ) -> Tuple[pd.DataFrame, Dict[str, evaluations.ColumnEvaluation]]:
+        """
+        Evaluates the declared columns without writing them back one by one:
+        the output frame is assembled in a single construction.
+        """
+        positions = {
+            column_name: position
+            for position, column_name in enumerate(dataframe.columns)
+        }
+        missing_columns = set(missing_columns)
+
+        result_columns = dict()
+        evaluation_data = dict()
+        for column_name, column_declaration in self.get_columns().items():
+            if column_name in missing_columns:
+                evaluation_data[column_name] = evaluations.MissingColumn()
+                continue
+
+            started = time.perf_counter()
+            position = positions[column_name]
+            (
+                result_columns[position],
+                evaluation_data[column_name],
+            ) = self.evaluate_column(
+                column_declaration, dataframe.iloc[:, position], memory_limit
+            )
+            metrics.record_column(
+                type(self).__name__, column_name, time.perf_counter() - started
+            )
+
+        if result_columns:
+            output_columns = [
+                columns.as_series(result_columns[position], dataframe.iloc[:, position])
+                if position in result_columns
+                else dataframe.iloc[:, position]
+                for position in range(len(dataframe.columns))
+            ]
+            output = pd.concat(output_columns, axis=1, ignore_index=True)
+            output.columns = dataframe.columns
+            dataframe = output
+        else:
+            dataframe = dataframe.copy()
+
+        for validator_name, frame_validator in self.get_frame_validators().items():
+            dataframe, frame_evaluation = self.evaluate_frame_validator(
+                dataframe, frame_validator
+            )
+            evaluation_data[validator_name] = frame_evaluation
+
+        return dataframe, evaluation_data
+
+    def build_evaluation(
+        self,
+        name: str,
+        evaluation_data: Dict[str, evaluations.ColumnEvaluation],
+        missing_columns: List,
+        remaining_columns: List,
+        warn: bool = True,
+        raise_invalid: bool = True,
+        wide: bool = False,
+        rows: int = 0,
+        started: Optional[float] = None,
+    ) -> NamedTuple:
+        """
+        With started, the time.perf_counter() value at which the evaluation
+        began, the evaluation of rows rows is recorded in the metrics along
+        with its result.
+        """
         for column_name in remaining_columns:
             evaluation_data[column_name] = evaluations.UnhandledColumn()
 
-        dataframe.columns = original_column_names
-
-        evaluation = dataframe_evaluation(**evaluation_data)
+        if wide:
+            evaluation = evaluations.SchemaEvaluation(name, evaluation_data)
+        else:
+            dataframe_evaluation = namedtuple(
+                name,
+                list(self.get_columns().keys())
+                + list(self.get_frame_validators().keys())
+                + remaining_columns,
+            )
+            evaluation = dataframe_evaluation(**evaluation_data)
 
         all_valid = all(
             [
@@ -63,17 +399,26 @@ class DataFrameModel(abc.ABC):
                 if _eval.valid is not None
             ]
         )
-        if not all_valid:
-            raise SchemaEvaluationException(
-                "There is invalid columns.", evaluation=evaluation
-            )
-
         warning_columns = []
         for column_name, column_eval in evaluation_data.items():
             if column_eval.warnings and column_eval.warnings is not None:
                 warning_columns.append(column_name)
+        warned = warn and bool(missing_columns or remaining_columns or warning_columns)
 
-        if warn and (missing_columns or remaining_columns or warning_columns):
+        if started is not None:
+            metrics.record_schema(
+                type(self).__name__,
+                rows,
+                time.perf_counter() - started,
+                "invalid" if not all_valid else "warning" if warned else "valid",
+            )
+
+        if not all_valid and raise_invalid:
+            raise SchemaEvaluationException(
+                "There is invalid columns.", evaluation=evaluation
+            )
+
+        if warned:
             raise SchemaEvaluationWarning(
                 f"There is {len(missing_columns)} missing columns, {len(remaining_columns)} remaining columns and {len(warning_columns)} invalid non-mandatory evaluated columns.",
                 missing_columns=missing_columns,
@@ -81,7 +426,22 @@ class DataFrameModel(abc.ABC):
                 warning_columns=warning_columns,
             )
 
-        return dataframe, evaluation
+        return evaluation
+
+    @contextlib.contextmanager
+    def _recording_errors(self, rows: int) -> Iterator[None]:
+        # Evaluations record their result in build_evaluation; this records
+        # those interrupted by any other error.
+        started = time.perf_counter()
+        try:
+            yield
+        except (SchemaEvaluationException, SchemaEvaluationWarning):
+            raise
+        except Exception:
+            metrics.record_schema(
+                type(self).__name__, rows, time.perf_counter() - started, "error"
+            )
+            raise
 
     def transform_column_names(self, dataframe: pd.DataFrame) -> List:
         return list(dataframe.columns)
@@ -90,14 +450,91 @@ class DataFrameModel(abc.ABC):
         expected_cols = list(self.get_columns().keys())
         observed_cols = list(dataframe.columns)
 
-        missing_cols = [col for col in expected_cols if col not in observed_cols]
-        remaining_cols = [col for col in observed_cols if col not in expected_cols]
+        expected_set, observed_set = set(expected_cols), set(observed_cols)
+        missing_cols = [col for col in expected_cols if col not in observed_set]
+        remaining_cols = [col for col in observed_cols if col not in expected_set]
 
         return missing_cols, remaining_cols
 
     def get_columns(self) -> Dict[str, columns.Column]:
         return self.columns
 
+    def get_frame_validators(self) -> Dict[str, frame_validators.FrameValidator]:
+        return self.frame_validators
+
+    def evaluate_frame_validator(
+        self, dataframe: pd.DataFrame, frame_validator: frame_validators.FrameValidator
+    ) -> Tuple[pd.DataFrame, evaluations.FrameEvaluation]:
+        validation_set = validations.ValidationSet()
+        try:
+            dataframe, validation = frame_validator.evaluate(dataframe)
+        except validations.ValidationError as error:
+            validation = error
+        validation_set.add_validation(validation)
+
+        return dataframe, evaluations.FrameEvaluation(validation_set)
+
+
+class RowRejections:
+    """
+    Combined failure mask of the mandatory validations of an evaluation,
+    keeping the first failing reason of every row.
+    """
+
+    def __init__(self, row_count: int) -> None:
+        self.rejected = np.zeros(row_count, dtype=bool)
+        self.reason_codes = np.full(row_count, -1, dtype=np.int32)
+        self.reasons = dict()
+
+    def add(
+        self,
+        name: str,
+        validator: validators.Validator,
+        evaluated,
+        validation: validations.Validation,
+        failure_mask: Optional[np.ndarray] = None,
+    ) -> None:
+        """
+        Rejects the failing rows of a failed mandatory validation, given the
+        failure mask of the evaluation when there is one; it is computed
+        otherwise (validations proven from the column metadata), and every
+        row is rejected when the validator does not fail row by row.
+        """
+        if (
+            not validator.mandatory
+            or validation.valid
+            or isinstance(validation, validations.SuspendedValidation)
+        ):
+            return
+
+        if (
+            failure_mask is None
+            and validator.row_wise
+            and not isinstance(validation, validations.ValidationError)
+        ):
+            failure_mask = validator.failure_mask(evaluated)
+        if failure_mask is None:
+            failure_mask = np.ones(len(self.rejected), dtype=bool)
+
+        reason = f"{name}: {validator.description}"
+        reason_code = self.reasons.setdefault(reason, len(self.reasons))
+
+        self.reason_codes[failure_mask & ~self.rejected] = reason_code
+        self.rejected |= failure_mask
+
+    def split(
+        self, dataframe: pd.DataFrame, reason_column: str
+    ) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        rejected_positions = np.flatnonzero(self.rejected)
+        valid_dataframe = dataframe.take(np.flatnonzero(~self.rejected))
+        rejected_dataframe = dataframe.take(rejected_positions)
+
+        rejected_dataframe[reason_column] = pd.Categorical.from_codes(
+            self.reason_codes[rejected_positions], categories=list(self.reasons)
+        )
+
+        return valid_dataframe, rejected_dataframe
+
 
 class SchemaEvaluationWarning(UserWarning):
     missing_columns: List
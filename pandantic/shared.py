@@ -0,0 +1,424 @@
+"""
+Evaluation of DataFrames in a process pool, over column buffers placed once
+in shared memory instead of being pickled to every worker.
+"""
+import concurrent.futures
+import functools
+import time
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from pandantic import columns, summaries
+
+try:
+    import pyarrow as pa
+except ImportError:  # pragma: no cover
+    pa = None
+
+# Numpy kinds whose values are plain fixed-width buffers.
+BUFFER_KINDS = "biufcmM"
+
+_WORKER_SCHEMA = None
+
+
+def _is_arrow_dtype(dtype: Any) -> bool:
+    if isinstance(dtype, pd.ArrowDtype):
+        return True
+    return isinstance(dtype, pd.StringDtype) and dtype.storage == "pyarrow"
+
+
+def _create_block(size: int) -> shared_memory.SharedMemory:
+    # Empty blocks are not allowed.
+    return shared_memory.SharedMemory(create=True, size=max(size, 1))
+
+
+def _close(block: shared_memory.SharedMemory) -> None:
+    try:
+        block.close()
+    except BufferError:
+        # Views of the block may outlive an error; the mapping is released
+        # when they are collected.
+        pass
+
+
+class SharedColumn:
+    """
+    Picklable handle to the values of a column. Numpy buffers and Arrow IPC
+    streams live in a shared memory block and are mapped without copy by
+    the receiving process; other dtypes travel pickled with the handle.
+    """
+
+    __slots__ = ("block_name", "storage", "dtype", "length", "offset", "values")
+
+    def __init__(
+        self,
+        block_name: Optional[str],
+        storage: str,
+        dtype: Any,
+        length: int,
+        offset: int = 0,
+        values: Any = None,
+    ) -> None:
+        self.block_name = block_name
+        self.storage = storage
+        self.dtype = dtype
+        self.length = length
+        self.offset = offset
+        self.values = values
+
+    @classmethod
+    def share(
+        cls, column: pd.Series, blocks: List[shared_memory.SharedMemory]
+    ) -> "SharedColumn":
+        """
+        Places the column values in a new block, appended to blocks so that
+        the caller closes it and, when owning it, unlinks it.
+        """
+        dtype = column.dtype
+
+        if isinstance(dtype, np.dtype) and dtype.kind in BUFFER_KINDS:
+            values = column.to_numpy()
+            block = _create_block(values.nbytes)
+            blocks.append(block)
+            np.ndarray(values.shape, dtype, buffer=block.buf)[:] = values
+            return cls(block.name, "numpy", dtype, len(values))
+
+        if pa is not None and _is_arrow_dtype(dtype):
+            table = pa.table({"values": column.array})
+            size_stream = pa.MockOutputStream()
+            with pa.ipc.new_stream(size_stream, table.schema) as writer:
+                writer.write_table(table)
+
+            block = _create_block(size_stream.size())
+            blocks.append(block)
+            stream = pa.FixedSizeBufferWriter(pa.py_buffer(block.buf))
+            with pa.ipc.new_stream(stream, table.schema) as writer:
+                writer.write_table(table)
+            return cls(block.name, "arrow", dtype, len(column))
+
+        return cls(None, "pickled", dtype, len(column), values=column.array)
+
+    def part(self, start: int, stop: int) -> "SharedColumn":
+        """
+        Handle to the rows between start and stop of the same values.
+        """
+        if self.storage == "pickled":
+            return SharedColumn(
+                None,
+                self.storage,
+                self.dtype,
+                stop - start,
+                values=self.values[start:stop],
+            )
+        return SharedColumn(
+            self.block_name,
+            self.storage,
+            self.dtype,
+            stop - start,
+            self.offset + start,
+        )
+
+    def open(
+        self, copy: bool = False
+    ) -> Tuple[pd.Series, Optional[shared_memory.SharedMemory]]:
+        """
+        Returns the column, viewing the shared block when there is one unless
+        copy is set. The block must be closed once the view is released.
+        """
+        if self.storage == "pickled":
+            return pd.Series(self.values), None
+
+        block = shared_memory.SharedMemory(self.block_name)
+
+        if self.storage == "numpy":
+            values = np.ndarray(
+                (self.length,),
+                self.dtype,
+                buffer=block.buf,
+                offset=self.offset * self.dtype.itemsize,
+            )
+            return pd.Series(values, copy=copy), block
+
+        values = (
+            pa.ipc.open_stream(pa.py_buffer(block.buf))
+            .read_all()
+            .column("values")
+            .slice(self.offset, self.length)
+        )
+        if copy:
+            # Arrow arrays are immutable, so pandas copies still share buffers.
+            values = pa.chunked_array(
+                [pa.concat_arrays(values.chunks)] if values.num_chunks else [],
+                values.type,
+            )
+        if isinstance(self.dtype, pd.StringDtype):
+            array = pd.arrays.ArrowStringArray(values)
+        else:
+            array = pd.arrays.ArrowExtensionArray(values)
+        return pd.Series(array, copy=False), block
+
+    def read(self) -> pd.Series:
+        """
+        Copies the column out of the shared block.
+        """
+        column, block = self.open(copy=True)
+        if block is not None:
+            _close(block)
+        return column
+
+
+def _initialize_worker(schema) -> None:
+    global _WORKER_SCHEMA  # pylint: disable=global-statement
+    _WORKER_SCHEMA = schema
+
+
+def _evaluate_rows(
+    column_name: str,
+    shared_column: SharedColumn,
+    phase: Optional[summaries.Phase] = None,
+    decision: Optional[summaries.Decision] = None,
+) -> Tuple[summaries.ColumnSummary, Optional[SharedColumn]]:
+    """
+    Summary and amended rows of a row range evaluated over the phase, given
+    its decision. A task covering the whole column (phase None) evaluates
+    every validator as evaluate does and is never merged, so its summary
+    only holds counts.
+    """
+    validator_set = _WORKER_SCHEMA.get_columns()[column_name].column_validators
+
+    column, block = shared_column.open()
+    try:
+        if phase is None:
+            amended_column, column_summary = summaries.summarize_column(
+                validator_set, column, states=False
+            )
+        else:
+            amended_column, column_summary = summaries.summarize_phase(
+                list(validator_set), column, phase, decision
+            )
+
+        amended = None
+        if column_summary.amended:
+            amended_blocks = []
+            amended = SharedColumn.share(
+                columns.as_series(amended_column, column), amended_blocks
+            )
+            for amended_block in amended_blocks:
+                # The parent process unlinks the block once it has read it, so
+                # the worker must neither unlink it again nor report it leaked.
+                resource_tracker.unregister(
+                    amended_block._name,  # pylint: disable=protected-access
+                    "shared_memory",
+                )
+                _close(amended_block)
+        del amended_column, column
+    finally:
+        if block is not None:
+            _close(block)
+
+    return column_summary, amended
+
+
+def _row_ranges(row_count: int, rows_per_task: Optional[int]) -> List[Tuple[int, int]]:
+    if not rows_per_task or row_count <= rows_per_task:
+        return [(0, row_count)]
+    return [
+        (start, min(start + rows_per_task, row_count))
+        for start in range(0, row_count, rows_per_task)
+    ]
+
+
+def _release(amended: SharedColumn) -> None:
+    if amended.block_name is not None:
+        block = shared_memory.SharedMemory(amended.block_name)
+        _close(block)
+        block.unlink()
+
+
+def _read_amended(amended: SharedColumn) -> pd.Series:
+    column = amended.read()
+    _release(amended)
+    return column
+
+
+def _evaluate_columns(
+    schema,
+    executor: concurrent.futures.Executor,
+    shared_columns: Dict[str, SharedColumn],
+    row_ranges: List[Tuple[int, int]],
+    amended_parts: Dict[str, List[Optional[SharedColumn]]],
+) -> Dict[str, summaries.ColumnSummary]:
+    """
+    Summaries of the columns evaluated by the executor, filling amended_parts
+    with the amended rows of each range. Row ranges are evaluated phase by
+    phase (see summaries), the phases of every column at once.
+    """
+    column_phases = {
+        column_name: summaries.phases(summaries.validator_list(schema, column_name))
+        if len(row_ranges) > 1
+        else [None]
+        for column_name in shared_columns
+    }
+    column_summaries = {
+        column_name: summaries.ColumnSummary(
+            [None] * len(summaries.validator_list(schema, column_name))
+        )
+        for column_name in shared_columns
+    }
+
+    for position in range(max(map(len, column_phases.values()), default=0)):
+        futures = dict()
+        for column_name, shared_column in shared_columns.items():
+            if position >= len(column_phases[column_name]):
+                continue
+
+            phase, decision = column_phases[column_name][position], None
+            if phase is not None:
+                validator_list = summaries.validator_list(schema, column_name)
+                decision = column_summaries[column_name].decide(validator_list, phase)
+                skipped = summaries.skipped_summary(validator_list, phase, decision)
+                if skipped is not None:
+                    column_summaries[column_name] = column_summaries[
+                        column_name
+                    ].update(skipped)
+                    continue
+
+            futures[column_name] = [
+                executor.submit(
+                    _evaluate_rows,
+                    column_name,
+                    amended if amended is not None else shared_column.part(start, stop),
+                    phase,
+                    decision,
+                )
+                for amended, (start, stop) in zip(
+                    amended_parts[column_name], row_ranges
+                )
+            ]
+
+        for column_name, range_futures in futures.items():
+            results = [future.result() for future in range_futures]
+            validator_list = summaries.validator_list(schema, column_name)
+            column_summaries[column_name] = column_summaries[column_name].update(
+                functools.reduce(
+                    lambda summary, other_summary: summary.merge(
+                        other_summary, validator_list
+                    ),
+                    [column_summary for column_summary, _ in results],
+                )
+            )
+            for range_position, (_, amended) in enumerate(results):
+                if amended is None:
+                    continue
+                if amended_parts[column_name][range_position] is not None:
+                    _release(amended_parts[column_name][range_position])
+                amended_parts[column_name][range_position] = amended
+
+    return column_summaries
+
+
+def evaluate_shared(
+    schema,
+    dataframe: pd.DataFrame,
+    name: str,
+    warn: bool = True,
+    processes: Optional[int] = None,
+    rows_per_task: Optional[int] = None,
+    mp_context: Any = None,
+) -> Tuple[pd.DataFrame, NamedTuple]:
+    """
+    Evaluates the declared columns in a process pool. Every column is shared
+    once; workers evaluate whole columns, or row ranges of rows_per_task
+    rows, and return validation summaries plus the amended rows, if any.
+    Frame validators are evaluated afterwards in the calling process.
+    """
+    started = time.perf_counter()
+    original_column_names = list(dataframe.columns)
+    dataframe = dataframe.copy(deep=False)
+    dataframe.columns = schema.transform_column_names(dataframe)
+
+    missing_columns, remaining_columns = schema.check_columns(dataframe)
+    missing = set(missing_columns)
+    column_names = [
+        column_name
+        for column_name in schema.get_columns()
+        if column_name not in missing
+    ]
+
+    row_ranges = _row_ranges(len(dataframe), rows_per_task)
+    amended_parts = {
+        column_name: [None] * len(row_ranges) for column_name in column_names
+    }
+    blocks = []
+    try:
+        shared_columns = {
+            column_name: SharedColumn.share(dataframe[column_name], blocks)
+            for column_name in column_names
+        }
+
+        with concurrent.futures.ProcessPoolExecutor(
+            processes,
+            mp_context=mp_context,
+            initializer=_initialize_worker,
+            initargs=(schema,),
+        ) as executor:
+            column_summaries = _evaluate_columns(
+                schema, executor, shared_columns, row_ranges, amended_parts
+            )
+
+        for column_name in column_names:
+            if all(amended is None for amended in amended_parts[column_name]):
+                continue
+
+            column = dataframe[column_name]
+            parts = []
+            for range_position, (start, stop) in enumerate(row_ranges):
+                amended = amended_parts[column_name][range_position]
+                if amended is None:
+                    parts.append(column.iloc[start:stop].reset_index(drop=True))
+                else:
+                    amended_parts[column_name][range_position] = None
+                    parts.append(_read_amended(amended))
+            amended_column = pd.concat(parts, ignore_index=True)
+            amended_column.index = dataframe.index
+            # Written back like evaluate_columns does, into a copy of the column
+            # since the frame shares its values with the caller's.
+            dataframe[column_name] = column.copy()
+            dataframe.loc[:, column_name] = amended_column
+    finally:
+        for block in blocks:
+            _close(block)
+            block.unlink()
+        for column_amended_parts in amended_parts.values():
+            for amended in column_amended_parts:
+                if amended is not None:
+                    _release(amended)
+
+    frame_summary = {
+        column_name: column_summaries[column_name]
+        if column_name not in missing
+        else None
+        for column_name in schema.get_columns()
+    }
+
+    for validator_name, frame_validator in schema.get_frame_validators().items():
+        dataframe, frame_summary[validator_name] = summaries.summarize_frame_validator(
+            frame_validator, dataframe
+        )
+
+    dataframe.columns = original_column_names
+
+    evaluation = schema.build_evaluation(
+        name,
+        summaries.evaluation_data(schema, frame_summary),
+        missing_columns,
+        remaining_columns,
+        warn,
+        rows=len(dataframe),
+        started=started,
+    )
+
+    return dataframe, evaluation
@@ -1,12 +1,12 @@
 """
 Shortcuts for validators instancing.
 """
-from typing import Literal, List, Union, Pattern, Optional
+from typing import Any, Dict, Literal, List, Union, Pattern, Optional, Tuple
 from numbers import Number
 
 import numpy as np
 
-from pandantic import validators
+from pandantic import frame_validators, references, sketches, validators
 
 
 def between_range(
@@ -99,3 +99,158 @@ def match_pattern(
     return validators.PatternValidator(
         pattern=pattern, mandatory=mandatory, description=description
     )
+
+
+def satisfies(
+    expression: str, mandatory: bool = None, description: str = None
+) -> frame_validators.ExpressionValidator:
+    return frame_validators.ExpressionValidator(
+        expression=expression, mandatory=mandatory, description=description
+    )
+
+
+def distinct_count_between(
+    min_count: Number,
+    max_count: Number,
+    mandatory: bool = None,
+    description: str = None,
+) -> validators.DistinctCountValidator:
+    return validators.DistinctCountValidator(
+        min_count=min_count,
+        max_count=max_count,
+        mandatory=mandatory,
+        description=description,
+    )
+
+
+def max_duplicate_rate(
+    max_rate: float, mandatory: bool = None, description: str = None
+) -> validators.DuplicateRateValidator:
+    return validators.DuplicateRateValidator(
+        max_rate=max_rate, mandatory=mandatory, description=description
+    )
+
+
+def in_reference(
+    reference: references.ReferenceIndex,
+    mandatory: bool = None,
+    description: str = None,
+) -> validators.ReferenceValidator:
+    return validators.ReferenceValidator(
+        reference=reference, mandatory=mandatory, description=description
+    )
+
+
+def has_length(
+    min_length: Number = 0,
+    max_length: Number = np.inf,
+    mandatory: bool = None,
+    description: str = None,
+) -> validators.LengthValidator:
+    return validators.LengthValidator(
+        min_length=min_length,
+        max_length=max_length,
+        mandatory=mandatory,
+        description=description,
+    )
+
+
+def quantile_between(
+    quantile: float,
+    min_value: Number = -np.inf,
+    max_value: Number = np.inf,
+    mandatory: bool = None,
+    description: str = None,
+) -> validators.QuantileValidator:
+    return validators.QuantileValidator(
+        quantile=quantile,
+        min_value=min_value,
+        max_value=max_value,
+        mandatory=mandatory,
+        description=description,
+    )
+
+
+def follows_histogram(
+    edges: List[Number],
+    expected: Union[List[float], sketches.FixedHistogram],
+    max_distance: float,
+    mandatory: bool = None,
+    description: str = None,
+) -> validators.HistogramValidator:
+    return validators.HistogramValidator(
+        edges=edges,
+        expected=expected,
+        max_distance=max_distance,
+        mandatory=mandatory,
+        description=description,
+    )
+
+
+def per_group(
+    by: Union[str, List[str]],
+    column: str,
+    validator: validators.Validator,
+    mandatory: bool = None,
+    description: str = None,
+) -> frame_validators.GroupedValidator:
+    return frame_validators.GroupedValidator(
+        by=by,
+        column=column,
+        validator=validator,
+        mandatory=mandatory,
+        description=description,
+    )
+
+
+def unique_per_group(
+    by: Union[str, List[str]],
+    column: str,
+    mandatory: bool = None,
+    description: str = None,
+) -> frame_validators.GroupUniqueValidator:
+    return frame_validators.GroupUniqueValidator(
+        by=by, column=column, mandatory=mandatory, description=description
+    )
+
+
+def non_null_ratio_per_group(
+    by: Union[str, List[str]],
+    column: str,
+    min_ratio: float,
+    mandatory: bool = None,
+    description: str = None,
+) -> frame_validators.GroupNonNullRatioValidator:
+    return frame_validators.GroupNonNullRatioValidator(
+        by=by,
+        column=column,
+        min_ratio=min_ratio,
+        mandatory=mandatory,
+        description=description,
+    )
+
+
+def between_range_per_group(
+    by: Union[str, List[str]],
+    column: str,
+    bounds: Dict[Any, Tuple[Number, Number]],
+    default: Optional[Tuple[Number, Number]] = None,
+    mandatory: bool = None,
+    description: str = None,
+) -> frame_validators.GroupRangeValidator:
+    return frame_validators.GroupRangeValidator(
+        by=by,
+        column=column,
+        bounds=bounds,
+        default=default,
+        mandatory=mandatory,
+        description=description,
+    )
+
+
+def unique_key(
+    columns: List[str], mandatory: bool = None, description: str = None
+) -> frame_validators.CompositeKeyValidator:
+    return frame_validators.CompositeKeyValidator(
+        columns=columns, mandatory=mandatory, description=description
+    )
@@ -0,0 +1,298 @@
+"""
+Fixed-memory, mergeable sketches summarizing columns that do not fit in memory.
+"""
+import math
+from typing import Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+
+def hash_values(column: Union[pd.Series, pd.DataFrame]) -> np.ndarray:
+    return pd.util.hash_pandas_object(column, index=False).to_numpy(dtype=np.uint64)
+
+
+def _leading_zeros(values: np.ndarray) -> np.ndarray:
+    values = values.copy()
+    zeros = np.zeros(len(values), dtype=np.uint8)
+    for bits in (32, 16, 8, 4, 2, 1):
+        upper_empty = (values >> np.uint64(64 - bits)) == 0
+        zeros[upper_empty] += bits
+        values[upper_empty] <<= np.uint64(bits)
+    return zeros
+
+
+class HyperLogLog:
+    """
+    HyperLogLog distinct counter over 64-bit hashes, using 2 ** precision
+    one-byte registers. Sketches with the same precision merge losslessly.
+    """
+
+    __slots__ = ("precision", "registers")
+
+    def __init__(self, precision: int = 14, registers: Optional[np.ndarray] = None):
+        if not 4 <= precision <= 18:
+            raise ValueError("precision must be between 4 and 18.")
+
+        self.precision = precision
+        self.registers = (
+            registers
+            if registers is not None
+            else np.zeros(2**precision, dtype=np.uint8)
+        )
+
+    @classmethod
+    def from_column(cls, column: pd.Series, precision: int = 14) -> "HyperLogLog":
+        sketch = cls(precision)
+        sketch.add(column)
+        return sketch
+
+    def add(self, column: pd.Series) -> None:
+        hashes = hash_values(column.dropna())
+        if not len(hashes):
+            return
+
+        precision = np.uint64(self.precision)
+        index = (hashes >> (np.uint64(64) - precision)).astype(np.intp)
+        # A sentinel bit bounds the rank when the remaining bits are all zero.
+        remaining = (hashes << precision) | (np.uint64(1) << (precision - np.uint64(1)))
+        rank = _leading_zeros(remaining) + np.uint8(1)
+
+        np.maximum.at(self.registers, index, rank)
+
+    def merge(self, other: "HyperLogLog") -> "HyperLogLog":
+        if self.precision != other.precision:
+            raise ValueError("Only sketches with the same precision can be merged.")
+        return HyperLogLog(self.precision, np.maximum(self.registers, other.registers))
+
+    @property
+    def relative_error(self) -> float:
+        return 1.04 / math.sqrt(len(self.registers))
+
+    def estimate(self) -> float:
+        registers_count = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / registers_count)
+        harmonic_sum = np.ldexp(1.0, -self.registers.astype(np.int64)).sum()
+        estimate = alpha * registers_count**2 / harmonic_sum
+
+        empty_registers = int(np.count_nonzero(self.registers == 0))
+        if estimate <= 2.5 * registers_count and empty_registers:
+            # Linear counting is more accurate for small cardinalities.
+            estimate = registers_count * math.log(registers_count / empty_registers)
+
+        return estimate
+
+    def bounds(self, z_score: float = 2.0) -> Tuple[float, float]:
+        estimate = self.estimate()
+        margin = z_score * self.relative_error * estimate
+        return max(estimate - margin, 0.0), estimate + margin
+
+
+_MASK_64 = (1 << 64) - 1
+
+
+def _coin(counter: int) -> int:
+    # splitmix64 finalizer: a reproducible coin flip per compaction.
+    value = (counter + 0x9E3779B97F4A7C15) & _MASK_64
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & _MASK_64
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & _MASK_64
+    return (value ^ (value >> 31)) & 1
+
+
+def _coins(first_counter: int, count: int) -> np.ndarray:
+    # _coin of count consecutive counters; uint64 arithmetic wraps modulo 2**64.
+    value = np.arange(count, dtype=np.uint64) + np.uint64(
+        (first_counter + 0x9E3779B97F4A7C15) & _MASK_64
+    )
+    value = (value ^ (value >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    value = (value ^ (value >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return ((value ^ (value >> np.uint64(31))) & np.uint64(1)).astype(np.intp)
+
+
+class KLLSketch:
+    """
+    KLL quantile sketch over numeric values. Compactor h keeps up to about
+    capacity * (2 / 3) ** depth values of weight 2 ** h; compacting it
+    promotes every other sorted value, from a pseudo-random offset, to the
+    next level. Ranks are estimated within about 1.7 / capacity of the
+    total count. Sketches merge levelwise.
+    """
+
+    __slots__ = ("capacity", "compactors", "compactions", "count", "min", "max")
+
+    def __init__(self, capacity: int = 200) -> None:
+        if capacity < 8:
+            raise ValueError("capacity must be at least 8.")
+
+        self.capacity = capacity
+        self.compactors = [np.empty(0, dtype=np.float64)]
+        self.compactions = 0
+        self.count = 0
+        self.min = np.inf
+        self.max = -np.inf
+
+    @classmethod
+    def from_column(cls, column: pd.Series, capacity: int = 200) -> "KLLSketch":
+        sketch = cls(capacity)
+        sketch.add(column)
+        return sketch
+
+    def add(self, column: pd.Series) -> None:
+        values = column.dropna().to_numpy(dtype=np.float64)
+        if not len(values):
+            return
+
+        self.count += len(values)
+        self.min = min(self.min, values.min())
+        self.max = max(self.max, values.max())
+        # Each level compacts its values in blocks of about its capacity, as
+        # a stream would, rather than at once, which would only fill the top
+        # level: the blocks are sorted and halved in one step per level.
+        level = 0
+        while len(values):
+            if level == len(self.compactors):
+                self.compactors.append(np.empty(0, dtype=np.float64))
+            values = np.concatenate([self.compactors[level], values])
+            block = self._level_capacity(level) // 2 * 2
+            blocks = len(values) // block if len(values) > block else 0
+
+            compacted = values[: blocks * block].reshape(blocks, block)
+            compacted.sort(axis=1)
+            offsets = _coins(self.compactions, blocks)
+            self.compactions += blocks
+
+            self.compactors[level] = values[blocks * block :]
+            values = compacted[
+                np.arange(blocks)[:, None],
+                offsets[:, None] + np.arange(0, block, 2),
+            ].ravel()
+            level += 1
+        # Levels added meanwhile lower the capacity of those below.
+        self._compress()
+
+    def _level_capacity(self, level: int) -> int:
+        depth = len(self.compactors) - level - 1
+        return max(int(math.ceil(self.capacity * (2 / 3) ** depth)), 2)
+
+    def _compress(self) -> None:
+        level = 0
+        while level < len(self.compactors):
+            values = self.compactors[level]
+            if len(values) > self._level_capacity(level):
+                if level + 1 == len(self.compactors):
+                    self.compactors.append(np.empty(0, dtype=np.float64))
+
+                values = np.sort(values)
+                offset = _coin(self.compactions)
+                self.compactions += 1
+                # An odd value stays at its level, so weights are preserved.
+                kept, values = values[: len(values) % 2], values[len(values) % 2 :]
+
+                self.compactors[level + 1] = np.concatenate(
+                    [self.compactors[level + 1], values[offset::2]]
+                )
+                self.compactors[level] = kept
+            level += 1
+
+    def merge(self, other: "KLLSketch") -> "KLLSketch":
+        if self.capacity != other.capacity:
+            raise ValueError("Only sketches with the same capacity can be merged.")
+
+        merged = KLLSketch(self.capacity)
+        levels = max(len(self.compactors), len(other.compactors))
+        merged.compactors = [
+            np.concatenate(
+                [
+                    sketch.compactors[level]
+                    for sketch in (self, other)
+                    if level < len(sketch.compactors)
+                ]
+            )
+            for level in range(levels)
+        ]
+        merged.compactions = self.compactions + other.compactions
+        merged.count = self.count + other.count
+        merged.min = min(self.min, other.min)
+        merged.max = max(self.max, other.max)
+        merged._compress()
+        return merged
+
+    def _weighted_values(self) -> Tuple[np.ndarray, np.ndarray]:
+        values = np.concatenate(self.compactors)
+        weights = np.concatenate(
+            [
+                np.full(len(compactor), 2**level, dtype=np.int64)
+                for level, compactor in enumerate(self.compactors)
+            ]
+        )
+        order = np.argsort(values, kind="stable")
+        return values[order], np.cumsum(weights[order])
+
+    def quantile(self, quantile: float) -> float:
+        if not self.count:
+            return np.nan
+        if quantile <= 0:
+            return float(self.min)
+        if quantile >= 1:
+            return float(self.max)
+
+        values, cumulative_weights = self._weighted_values()
+        position = np.searchsorted(
+            cumulative_weights, quantile * cumulative_weights[-1], side="left"
+        )
+        return float(values[min(position, len(values) - 1)])
+
+    def rank(self, value: float, inclusive: bool = True) -> float:
+        """
+        Estimated count of values lower than (or equal to) value.
+        """
+        if not self.count:
+            return 0.0
+        values, cumulative_weights = self._weighted_values()
+        position = np.searchsorted(values, value, side="right" if inclusive else "left")
+        return float(cumulative_weights[position - 1]) if position else 0.0
+
+
+class FixedHistogram:
+    """
+    Value counts over fixed bin edges, plus the bins below the first and
+    above the last edge. Histograms with the same edges merge by addition.
+    """
+
+    __slots__ = ("edges", "counts")
+
+    def __init__(self, edges, counts: Optional[np.ndarray] = None) -> None:
+        edges = np.asarray(edges, dtype=np.float64)
+        if edges.ndim != 1 or not len(edges) or np.any(np.diff(edges) <= 0):
+            raise ValueError("edges must be a non-empty increasing sequence.")
+
+        self.edges = edges
+        self.counts = (
+            counts if counts is not None else np.zeros(len(edges) + 1, dtype=np.int64)
+        )
+
+    @classmethod
+    def from_column(cls, column: pd.Series, edges) -> "FixedHistogram":
+        histogram = cls(edges)
+        histogram.add(column)
+        return histogram
+
+    def add(self, column: pd.Series) -> None:
+        values = column.dropna().to_numpy(dtype=np.float64)
+        bins = np.searchsorted(self.edges, values, side="right")
+        self.counts = self.counts + np.bincount(bins, minlength=len(self.counts))
+
+    def merge(self, other: "FixedHistogram") -> "FixedHistogram":
+        if not np.array_equal(self.edges, other.edges):
+            raise ValueError("Only histograms with the same edges can be merged.")
+        return FixedHistogram(self.edges, self.counts + other.counts)
+
+    @property
+    def total(self) -> int:
+        return int(self.counts.sum())
+
+    def fractions(self) -> np.ndarray:
+        total = self.total
+        if not total:
+            return np.zeros(len(self.counts))
+        return self.counts / total
@@ -0,0 +1,68 @@
+"""
+Lazily computed column statistics shared by the validators of a column.
+"""
+from functools import cached_property
+from typing import Any, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+class ColumnStatistics:
+    def __init__(self, column: pd.Series) -> None:
+        self.column = column
+
+    @cached_property
+    def null_mask(self) -> np.ndarray:
+        return np.asarray(self.column.isnull())
+
+    @cached_property
+    def null_count(self) -> int:
+        return int(self.null_mask.sum())
+
+    @cached_property
+    def non_null_count(self) -> int:
+        return len(self.column) - self.null_count
+
+    @cached_property
+    def min_max(self) -> Tuple[Any, Any]:
+        if not pd.api.types.is_numeric_dtype(
+            self.column.dtype
+        ) or pd.api.types.is_bool_dtype(self.column.dtype):
+            return None, None
+        return self.column.min(), self.column.max()
+
+    @property
+    def min(self) -> Any:
+        return self.min_max[0]
+
+    @property
+    def max(self) -> Any:
+        return self.min_max[1]
+
+    @cached_property
+    def factorization(self) -> Tuple[np.ndarray, pd.Index]:
+        codes, uniques = pd.factorize(self.column, use_na_sentinel=True)
+        return codes, pd.Index(uniques)
+
+    @property
+    def factorized(self) -> bool:
+        # Reusing a computed factorization is cheaper than another pass.
+        return "factorization" in self.__dict__
+
+    @property
+    def codes(self) -> np.ndarray:
+        return self.factorization[0]
+
+    @property
+    def uniques(self) -> pd.Index:
+        return self.factorization[1]
+
+    @cached_property
+    def unique_counts(self) -> np.ndarray:
+        codes = self.codes
+        return np.bincount(codes[codes >= 0], minlength=len(self.uniques))
+
+    @cached_property
+    def distinct_count(self) -> int:
+        return len(self.uniques) + (1 if self.null_count else 0)
@@ -0,0 +1,675 @@
+"""
+Mergeable summaries of validations, used to combine the evaluations of
+several partitions or chunks of a DataFrame into a single evaluation.
+
+Parts are evaluated in phases. A mergeable validator whose merged result
+decides what follows it, because it may suspend the following validators
+or has an amendment, ends a phase: the parts only summarize its partial
+state, and the next phase evaluates them once the summaries of every part
+are merged and the decision is known.
+"""
+import copy
+import functools
+import time
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+import pandas as pd
+
+from pandantic import evaluations, validations, validators
+
+EVALUATED = "evaluated"
+SUSPENDED = "suspended"
+FAILED = "failed"
+
+
+class Phase(NamedTuple):
+    # Position of the mergeable validator amended before the others, if any.
+    amended: Optional[int]
+    positions: range
+
+
+class Decision(NamedTuple):
+    suspended: bool
+    amend: bool
+
+
+class ValidationSummary:
+
+    __slots__ = (
+        "status",
+        "original_issues",
+        "pending_issues",
+        "valid",
+        "amended",
+        "original_state",
+        "pending_state",
+        "error",
+        "elapsed",
+        "additional_info",
+        "details",
+    )
+
+    def __init__(
+        self,
+        status: str,
+        original_issues: int = 0,
+        pending_issues: int = 0,
+        valid: bool = True,
+        amended: bool = False,
+        original_state: Any = None,
+        pending_state: Any = None,
+        error: Optional[Exception] = None,
+        elapsed: float = 0.0,
+        additional_info: Optional[str] = None,
+        details: Any = None,
+    ) -> None:
+        self.status = status
+        self.original_issues = original_issues
+        self.pending_issues = pending_issues
+        self.valid = valid
+        self.amended = amended
+        self.original_state = original_state
+        self.pending_state = pending_state
+        self.error = error
+        self.elapsed = elapsed
+        self.additional_info = additional_info
+        self.details = details
+
+    @classmethod
+    def from_validation(
+        cls,
+        validator: validators.Validator,
+        evaluated: Any,
+        validation: Optional[validations.Validation],
+    ) -> "ValidationSummary":
+        """
+        A missing validation stands for a mergeable validator that was not
+        evaluated: its partial state is summarized instead.
+        """
+        if validation is None:
+            return cls.from_state(validator, evaluated)
+
+        if isinstance(validation, validations.ValidationError):
+            return cls(
+                FAILED,
+                valid=False,
+                error=validation.original_error,
+                elapsed=validation.elapsed or 0.0,
+            )
+
+        if isinstance(validation, validations.SuspendedValidation):
+            return cls(SUSPENDED)
+
+        return cls(
+            EVALUATED,
+            validation.original_issues,
+            validation.pending_issues,
+            validation.valid,
+            validation.amended,
+            elapsed=validation.elapsed or 0.0,
+            additional_info=validation.additional_info,
+            details=validation.details,
+        )
+
+    @classmethod
+    def from_state(
+        cls,
+        validator: validators.MergeableValidator,
+        column: Any,
+        amended: bool = False,
+    ) -> "ValidationSummary":
+        """
+        Summary of the partial state of a part, whose issues and result are
+        only known once merged with the states of the other parts. An
+        amended state is the pending state of the amended part.
+        """
+        started = time.perf_counter()
+        try:
+            state = validator.partial(column)
+        except Exception as error:  # pylint: disable=broad-except
+            return cls(
+                FAILED, valid=False, error=error, elapsed=time.perf_counter() - started
+            )
+
+        return cls(
+            EVALUATED,
+            amended=amended,
+            original_state=None if amended else state,
+            pending_state=state,
+            elapsed=time.perf_counter() - started,
+        )
+
+    def merge(
+        self, other: "ValidationSummary", validator: validators.Validator
+    ) -> "ValidationSummary":
+        for status in (FAILED, EVALUATED, SUSPENDED):
+            if status in (self.status, other.status):
+                break
+
+        return ValidationSummary(
+            status,
+            self.original_issues + other.original_issues,
+            self.pending_issues + other.pending_issues,
+            self.valid and other.valid,
+            self.amended or other.amended,
+            _merge_states(validator, self.original_state, other.original_state),
+            _merge_states(validator, self.pending_state, other.pending_state),
+            self.error if self.error is not None else other.error,
+            self.elapsed + other.elapsed,
+            # Only information holding for every part is kept.
+            self.additional_info
+            if self.additional_info == other.additional_info
+            else None,
+            _merge_details(self.details, other.details),
+        )
+
+    def amend(self, amendment: "ValidationSummary") -> "ValidationSummary":
+        """
+        Summary once every part is amended, given the merged summary of the
+        amended states.
+        """
+        if amendment.status == FAILED:
+            return amendment
+
+        summary = copy.copy(self)
+        summary.amended = True
+        summary.pending_state = amendment.pending_state
+        summary.elapsed += amendment.elapsed
+        return summary
+
+    def to_validation(self, validator: validators.Validator) -> validations.Validation:
+        if self.status == FAILED:
+            validation_error = validations.ValidationError(
+                validator.description, validator.mandatory, self.error
+            )
+            validation_error.elapsed = self.elapsed
+            return validation_error
+
+        if self.status == SUSPENDED:
+            return validations.SuspendedValidation(
+                validator.description, validator.mandatory
+            )
+
+        validation = validations.Validation(validator.description, validator.mandatory)
+        validation.original_issues = self.original_issues
+        validation.pending_issues = self.pending_issues
+        validation.valid = self.valid
+        validation.amended = self.amended
+        validation.elapsed = self.elapsed
+        validation.additional_info = self.additional_info
+        validation.details = self.details
+
+        if self.original_state is not None:
+            validation.original_issues, *_ = validator.finalize(self.original_state)
+            (
+                validation.pending_issues,
+                validation.valid,
+                *additional_info,
+            ) = validator.finalize(self.pending_state)
+            if additional_info:
+                validation.additional_info = additional_info[0]
+            if len(additional_info) > 1:
+                validation.details = additional_info[1]
+
+        return validation
+
+
+def _merge_details(details: Any, other_details: Any) -> Any:
+    # Issue counts indexed by group add up; other details are not merged.
+    if isinstance(details, pd.Series) and isinstance(other_details, pd.Series):
+        return details.add(other_details, fill_value=0).astype("int64")
+    return None
+
+
+def _merge_states(validator: validators.Validator, state: Any, other_state: Any) -> Any:
+    if state is None:
+        return other_state
+    if other_state is None:
+        return state
+    return validator.merge(state, other_state)
+
+
+def _suspends(validation_list: List[validations.Validation]) -> bool:
+    return any(
+        isinstance(validation, validations.ValidationError)
+        or isinstance(validation, validations.SuspendedValidation)
+        or (validation.valid is False and validation.mandatory)
+        for validation in validation_list
+    )
+
+
+class ColumnSummary:
+    """
+    Summaries of the validators of a column, by position. Positions not
+    evaluated yet, or not evaluated by a phase, have no summary (None).
+    """
+
+    __slots__ = ("validation_summaries",)
+
+    validation_summaries: List[Optional[ValidationSummary]]
+
+    def __init__(self, validation_summaries: List[Optional[ValidationSummary]]) -> None:
+        self.validation_summaries = validation_summaries
+
+    @property
+    def amended(self) -> bool:
+        return any(
+            summary is not None and summary.amended
+            for summary in self.validation_summaries
+        )
+
+    def merge(
+        self, other: "ColumnSummary", validator_list: List[validators.Validator]
+    ) -> "ColumnSummary":
+        return ColumnSummary(
+            [
+                summary.merge(other_summary, validator)
+                if summary is not None and other_summary is not None
+                else summary
+                if other_summary is None
+                else other_summary
+                for summary, other_summary, validator in zip(
+                    self.validation_summaries,
+                    other.validation_summaries,
+                    validator_list,
+                )
+            ]
+        )
+
+    def update(self, other: "ColumnSummary") -> "ColumnSummary":
+        """
+        Summary adding the merged summary of a later phase.
+        """
+        return ColumnSummary(
+            [
+                other_summary
+                if summary is None
+                else summary
+                if other_summary is None
+                else summary.amend(other_summary)
+                for summary, other_summary in zip(
+                    self.validation_summaries, other.validation_summaries
+                )
+            ]
+        )
+
+    def suspends(self, validator_list: List[validators.Validator]) -> bool:
+        """
+        Whether the validators following those summarized are suspended.
+        """
+        return _suspends(self.to_validation_set(validator_list).validations)
+
+    def decide(
+        self, validator_list: List[validators.Validator], phase: Phase
+    ) -> Decision:
+        """
+        Decision of the parts evaluating the phase, taken from the summaries
+        of the earlier phases merged over every part: whether the validators
+        of the phase are suspended, and whether the parts are amended first.
+        """
+        start = phase.positions.start
+        validation_list = (
+            ColumnSummary(self.validation_summaries[:start])
+            .to_validation_set(validator_list[:start])
+            .validations
+        )
+
+        amend = False
+        if phase.amended is not None:
+            validation = validation_list[phase.amended]
+            amend = (
+                type(validation) is validations.Validation
+                and validation.valid is False
+                and not _suspends(validation_list[: phase.amended])
+            )
+
+        return Decision(_suspends(validation_list), amend)
+
+    def to_validation_set(
+        self, validator_list: List[validators.Validator]
+    ) -> validations.ValidationSet:
+        validation_set = validations.ValidationSet()
+        keep_validating = True
+
+        for validator, summary in zip(validator_list, self.validation_summaries):
+
+            if keep_validating:
+                validation = summary.to_validation(validator)
+            else:
+                validation = validations.SuspendedValidation(
+                    validator.description, validator.mandatory
+                )
+
+            validation_set.add_validation(validation)
+            if (
+                (validation.valid is False and validator.mandatory)
+                or isinstance(validation, validations.ValidationError)
+                or isinstance(validation, validations.SuspendedValidation)
+            ):
+                keep_validating = False
+
+        return validation_set
+
+
+def phases(validator_list: List[validators.Validator]) -> List[Phase]:
+    """
+    Phases evaluating the validators of a column in parts. A phase ends
+    after every mergeable validator that may suspend the following ones or
+    has an amendment. A mandatory one is amended in a phase of its own, as
+    its amended result decides the following validators.
+    """
+    column_phases = []
+    amended, start = None, 0
+
+    for position, validator in enumerate(validator_list):
+        if not isinstance(validator, validators.MergeableValidator) or not (
+            validator.mandatory or validator.amendment is not None
+        ):
+            continue
+
+        column_phases.append(Phase(amended, range(start, position + 1)))
+        amended, start = None, position + 1
+        if validator.amendment is not None:
+            if validator.mandatory:
+                column_phases.append(Phase(position, range(start, start)))
+            else:
+                amended = position
+
+    if amended is not None or start < len(validator_list) or not column_phases:
+        column_phases.append(Phase(amended, range(start, len(validator_list))))
+
+    return column_phases
+
+
+def skipped_summary(
+    validator_list: List[validators.Validator], phase: Phase, decision: Decision
+) -> Optional[ColumnSummary]:
+    """
+    Summary of a phase leaving nothing to evaluate, so the parts need not be
+    evaluated again, or None when they must be.
+    """
+    if decision.amend or (phase.positions and not decision.suspended):
+        return None
+    return ColumnSummary(
+        [
+            ValidationSummary(SUSPENDED) if position in phase.positions else None
+            for position in range(len(validator_list))
+        ]
+    )
+
+
+def summarize_column(
+    validator_set: validators.ValidatorSet, column: pd.Series, states: bool = True
+) -> Tuple[pd.Series, ColumnSummary]:
+    """
+    With states, mergeable validators only summarize their partial states,
+    to be merged with those of the other parts. Without them, the summary
+    only holds counts: it is the summary of a whole column.
+    """
+    column = column.copy()
+    validation_summaries = []
+
+    for validator, evaluated, column, validation in validator_set.iter_validate(
+        column, states=states
+    ):
+        validation_summaries.append(
+            ValidationSummary.from_validation(validator, evaluated, validation)
+        )
+
+    return column, ColumnSummary(validation_summaries)
+
+
+def summarize_phase(
+    validator_list: List[validators.Validator],
+    column: Any,
+    phase: Phase,
+    decision: Decision,
+) -> Tuple[Any, ColumnSummary]:
+    """
+    Evaluates the phase on a part of a column, or on a part of a frame for
+    frame validators, returning the amended part and its summary.
+    """
+    validation_summaries = [None] * len(validator_list)
+    suspended = decision.suspended
+
+    if decision.amend:
+        validator = validator_list[phase.amended]
+        try:
+            amended_column = validator.amendment(column)
+        except Exception as error:  # pylint: disable=broad-except
+            amendment_summary = ValidationSummary(FAILED, valid=False, error=error)
+        else:
+            column = amended_column
+            amendment_summary = ValidationSummary.from_state(
+                validator, column, amended=True
+            )
+        validation_summaries[phase.amended] = amendment_summary
+        suspended = suspended or amendment_summary.status == FAILED
+
+    positions = phase.positions
+    if suspended:
+        validation_summaries[positions.start : positions.stop] = [
+            ValidationSummary(SUSPENDED) for _ in positions
+        ]
+    elif positions:
+        column, phase_summary = summarize_column(
+            validators.ValidatorSet(validator_list[positions.start : positions.stop]),
+            column,
+        )
+        validation_summaries[
+            positions.start : positions.stop
+        ] = phase_summary.validation_summaries
+
+    return column, ColumnSummary(validation_summaries)
+
+
+def summarize_parts(
+    validator_list: List[validators.Validator],
+    evaluate_phase: Callable[[Phase, Decision], Iterable[ColumnSummary]],
+) -> ColumnSummary:
+    """
+    Summary of a column evaluated in parts. evaluate_phase evaluates a phase
+    on every part, keeping the amended parts for the next phases, and
+    returns their summaries; phases leaving nothing to evaluate are skipped.
+    """
+    column_summary = ColumnSummary([None] * len(validator_list))
+
+    for phase in phases(validator_list):
+        decision = column_summary.decide(validator_list, phase)
+        phase_summary = skipped_summary(validator_list, phase, decision)
+        if phase_summary is None:
+            phase_summary = functools.reduce(
+                lambda summary, other_summary: summary.merge(
+                    other_summary, validator_list
+                ),
+                evaluate_phase(phase, decision),
+            )
+        column_summary = column_summary.update(phase_summary)
+
+    return column_summary
+
+
+def summarize_frame_validator(
+    frame_validator: validators.Validator, dataframe: pd.DataFrame
+) -> Tuple[pd.DataFrame, ColumnSummary]:
+    evaluated = dataframe
+    try:
+        dataframe, validation = frame_validator.evaluate(dataframe)
+    except validations.ValidationError as error:
+        validation = error
+
+    summary = ValidationSummary.from_validation(frame_validator, evaluated, validation)
+    return dataframe, ColumnSummary([summary])
+
+
+FramePass = Dict[str, Phase]
+
+
+def frame_passes(schema) -> List[FramePass]:
+    """
+    Passes over the parts of a frame: the phase evaluated in each pass by
+    every column and frame validator, in evaluation order. Frame validators
+    follow the last phase of the columns, and the ones following an
+    amended mergeable frame validator wait for its amendment.
+    """
+    passes = [dict()]
+
+    for column_name in schema.get_columns():
+        for position, phase in enumerate(phases(validator_list(schema, column_name))):
+            if position == len(passes):
+                passes.append(dict())
+            passes[position][column_name] = phase
+
+    offset = len(passes) - 1
+    for validator_name in schema.get_frame_validators():
+        validator_phases = phases(validator_list(schema, validator_name))
+        for position, phase in enumerate(validator_phases, start=offset):
+            if position == len(passes):
+                passes.append(dict())
+            passes[position][validator_name] = phase
+        offset += len(validator_phases) - 1
+
+    return passes
+
+
+def _column_summary(
+    schema, frame_summary: Dict[str, Optional[ColumnSummary]], name: str
+) -> Optional[ColumnSummary]:
+    if name in frame_summary:
+        return frame_summary[name]
+    return ColumnSummary([None] * len(validator_list(schema, name)))
+
+
+def decide_pass(
+    schema, frame_summary: Dict[str, Optional[ColumnSummary]], frame_pass: FramePass
+) -> Dict[str, Decision]:
+    """
+    Decisions of the columns and frame validators of the pass, except the
+    missing columns.
+    """
+    decisions = dict()
+    for name, phase in frame_pass.items():
+        column_summary = _column_summary(schema, frame_summary, name)
+        if column_summary is not None:
+            decisions[name] = column_summary.decide(validator_list(schema, name), phase)
+    return decisions
+
+
+def skipped_pass(
+    schema, frame_pass: FramePass, decisions: Dict[str, Decision]
+) -> Optional[Dict[str, Optional[ColumnSummary]]]:
+    """
+    Summary of a pass leaving nothing to evaluate, or None when the parts
+    must be evaluated.
+    """
+    pass_summary = dict()
+    for name, phase in frame_pass.items():
+        if name not in decisions:
+            pass_summary[name] = None
+            continue
+        pass_summary[name] = skipped_summary(
+            validator_list(schema, name), phase, decisions[name]
+        )
+        if pass_summary[name] is None:
+            return None
+    return pass_summary
+
+
+def summarize_pass(
+    schema,
+    dataframe: pd.DataFrame,
+    missing_columns: List,
+    frame_pass: FramePass,
+    decisions: Dict[str, Decision],
+) -> Tuple[pd.DataFrame, Dict[str, Optional[ColumnSummary]]]:
+    """
+    Evaluates a pass on a part of a DataFrame whose columns are already
+    transformed, returning the amended part and a summary per column and
+    frame validator of the pass.
+    """
+    dataframe = dataframe.copy()
+    column_names = schema.get_columns()
+    pass_summary = dict()
+
+    for name, phase in frame_pass.items():
+        if name in missing_columns:
+            pass_summary[name] = None
+        elif name in column_names:
+            column, pass_summary[name] = summarize_phase(
+                validator_list(schema, name),
+                dataframe.loc[:, name],
+                phase,
+                decisions[name],
+            )
+            # Written back like evaluate_columns does, so parts keep the dtypes
+            # of the evaluation of the whole frame.
+            dataframe.loc[:, name] = column
+        else:
+            dataframe, pass_summary[name] = summarize_phase(
+                validator_list(schema, name), dataframe, phase, decisions[name]
+            )
+
+    return dataframe, pass_summary
+
+
+def update_frame_summary(
+    schema,
+    frame_summary: Dict[str, Optional[ColumnSummary]],
+    pass_summary: Dict[str, Optional[ColumnSummary]],
+) -> Dict[str, Optional[ColumnSummary]]:
+    """
+    Frame summary adding the summary of a pass merged over every part.
+    """
+    frame_summary = dict(frame_summary)
+    for name, column_summary in pass_summary.items():
+        frame_summary[name] = (
+            None
+            if column_summary is None
+            else _column_summary(schema, frame_summary, name).update(column_summary)
+        )
+    return frame_summary
+
+
+def merge_frame_summaries(
+    schema,
+    frame_summary: Dict[str, Optional[ColumnSummary]],
+    other_frame_summary: Dict[str, Optional[ColumnSummary]],
+) -> Dict[str, Optional[ColumnSummary]]:
+    merged_summary = dict()
+
+    for name, column_summary in frame_summary.items():
+        if column_summary is None:
+            merged_summary[name] = None
+        else:
+            merged_summary[name] = column_summary.merge(
+                other_frame_summary[name], validator_list(schema, name)
+            )
+
+    return merged_summary
+
+
+def evaluation_data(
+    schema, frame_summary: Dict[str, Optional[ColumnSummary]]
+) -> Dict[str, evaluations.ColumnEvaluation]:
+    frame_validators = schema.get_frame_validators()
+    data = dict()
+
+    for name, column_summary in frame_summary.items():
+        if column_summary is None:
+            data[name] = evaluations.MissingColumn()
+            continue
+
+        validation_set = column_summary.to_validation_set(validator_list(schema, name))
+        if name in frame_validators:
+            data[name] = evaluations.FrameEvaluation(validation_set)
+        else:
+            data[name] = evaluations.ColumnEvaluation(validation_set)
+
+    return data
+
+
+def validator_list(schema, name: str) -> List[validators.Validator]:
+    frame_validators = schema.get_frame_validators()
+    if name in frame_validators:
+        return [frame_validators[name]]
+    return list(schema.get_columns()[name].column_validators)
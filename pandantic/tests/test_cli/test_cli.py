@@ -0,0 +1,125 @@
+# pylint: disable=unused-import
+import json
+import os
+
+import pandas as pd
+import pytest
+
+from pandantic import cli, columns, schemas, shortcuts
+
+SCHEMA_PATH = "pandantic.tests.test_cli.test_cli:CliSchema"
+
+
+class CliSchema(schemas.DataFrameModel):
+
+    key = columns.IntColumn([shortcuts.is_unique()])
+    value = columns.NumberColumn([shortcuts.between_range(0, 10)])
+
+
+def write_files(directory):
+    (directory / "nested").mkdir()
+    pd.DataFrame({"key": [1, 2], "value": [1.0, 2.0]}).to_csv(
+        directory / "valid.csv", index=False
+    )
+    pd.DataFrame({"key": [1, 1], "value": [1.0, 20.0]}).to_csv(
+        directory / "nested" / "invalid.csv", index=False
+    )
+
+
+def test_validate_writes_summary_and_manifest(tmp_path):
+
+    write_files(tmp_path)
+    summary_path = tmp_path / "summary.json"
+    manifest_path = tmp_path / "manifest.json"
+
+    exit_code = cli.main(
+        [
+            "validate",
+            SCHEMA_PATH,
+            str(tmp_path / "**" / "*.csv"),
+            "--jobs",
+            "2",
+            "--summary",
+            str(summary_path),
+            "--manifest",
+            str(manifest_path),
+        ]
+    )
+
+    summary = json.loads(summary_path.read_text())
+    statuses = {os.path.basename(result["path"]): result for result in summary["files"]}
+
+    assert exit_code == 1
+    assert summary["totals"] == {"invalid": 1, "valid": 1}
+    assert statuses["valid.csv"]["rows"] == 2
+    assert statuses["invalid.csv"]["invalid_columns"] == ["key", "value"]
+
+    manifest = json.loads(manifest_path.read_text())
+    entry = manifest[str(tmp_path / "valid.csv")]
+    assert entry["schema_version"] == summary["schema_version"]
+    assert entry["size"] == os.path.getsize(tmp_path / "valid.csv")
+
+
+def test_validate_skips_unchanged_files(tmp_path):
+
+    write_files(tmp_path)
+    manifest_path = str(tmp_path / "manifest.json")
+    files = [str(tmp_path / "valid.csv"), str(tmp_path / "nested" / "invalid.csv")]
+
+    cli.validate(SCHEMA_PATH, files, manifest_path=manifest_path)
+
+    # A touched but identical file is still skipped; invalid files never are.
+    os.utime(files[0], ns=(0, 0))
+    summary = cli.validate(SCHEMA_PATH, files, manifest_path=manifest_path)
+    assert summary["totals"] == {"skipped": 1, "invalid": 1}
+
+    pd.DataFrame({"key": [1, 2, 3], "value": [1.0, 2.0, 3.0]}).to_csv(
+        files[0], index=False
+    )
+    summary = cli.validate(SCHEMA_PATH, files, manifest_path=manifest_path)
+    assert summary["totals"] == {"valid": 1, "invalid": 1}
+
+    summary = cli.validate(SCHEMA_PATH, files, manifest_path=manifest_path, force=True)
+    assert "skipped" not in summary["totals"]
+
+
+def test_load_schema_rejects_other_objects():
+
+    with pytest.raises(ValueError):
+        cli.load_schema("pandantic.tests.test_cli.test_cli")
+
+    with pytest.raises(ValueError):
+        cli.load_schema("pandantic.tests.test_cli.test_cli:SCHEMA_PATH")
+
+
+def build_schema(max_value=10, fill_value=0.0, storage=None, datetime_format=None):
+    class VersionedSchema(schemas.DataFrameModel):
+
+        value = columns.NumberColumn(
+            [
+                shortcuts.between_range(
+                    0, max_value, description="Values are in range."
+                ),
+                shortcuts.non_null().set_amendment(
+                    lambda column: column.fillna(fill_value)
+                ),
+            ]
+        )
+        label = columns.StringColumn(storage=storage)
+        day = columns.DatetimeColumn(datetime_format=datetime_format)
+
+    return VersionedSchema()
+
+
+def test_schema_version_covers_the_configuration():
+
+    version = cli.schema_version(build_schema())
+
+    assert cli.schema_version(build_schema()) == version
+    for changes in (
+        {"max_value": 20},
+        {"fill_value": 1.0},
+        {"storage": "python"},
+        {"datetime_format": "%Y-%m-%d"},
+    ):
+        assert cli.schema_version(build_schema(**changes)) != version
@@ -4,7 +4,7 @@ import pytest
 import pandas as pd
 import numpy as np
 
-from pandantic import columns
+from pandantic import columns, shortcuts
 
 
 def test_string_column_correct_series():
@@ -53,3 +53,39 @@ def test_string_column_wrong_series_bool():
 
     assert evaluation.valid
     assert evaluation.amended
+
+
+def test_string_column_pyarrow_storage():
+
+    pytest.importorskip("pyarrow")
+
+    col = pd.Series(["ab", "cd", None, "efg"], dtype=object)
+
+    col_definition = columns.StringColumn(
+        [
+            shortcuts.match_pattern(r"[a-z]+"),
+            shortcuts.in_categories(["ab", "cd", "efg"]),
+            shortcuts.has_length(2, 3),
+        ],
+        storage="pyarrow",
+    )
+
+    result, evaluation = col_definition.evaluate(col)
+
+    assert evaluation.valid
+    assert evaluation.amended
+    assert str(result.dtype) == "string"
+    assert result.dtype.storage == "pyarrow"
+
+
+def test_string_column_pyarrow_storage_amends_python_strings():
+
+    pytest.importorskip("pyarrow")
+
+    col = pd.Series(["a", "b"], dtype=pd.StringDtype("python"))
+
+    result, evaluation = columns.StringColumn(storage="pyarrow").evaluate(col)
+
+    assert evaluation.valid
+    assert evaluation.amended
+    assert result.dtype.storage == "pyarrow"
@@ -0,0 +1,78 @@
+# pylint: disable=unused-import
+import concurrent.futures
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pandantic import columns, schemas, shortcuts
+
+pytest.importorskip("pyarrow")
+
+from pandantic import daemon  # pylint: disable=wrong-import-position
+
+
+class DaemonSchema(schemas.DataFrameModel):
+
+    key = columns.IntColumn([shortcuts.is_unique()])
+    value = columns.NumberColumn(
+        [
+            shortcuts.non_null().set_amendment(lambda column: column.fillna(0)),
+            shortcuts.between_range(0, 10),
+        ]
+    )
+
+
+@pytest.fixture
+def server(tmp_path):
+    server = daemon.start_server(
+        str(tmp_path / "pandantic.sock"), {"daemon": DaemonSchema()}
+    )
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_daemon_evaluates_and_amends(server):
+
+    df = pd.DataFrame({"key": [1, 2, 3], "value": [1.0, np.nan, 3.0]})
+
+    with daemon.Client(server.server_address) as client:
+        status, amended, report = client.evaluate("daemon", df, "batch")
+
+    assert status == "valid"
+    assert amended["value"].tolist() == [1.0, 0.0, 3.0]
+    assert set(report.column("evaluation").to_pylist()) == {"batch"}
+    assert report.num_rows == 5
+
+
+def test_daemon_reports_invalid_and_unknown_schemas(server):
+
+    df = pd.DataFrame({"key": [1, 1], "value": [1.0, 2.0]})
+
+    with daemon.Client(server.server_address) as client:
+        status, amended, report = client.evaluate("daemon", df)
+        assert status == "invalid"
+        assert amended.equals(df)
+        assert not all(report.column("valid").to_pylist())
+
+        with pytest.raises(RuntimeError):
+            client.evaluate("unknown", df)
+
+
+def test_daemon_serves_concurrent_clients(server):
+    def evaluate(position):
+        df = pd.DataFrame({"key": [position, position + 1], "value": [1.0, 2.0]})
+        with daemon.Client(server.server_address) as client:
+            return client.evaluate("daemon", df)[0]
+
+    with concurrent.futures.ThreadPoolExecutor(8) as executor:
+        statuses = list(executor.map(evaluate, range(32)))
+
+    assert statuses == ["valid"] * 32
+
+    with daemon.Client(server.server_address) as client:
+        stats = client.stats()
+
+    assert stats["daemon"]["requests"] == 32
+    assert stats["daemon"]["mean_seconds"] > 0
@@ -0,0 +1,102 @@
+# pylint: disable=unused-import
+import numpy as np
+import pandas as pd
+import pytest
+
+from pandantic import columns, schemas, shortcuts
+
+
+def fill_with_zero(column: pd.Series) -> pd.Series:
+    return column.fillna(0)
+
+
+class PartsSchema(schemas.DataFrameModel):
+
+    key = columns.IntColumn([shortcuts.is_unique(mandatory=False)])
+    value = columns.NumberColumn(
+        [
+            shortcuts.non_null().set_amendment(fill_with_zero),
+            shortcuts.between_range(0, 10),
+        ]
+    )
+    label = columns.ObjectColumn([shortcuts.in_categories(["a", "b"])])
+    ordered = shortcuts.satisfies("value <= key")
+
+
+class AmendedDtypeSchema(schemas.DataFrameModel):
+
+    label = columns.CategoryColumn()
+    count = columns.IntColumn()
+
+
+class DistinctSchema(schemas.DataFrameModel):
+
+    # Only the whole column has enough distinct values, so parts must not
+    # suspend the amendment that follows on their own counts.
+    amount = columns.FloatColumn(
+        [
+            shortcuts.distinct_count_between(5, 100),
+            shortcuts.non_null().set_amendment(fill_with_zero),
+        ]
+    )
+
+
+@pytest.fixture
+def parts_schema():
+    return PartsSchema
+
+
+@pytest.fixture
+def parts_frame():
+    return pd.DataFrame(
+        {
+            "key": [1, 2, 3, 4, 5, 6, 3, 8, 1, 10],
+            "value": [1.0, np.nan, 3.0, 4.0, np.nan, 6.0, 1.0, 8.0, 1.0, 10.0],
+            "label": list("abababbbaa"),
+        },
+        index=list("abcdefghij"),
+    )
+
+
+@pytest.fixture
+def distinct_schema():
+    return DistinctSchema
+
+
+@pytest.fixture
+def distinct_frame():
+    return pd.DataFrame({"amount": [1.0, 2.0, np.nan, 3.0, 4.0, 5.0, np.nan, 6.0]})
+
+
+@pytest.fixture
+def amended_dtype_schema():
+    return AmendedDtypeSchema
+
+
+@pytest.fixture
+def amended_dtype_frame():
+    # Both columns need a dtype amendment; counts downcast to int8 in some
+    # rows and int16 in others.
+    return pd.DataFrame(
+        {"label": list("abbab"), "count": ["1", "2", "3", "4", "500"]},
+        index=list("vwxyz"),
+    )
+
+
+@pytest.fixture
+def evaluation_counts():
+    def counts(evaluation):
+        return {
+            name: [
+                (
+                    validation.original_issues,
+                    validation.pending_issues,
+                    validation.valid,
+                    validation.amended,
+                )
+                for validation in getattr(evaluation, name).validation_set
+            ]
+            for name in evaluation._fields
+        }
+
+    return counts
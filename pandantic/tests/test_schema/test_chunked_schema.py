@@ -0,0 +1,212 @@
+# pylint: disable=unused-import
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pandantic import chunked, columns, schemas, shortcuts
+
+
+def build_chunks(df):
+    return [df.iloc[start : start + 3] for start in range(0, len(df), 3)]
+
+
+def test_chunked_evaluation_matches_pandas(
+    parts_schema, parts_frame, evaluation_counts
+):
+
+    amended_chunks = []
+    evaluation = parts_schema().evaluate_chunks(
+        build_chunks(parts_frame),
+        "test",
+        warn=False,
+        on_chunk=lambda position, chunk: amended_chunks.append(chunk),
+    )
+    expected_df, expected = parts_schema().evaluate(parts_frame, "test", warn=False)
+
+    assert evaluation_counts(evaluation) == evaluation_counts(expected)
+    assert evaluation.key.validation_set.validations[0].original_issues == 2
+    pd.testing.assert_frame_equal(pd.concat(amended_chunks), expected_df)
+
+
+def test_chunked_evaluation_resumes_from_checkpoint(
+    tmp_path, parts_schema, parts_frame, evaluation_counts
+):
+
+    checkpoint = str(tmp_path / "evaluation.checkpoint")
+
+    def failing_chunks():
+        for position, chunk in enumerate(build_chunks(parts_frame)):
+            if position == 2:
+                raise RuntimeError("Interrupted")
+            yield chunk
+
+    with pytest.raises(RuntimeError):
+        parts_schema().evaluate_chunks(
+            failing_chunks(), "test", warn=False, checkpoint=checkpoint
+        )
+
+    assert chunked.Checkpoint.load(checkpoint).completed_chunks == 2
+
+    evaluated_positions = []
+    evaluation = parts_schema().evaluate_chunks(
+        build_chunks(parts_frame),
+        "test",
+        warn=False,
+        checkpoint=checkpoint,
+        on_chunk=lambda position, chunk: evaluated_positions.append(position),
+    )
+    _, expected = parts_schema().evaluate(parts_frame, "test", warn=False)
+
+    assert evaluated_positions == [2, 3]
+    assert evaluation_counts(evaluation) == evaluation_counts(expected)
+    assert not os.path.exists(checkpoint)
+
+
+def test_checkpoint_of_another_schema_is_rejected(tmp_path, parts_schema, parts_frame):
+    class OtherSchema(schemas.DataFrameModel):
+
+        key = columns.IntColumn()
+
+    checkpoint = str(tmp_path / "evaluation.checkpoint")
+    chunked.Checkpoint.for_schema(OtherSchema()).save(checkpoint)
+
+    with pytest.raises(ValueError):
+        parts_schema().evaluate_chunks(
+            build_chunks(parts_frame), "test", checkpoint=checkpoint
+        )
+
+
+def test_chunked_evaluation_merges_quantile_sketches():
+    class LatencySchema(schemas.DataFrameModel):
+
+        latency = columns.NumberColumn(
+            [shortcuts.quantile_between(0.99, max_value=2.0)]
+        )
+
+    values = pd.Series(np.linspace(0, 2.5, 10_000), name="latency")
+    chunks = [
+        values.iloc[start : start + 1_000].to_frame()
+        for start in range(0, 10_000, 1_000)
+    ]
+
+    with pytest.raises(schemas.SchemaEvaluationException) as error:
+        LatencySchema().evaluate_chunks(chunks, "latency", warn=False)
+    validation = error.value.evaluation.latency.validation_set.validations[0]
+
+    assert validation.valid is False
+    assert 1_700 < validation.original_issues < 2_000
+
+
+@pytest.mark.parametrize("lazy", ["loaders", "paths"])
+def test_resumed_evaluation_does_not_load_completed_chunks(
+    tmp_path, lazy, parts_schema, parts_frame, evaluation_counts
+):
+
+    checkpoint = str(tmp_path / "evaluation.checkpoint")
+    paths = []
+    for position, chunk in enumerate(build_chunks(parts_frame)):
+        paths.append(str(tmp_path / f"chunk-{position}.pkl"))
+        chunk.to_pickle(paths[-1])
+
+    loaded = []
+
+    def loader(position):
+        def load():
+            loaded.append(position)
+            return pd.read_pickle(paths[position])
+
+        return load
+
+    def interrupt():
+        raise RuntimeError("Interrupted")
+
+    with pytest.raises(RuntimeError):
+        parts_schema().evaluate_chunks(
+            [loader(0), loader(1), interrupt, loader(3)],
+            "test",
+            warn=False,
+            checkpoint=checkpoint,
+        )
+    assert chunked.completed_chunks(checkpoint) == 2
+    loaded.clear()
+
+    if lazy == "loaders":
+        chunks = [loader(position) for position in range(len(paths))]
+    else:
+        chunks = paths
+        for path in paths[:2]:
+            os.remove(path)
+
+    evaluation = parts_schema().evaluate_chunks(
+        chunks, "test", warn=False, checkpoint=checkpoint
+    )
+    _, expected = parts_schema().evaluate(parts_frame, "test", warn=False)
+
+    assert loaded == ([2, 3] if lazy == "loaders" else [])
+    assert evaluation_counts(evaluation) == evaluation_counts(expected)
+    assert chunked.completed_chunks(checkpoint) == 0
+
+
+def test_chunked_evaluation_with_dtype_amendments(
+    amended_dtype_schema, amended_dtype_frame, evaluation_counts
+):
+
+    amended_chunks = []
+    evaluation = amended_dtype_schema().evaluate_chunks(
+        build_chunks(amended_dtype_frame),
+        "test",
+        warn=False,
+        on_chunk=lambda position, chunk: amended_chunks.append(chunk),
+    )
+    expected_df, expected = amended_dtype_schema().evaluate(
+        amended_dtype_frame, "test", warn=False
+    )
+
+    assert evaluation_counts(evaluation) == evaluation_counts(expected)
+    assert evaluation.label.amended
+    pd.testing.assert_frame_equal(pd.concat(amended_chunks), expected_df)
+
+
+def test_chunked_amendments_follow_merged_states(
+    distinct_schema, distinct_frame, evaluation_counts
+):
+
+    amended_chunks = []
+    evaluation = distinct_schema().evaluate_chunks(
+        build_chunks(distinct_frame),
+        "test",
+        warn=False,
+        on_chunk=lambda position, chunk: amended_chunks.append(chunk),
+    )
+    expected_df, expected = distinct_schema().evaluate(
+        distinct_frame, "test", warn=False
+    )
+
+    assert evaluation_counts(evaluation) == evaluation_counts(expected)
+    pd.testing.assert_frame_equal(pd.concat(amended_chunks), expected_df)
+
+
+def test_chunks_are_not_amended_before_merged_failures():
+    class KeySchema(schemas.DataFrameModel):
+
+        key = columns.FloatColumn(
+            [
+                shortcuts.is_unique(),
+                shortcuts.non_null().set_amendment(lambda column: column.fillna(0)),
+            ]
+        )
+
+    amended_chunks = []
+    with pytest.raises(schemas.SchemaEvaluationException):
+        KeySchema().evaluate_chunks(
+            [
+                pd.DataFrame({"key": [1.0, 2.0]}),
+                pd.DataFrame({"key": [np.nan, 1.0]}, index=[2, 3]),
+            ],
+            "test",
+            on_chunk=lambda position, chunk: amended_chunks.append(chunk),
+        )
+
+    assert pd.concat(amended_chunks)["key"].isnull().sum() == 1
@@ -0,0 +1,113 @@
+# pylint: disable=unused-import
+import concurrent.futures
+import threading
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pandantic import columns, references, schemas, shortcuts
+
+
+class ConcurrentSchema(schemas.DataFrameModel):
+
+    amount = columns.FloatColumn(
+        column_validations=[
+            shortcuts.non_null(mandatory=False),
+            shortcuts.between_range(0, 100).set_amendment(
+                lambda column: column.clip(0, 100)
+            ),
+            shortcuts.quantile_between(0.5, 0, 100, mandatory=False),
+        ]
+    )
+    country = columns.ObjectColumn(
+        column_validations=[
+            shortcuts.in_reference(
+                references.ReferenceIndex.from_values(["fr", "de", "it"])
+            ),
+            shortcuts.is_unique(mandatory=False),
+        ]
+    )
+    created = columns.DatetimeColumn(datetime_format="%Y-%m-%d")
+
+    key = shortcuts.unique_key(["country", "created"], mandatory=False)
+
+
+def build_frame(seed):
+    rng = np.random.default_rng(seed)
+    row_count = int(rng.integers(50, 500))
+    return pd.DataFrame(
+        {
+            "amount": rng.uniform(-20, 120, row_count),
+            "country": rng.choice(
+                ["fr", "de", "it", "es"] if seed % 4 == 0 else ["fr", "de", "it"],
+                row_count,
+            ),
+            "created": pd.Series(
+                pd.date_range("2024-01-01", periods=row_count).strftime("%Y-%m-%d")
+            ),
+        }
+    )
+
+
+def evaluate(schema, seed):
+    try:
+        result_df, evaluation = schema.evaluate(build_frame(seed), f"frame_{seed}")
+    except schemas.SchemaEvaluationException as error:
+        return "invalid", None, error.evaluation
+    except schemas.SchemaEvaluationWarning:
+        result_df, evaluation = schema.evaluate(
+            build_frame(seed), f"frame_{seed}", warn=False
+        )
+        return "warning", result_df, evaluation
+    return "valid", result_df, evaluation
+
+
+def summary(result):
+    status, result_df, evaluation = result
+    issues = [
+        (validation.original_issues, validation.pending_issues, validation.valid)
+        for column_evaluation in evaluation
+        for validation in column_evaluation.validation_set
+    ]
+    return status, result_df, issues
+
+
+def test_schema_declarations_are_frozen():
+
+    schema = ConcurrentSchema()
+    validator = list(schema.get_columns()["amount"].column_validators)[1]
+
+    with pytest.raises(AttributeError):
+        validator.set_amendment(lambda column: column)
+    with pytest.raises(AttributeError):
+        schema.get_columns()["amount"].column_validators.add_validator(
+            shortcuts.non_null()
+        )
+    with pytest.raises(AttributeError):
+        schema.get_frame_validators()["key"].columns = ["country"]
+
+
+@pytest.mark.filterwarnings("ignore::FutureWarning")
+def test_concurrent_evaluations_share_one_schema():
+
+    schema = ConcurrentSchema()
+    seeds = list(range(48))
+    expected = {seed: summary(evaluate(schema, seed)) for seed in seeds}
+    assert {status for status, _, _ in expected.values()} == {"invalid", "warning"}
+
+    barrier = threading.Barrier(8)
+
+    def evaluate_after_barrier(seed):
+        if seed < 8:
+            barrier.wait()
+        return seed, summary(evaluate(schema, seed))
+
+    with concurrent.futures.ThreadPoolExecutor(8) as executor:
+        results = list(executor.map(evaluate_after_barrier, seeds * 3))
+
+    for seed, (status, result_df, issues) in results:
+        expected_status, expected_df, expected_issues = expected[seed]
+        assert (status, issues) == (expected_status, expected_issues)
+        if expected_df is not None:
+            pd.testing.assert_frame_equal(result_df, expected_df)
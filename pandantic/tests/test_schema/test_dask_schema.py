@@ -0,0 +1,132 @@
+# pylint: disable=unused-import
+import numpy as np
+import pandas as pd
+import pytest
+
+from pandantic import columns, schemas, shortcuts
+
+dd = pytest.importorskip("dask.dataframe")
+
+
+@pytest.fixture(autouse=True)
+def object_strings():
+    import dask
+
+    # Partitions keep the object strings of the pandas frames they are
+    # compared with.
+    with dask.config.set({"dataframe.convert-string": False}):
+        yield
+
+
+@pytest.mark.parametrize("scheduler", ["sync", "threads", "processes"])
+def test_dask_evaluation_matches_pandas(
+    scheduler, parts_schema, parts_frame, evaluation_counts
+):
+
+    import dask
+
+    ddf = dd.from_pandas(parts_frame, npartitions=3)
+
+    with dask.config.set(scheduler=scheduler):
+        amended, evaluation = parts_schema().evaluate(ddf, "test", warn=False)
+
+    _, expected = parts_schema().evaluate(parts_frame, "test", warn=False)
+
+    assert evaluation_counts(evaluation) == evaluation_counts(expected)
+    assert evaluation.key.validation_set.validations[0].original_issues == 2
+    assert evaluation.key.warnings
+    assert evaluation.value.amended
+    assert isinstance(amended, dd.DataFrame)
+    assert amended.compute()["value"].isnull().sum() == 0
+
+
+def test_dask_global_unique(parts_schema):
+
+    df = pd.DataFrame(
+        {"key": [1, 2, 3, 1, 2, 3], "value": [0.0] * 6, "label": ["a"] * 6}
+    )
+    ddf = dd.from_pandas(df, npartitions=2)
+
+    _, evaluation = parts_schema().evaluate(ddf, "test", warn=False)
+
+    assert evaluation.key.validation_set.validations[0].original_issues == 3
+
+
+def test_dask_invalid_raises(parts_schema, parts_frame):
+
+    df = parts_frame.assign(value=100.0)
+    ddf = dd.from_pandas(df, npartitions=2)
+
+    with pytest.raises(schemas.SchemaEvaluationException) as error:
+        parts_schema().evaluate(ddf, "test", warn=False)
+
+    assert error.value.evaluation.value.valid is False
+
+
+def test_dask_unique_states_are_hash_partitioned(monkeypatch):
+
+    from pandantic import partitioned
+
+    class KeySchema(schemas.DataFrameModel):
+
+        key = columns.IntColumn([shortcuts.is_unique(mandatory=False)])
+        pair = shortcuts.unique_key(["key", "other"], mandatory=False)
+
+    restored = []
+    restore_keyed_states = partitioned.restore_keyed_states
+
+    def record_states(schema, frame_summary, states):
+        restored.append(states)
+        return restore_keyed_states(schema, frame_summary, states)
+
+    monkeypatch.setattr(partitioned, "restore_keyed_states", record_states)
+
+    df = pd.DataFrame({"key": list(range(100)) + [5, 7, 7], "other": [0] * 103})
+    ddf = dd.from_pandas(df, npartitions=4)
+
+    _, evaluation = KeySchema().evaluate(ddf, "test", warn=False)
+
+    assert evaluation.key.validation_set.validations[0].original_issues == 3
+    assert evaluation.pair.validation_set.validations[0].original_issues == 3
+    # Only values seen more than once reach the final merge.
+    (states,) = restored
+    key_counts, _ = states[("key", 0, "original_state")]
+    assert sorted(key_counts.index) == [5, 7]
+
+
+@pytest.mark.parametrize("scheduler", ["sync", "processes"])
+def test_dask_evaluation_with_dtype_amendments(
+    scheduler, amended_dtype_schema, amended_dtype_frame, evaluation_counts
+):
+
+    import dask
+
+    ddf = dd.from_pandas(amended_dtype_frame, npartitions=3)
+
+    with dask.config.set(scheduler=scheduler):
+        amended, evaluation = amended_dtype_schema().evaluate(ddf, "test", warn=False)
+        amended = amended.compute()
+
+    expected_df, expected = amended_dtype_schema().evaluate(
+        amended_dtype_frame, "test", warn=False
+    )
+
+    assert evaluation_counts(evaluation) == evaluation_counts(expected)
+    assert evaluation.label.amended
+    pd.testing.assert_frame_equal(amended, expected_df)
+
+
+def test_dask_amendments_follow_merged_states(
+    distinct_schema, distinct_frame, evaluation_counts
+):
+
+    amended, evaluation = distinct_schema().evaluate(
+        dd.from_pandas(distinct_frame, npartitions=2), "test", warn=False
+    )
+    expected_df, expected = distinct_schema().evaluate(
+        distinct_frame, "test", warn=False
+    )
+
+    assert evaluation_counts(evaluation) == evaluation_counts(expected)
+    assert evaluation.amount.amended
+    pd.testing.assert_frame_equal(amended.compute(), expected_df)
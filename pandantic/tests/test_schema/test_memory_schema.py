@@ -0,0 +1,244 @@
+# pylint: disable=unused-import
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pandantic import columns, memory, reports, schemas, shortcuts, validators
+
+
+class MemorySchema(schemas.DataFrameModel):
+
+    amount = columns.FloatColumn(
+        column_validations=[
+            shortcuts.non_null(mandatory=False),
+            shortcuts.between_range(0, 100).set_amendment(
+                lambda column: column.clip(0, 100)
+            ),
+            shortcuts.max_duplicate_rate(1.0),
+        ]
+    )
+    status = columns.ObjectColumn(
+        column_validations=[
+            shortcuts.in_categories(["new", "paid"]).set_amendment(
+                lambda column: column.where(column.isin(["new", "paid"]), "new"),
+                masked=True,
+            ),
+            shortcuts.max_duplicate_rate(1.0),
+        ]
+    )
+
+
+def build_frame(row_count=10_000):
+    rng = np.random.default_rng(0)
+    amount = rng.uniform(-10, 110, row_count).round(1)
+    amount[::97] = np.nan
+    return pd.DataFrame(
+        {
+            "amount": amount,
+            "status": rng.choice(["new", "paid", "void"], row_count),
+        },
+        index=np.arange(row_count) * 2,
+    )
+
+
+def test_parse_size():
+
+    assert memory.parse_size("4GB") == 4 * 10**9
+    assert memory.parse_size("512 MiB") == 512 * 2**20
+    assert memory.parse_size("1e6") == 10**6
+    assert memory.parse_size(2048) == 2048
+    with pytest.raises(ValueError):
+        memory.parse_size("4 parsecs")
+    with pytest.raises(ValueError):
+        memory.parse_size(0)
+
+
+def test_estimates_account_for_amendments():
+
+    column = build_frame()["amount"]
+    validator = shortcuts.between_range(0, 100)
+    validator_set = validators.ValidatorSet()
+    validator_set.add_validator(validator)
+
+    plain_peak = memory.estimate_peak(validator_set, column)
+    validator.set_amendment(lambda values: values.clip(0, 100))
+
+    assert memory.estimate_peak(validator_set, column) == plain_peak + column.nbytes
+    assert set(MemorySchema().estimate_memory(build_frame())) == {"amount", "status"}
+
+
+def test_memory_limit_gives_the_same_evaluation(monkeypatch):
+
+    df = build_frame()
+    block_sizes = dict()
+    evaluate_blocks = columns.Column.evaluate_blocks
+
+    def record_blocks(self, column, rows_per_block):
+        block_sizes[column.name] = rows_per_block
+        return evaluate_blocks(self, column, rows_per_block)
+
+    monkeypatch.setattr(columns.Column, "evaluate_blocks", record_blocks)
+
+    expected_df, expected = MemorySchema().evaluate(df, "payments", warn=False)
+    result_df, evaluation = MemorySchema().evaluate(
+        df, "payments", warn=False, memory_limit="200KB"
+    )
+
+    assert set(block_sizes) == {"amount", "status"}
+    for column_name, rows_per_block in block_sizes.items():
+        block_peak = memory.estimate_peak(
+            MemorySchema().get_columns()[column_name].column_validators,
+            df[column_name].iloc[:rows_per_block],
+        )
+        assert rows_per_block < len(df)
+        assert block_peak <= 200_000
+    pd.testing.assert_frame_equal(result_df, expected_df)
+    pd.testing.assert_frame_equal(
+        pd.DataFrame(reports.to_records(evaluation)).drop(columns="elapsed"),
+        pd.DataFrame(reports.to_records(expected)).drop(columns="elapsed"),
+    )
+
+
+def test_columns_fitting_the_limit_are_not_split(monkeypatch):
+    def fail(*args):
+        raise AssertionError("The column should be evaluated whole.")
+
+    monkeypatch.setattr(columns.Column, "evaluate_blocks", fail)
+
+    MemorySchema().evaluate(
+        build_frame(100), "payments", warn=False, memory_limit="4GB"
+    )
+
+
+def test_columns_that_cannot_be_split_are_rejected():
+    class RelativeValidator(validators.Validator):
+        row_local = False
+
+        def _evaluate(self, column):
+            return 0, True
+
+    class RelativeSchema(schemas.DataFrameModel):
+        amount = columns.FloatColumn(column_validations=[RelativeValidator()])
+
+    with pytest.raises(ValueError):
+        RelativeSchema().evaluate(build_frame(), "payments", memory_limit="10KB")
+
+
+@pytest.mark.filterwarnings("ignore::FutureWarning")
+@pytest.mark.parametrize(
+    "column_declaration, values",
+    [
+        (
+            columns.IntColumn(column_validations=[shortcuts.between_range(0, 50)]),
+            [str(value) for value in range(8)] + ["x"] + ["9", "10", "11"],
+        ),
+        (
+            columns.IntColumn(column_validations=[shortcuts.between_range(0, 50)]),
+            [str(value) for value in range(12)],
+        ),
+        (
+            columns.DatetimeColumn(datetime_format="%Y-%m-%d"),
+            ["2024-01-0{}".format(day) for day in range(1, 8)] + ["never"],
+        ),
+        (
+            columns.CategoryColumn(
+                column_validations=[shortcuts.in_categories(["a", "b"])]
+            ),
+            ["a", "b", "a", "b", "a", "b", "b"],
+        ),
+    ],
+    ids=["int-invalid", "int-amended", "datetime", "category"],
+)
+def test_blocks_with_dtype_amendments(column_declaration, values):
+
+    column = pd.Series(values, index=np.arange(len(values)) * 3, name="value")
+
+    expected_column, expected = column_declaration.evaluate(column)
+    result_column, evaluation = column_declaration.evaluate_blocks(column, 3)
+
+    pd.testing.assert_series_equal(
+        result_column, pd.Series(expected_column, index=column.index, name="value")
+    )
+    assert [
+        (validation.original_issues, validation.pending_issues, validation.valid)
+        for validation in evaluation.validation_set
+    ] == [
+        (validation.original_issues, validation.pending_issues, validation.valid)
+        for validation in expected.validation_set
+    ]
+
+
+def test_keyed_states_stay_within_the_memory_limit():
+    class SpreadValidator(validators.NonNullValidator):
+        # Forces row blocks, as amendments of wide rows would.
+        temporary_row_bytes = 400
+
+    class KeySchema(schemas.DataFrameModel):
+        key = columns.FloatColumn(
+            column_validations=[
+                SpreadValidator(mandatory=False),
+                shortcuts.is_unique(mandatory=False),
+            ]
+        )
+
+    df = pd.DataFrame({"key": np.random.default_rng(0).uniform(0, 1, 200_000)})
+    memory_limit = 20_000_000
+
+    tracemalloc.start()
+    try:
+        KeySchema().evaluate(df, "keys", memory_limit=memory_limit)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    # Value counts of every distinct key would pile up across blocks.
+    assert peak <= memory_limit
+
+
+@pytest.mark.filterwarnings("ignore::FutureWarning")
+def test_memory_limit_with_dtype_amendment():
+    class StringAmountSchema(schemas.DataFrameModel):
+        amount = columns.IntColumn(
+            column_validations=[
+                shortcuts.quantile_between(0.5, 0, 1000),
+                shortcuts.non_null(),
+            ]
+        )
+
+    df = pd.DataFrame({"amount": [str(value) for value in range(200)]})
+    validator_set = StringAmountSchema().get_columns()["amount"].column_validators
+    dtype_validators = validators.ValidatorSet()
+    dtype_validators.add_validator(list(validator_set)[-1])
+    dtype_peak = memory.estimate_peak(dtype_validators, df["amount"])
+    assert dtype_peak < memory.estimate_peak(validator_set, df["amount"])
+
+    expected_df, expected = StringAmountSchema().evaluate(df, "amounts")
+    result_df, evaluation = StringAmountSchema().evaluate(
+        df, "amounts", memory_limit=dtype_peak
+    )
+
+    pd.testing.assert_frame_equal(result_df, expected_df)
+    assert [
+        validation.pending_issues for validation in evaluation.amount.validation_set
+    ] == [validation.pending_issues for validation in expected.amount.validation_set]
+
+    with pytest.raises(ValueError):
+        StringAmountSchema().evaluate(df, "amounts", memory_limit=dtype_peak - 1)
+
+
+def test_memory_limit_amendments_follow_merged_states(distinct_schema, distinct_frame):
+
+    result_df, evaluation = distinct_schema().evaluate(
+        distinct_frame, "test", warn=False, memory_limit=300
+    )
+    expected_df, expected = distinct_schema().evaluate(
+        distinct_frame, "test", warn=False
+    )
+
+    pd.testing.assert_frame_equal(result_df, expected_df)
+    pd.testing.assert_frame_equal(
+        pd.DataFrame(reports.to_records(evaluation)).drop(columns="elapsed"),
+        pd.DataFrame(reports.to_records(expected)).drop(columns="elapsed"),
+    )
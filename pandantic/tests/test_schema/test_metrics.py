@@ -0,0 +1,129 @@
+# pylint: disable=unused-import
+import urllib.request
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pandantic import columns, metrics, schemas, shortcuts
+
+
+class MetricsSchema(schemas.DataFrameModel):
+
+    key = columns.IntColumn([shortcuts.is_unique()])
+    value = columns.NumberColumn([shortcuts.between_range(0, 10)])
+
+
+@pytest.fixture
+def registry():
+    metrics.REGISTRY.clear()
+    metrics.enable()
+    yield metrics.REGISTRY
+    metrics.disable()
+    metrics.REGISTRY.clear()
+
+
+def test_metrics_disabled_by_default():
+
+    metrics.REGISTRY.clear()
+
+    MetricsSchema().evaluate(pd.DataFrame({"key": [1], "value": [1.0]}), "test")
+
+    assert metrics.REGISTRY.rows_validated.get(schema="MetricsSchema") == 0
+
+
+def test_metrics_recorded(registry):
+
+    metrics.enable(column_labels=True)
+
+    df = pd.DataFrame({"key": [1, 2, 3], "value": [1.0, 2.0, 3.0]})
+    MetricsSchema().evaluate(df, "test")
+
+    with pytest.raises(schemas.SchemaEvaluationException):
+        MetricsSchema().evaluate(df.assign(value=20.0), "test")
+
+    assert registry.rows_validated.get(schema="MetricsSchema") == 6
+    assert registry.schema_evaluations.get(schema="MetricsSchema", result="valid") == 1
+    assert (
+        registry.schema_evaluations.get(schema="MetricsSchema", result="invalid") == 1
+    )
+    assert registry.issues.get(validator="RangeValidator") == 3
+    assert registry.validator_seconds.count(validator="UniqueValidator") == 2
+    assert registry.column_seconds.count(schema="MetricsSchema", column="key") == 2
+
+
+def test_column_labels_are_opt_in(registry):
+
+    MetricsSchema().evaluate(pd.DataFrame({"key": [1], "value": [1.0]}), "test")
+
+    assert registry.schema_seconds.count(schema="MetricsSchema") == 1
+    assert registry.column_seconds.count(schema="MetricsSchema", column="key") == 0
+    assert "pandantic_column_evaluation_seconds_count" not in registry.render()
+
+
+def test_metrics_recorded_by_every_evaluation(registry):
+
+    df = pd.DataFrame({"key": [1, 2, 3, 4], "value": [1.0, 2.0, 3.0, 20.0]})
+    schema = MetricsSchema()
+
+    schema.evaluate_split(df, "test")
+    with pytest.raises(schemas.SchemaEvaluationException):
+        schema.evaluate_chunks([df.iloc[:2], df.iloc[2:]], "test")
+    with pytest.raises(schemas.SchemaEvaluationException):
+        schema.evaluate(df, "test", processes=1)
+    with pytest.raises(ValueError):
+        schema.evaluate_chunks([], "test")
+
+    assert registry.rows_validated.get(schema="MetricsSchema") == 12
+    assert (
+        registry.schema_evaluations.get(schema="MetricsSchema", result="invalid") == 3
+    )
+    assert registry.schema_evaluations.get(schema="MetricsSchema", result="error") == 1
+    assert registry.schema_seconds.count(schema="MetricsSchema") == 4
+
+
+def test_metrics_recorded_by_dask_evaluations(registry):
+
+    dd = pytest.importorskip("dask.dataframe")
+
+    df = pd.DataFrame({"key": [1, 2, 3, 4], "value": [1.0, 2.0, 3.0, 4.0]})
+    MetricsSchema().evaluate(dd.from_pandas(df, npartitions=2), "test")
+
+    assert registry.rows_validated.get(schema="MetricsSchema") == 4
+    assert registry.schema_evaluations.get(schema="MetricsSchema", result="valid") == 1
+
+
+def test_metrics_render(registry):
+
+    MetricsSchema().evaluate(pd.DataFrame({"key": [1], "value": [1.0]}), "test")
+
+    text = registry.render()
+
+    assert "# TYPE pandantic_rows_validated counter" in text
+    assert 'pandantic_rows_validated_total{schema="MetricsSchema"} 1' in text
+    assert (
+        'pandantic_validator_seconds_bucket{validator="RangeValidator",le="+Inf"} 1'
+        in text
+    )
+    assert 'pandantic_validator_seconds_count{validator="RangeValidator"} 1' in text
+
+
+def test_metrics_scrape_endpoint(registry):
+
+    MetricsSchema().evaluate(pd.DataFrame({"key": [1], "value": [1.0]}), "test")
+
+    server = metrics.start_http_server(0)
+    try:
+        port = server.server_address[1]
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics") as response:
+            body = response.read().decode("utf-8")
+            content_type = response.headers["Content-Type"]
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert content_type.startswith("text/plain; version=0.0.4")
+    assert (
+        'pandantic_schema_evaluations_total{schema="MetricsSchema",result="valid"} 1'
+        in body
+    )
@@ -0,0 +1,61 @@
+# pylint: disable=unused-import
+import numpy as np
+import pandas as pd
+import pytest
+
+from pandantic import columns, reports, schemas, shortcuts
+
+pa = pytest.importorskip("pyarrow")
+
+
+class ReportSchema(schemas.DataFrameModel):
+
+    key = columns.IntColumn([shortcuts.is_unique(mandatory=False)])
+    value = columns.NumberColumn([shortcuts.non_null(mandatory=False)])
+    missing = columns.IntColumn()
+    ordered = shortcuts.satisfies("key > 0")
+
+
+def evaluate():
+    df = pd.DataFrame(
+        {"key": [1, 2, 2], "value": [1.0, np.nan, 2.0], "extra": ["a", "b", "c"]}
+    )
+    _, evaluation = ReportSchema().evaluate(df, "batch", warn=False)
+    return evaluation
+
+
+def test_evaluation_to_arrow():
+
+    table = reports.to_arrow(evaluate())
+
+    assert table.schema.field("column").type == pa.dictionary(pa.int32(), pa.string())
+    assert table.num_rows == 7
+
+    frame = table.to_pandas()
+    key_rows = frame[frame.column == "key"]
+    assert list(key_rows.validator) == [
+        "Only unique values.",
+        "Column is integer numeric dtype.",
+    ]
+    assert list(key_rows.original_issues) == [1, 0]
+    assert (key_rows.elapsed >= 0).all()
+
+    assert frame.loc[frame.column == "missing", "kind"].item() == "missing"
+    assert frame.loc[frame.column == "extra", "kind"].item() == "unhandled"
+    assert frame.loc[frame.column == "ordered", "kind"].item() == "frame"
+    assert set(frame.evaluation) == {"batch"}
+
+
+def test_evaluation_parquet_history(tmp_path):
+
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    path = tmp_path / "history.parquet"
+    table = reports.to_arrow(evaluate())
+
+    with pq.ParquetWriter(path, table.schema) as writer:
+        writer.write_table(table)
+        writer.write_table(reports.to_arrow(evaluate()))
+
+    history = pq.read_table(path)
+    assert history.num_rows == 2 * table.num_rows
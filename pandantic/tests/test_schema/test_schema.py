@@ -3,7 +3,7 @@ import pytest
 
 import pandas as pd
 
-from pandantic import columns, schemas
+from pandantic import columns, schemas, shortcuts
 
 
 def test_schema_success():
@@ -97,3 +97,47 @@ def test_schema_warning_missing_cols():
             pytest.fail("Warning expected.")
 
         assert evaluation.column_1.valid
+
+
+def test_schema_frame_validators():
+
+    df = pd.DataFrame({"start": [1, 2, 3], "end": [2, 1, 5]})
+
+    class TestSchema(schemas.DataFrameModel):
+
+        start = columns.IntColumn()
+        end = columns.IntColumn()
+        ordered = shortcuts.satisfies("end >= start")
+        positive = shortcuts.satisfies("start > 0")
+
+    schema_obj = TestSchema()
+
+    with pytest.raises(schemas.SchemaEvaluationException) as error:
+        schema_obj.evaluate(df, "test")
+
+    evaluation = error.value.evaluation
+    assert evaluation.start.valid
+    assert evaluation.positive.valid
+    assert evaluation.ordered.valid is False
+    assert evaluation.ordered.validation_set.validations[0].original_issues == 1
+
+
+def test_schema_frame_validators_amend():
+
+    df = pd.DataFrame({"start": [1, 2, 3], "end": [2, 1, 5]})
+
+    class TestSchema(schemas.DataFrameModel):
+
+        start = columns.IntColumn()
+        end = columns.IntColumn()
+        ordered = shortcuts.satisfies("end >= start").set_amendment(
+            lambda frame: frame.assign(end=frame[["start", "end"]].max(axis=1))
+        )
+
+    schema_obj = TestSchema()
+
+    result, evaluation = schema_obj.evaluate(df, "test")
+
+    assert evaluation.ordered.valid
+    assert evaluation.ordered.amended
+    assert list(result.end) == [2, 2, 5]
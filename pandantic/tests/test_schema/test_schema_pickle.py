@@ -0,0 +1,72 @@
+# pylint: disable=unused-import
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pandantic import columns, datatype_validators, schemas, shortcuts
+
+
+def fill_with_zero(column: pd.Series) -> pd.Series:
+    return column.fillna(0)
+
+
+class PicklableSchema(schemas.DataFrameModel):
+
+    object_column = columns.ObjectColumn()
+    number_column = columns.NumberColumn()
+    int_column = columns.IntColumn(
+        [
+            shortcuts.non_null().set_amendment(fill_with_zero),
+            datatype_validators.IntegerColumnValidator(),
+            shortcuts.between_range(0, 10),
+        ]
+    )
+    float_column = columns.FloatColumn()
+    string_column = columns.StringColumn([shortcuts.match_pattern(r"[a-z]+")])
+    bool_column = columns.BoolColumn()
+    category_column = columns.CategoryColumn()
+    datetime_column = columns.DatetimeColumn()
+    ordered = shortcuts.satisfies("int_column <= 10")
+
+
+@pytest.mark.parametrize(
+    "validator_class", datatype_validators.DatatypeValidator.__subclasses__()
+)
+def test_datatype_validators_pickle(validator_class):
+
+    validator = validator_class()
+
+    restored = pickle.loads(pickle.dumps(validator))
+
+    assert restored.description == validator.description
+    assert restored.amendment is not None
+
+
+def test_schema_pickle_roundtrip():
+
+    df = pd.DataFrame(
+        {
+            "object_column": [1, "a", None],
+            "number_column": ["1", "2", "3"],
+            "int_column": ["1", None, "3"],
+            "float_column": [1.0, 2.0, 3.0],
+            "string_column": ["a", "b", "c"],
+            "bool_column": [True, False, True],
+            "category_column": ["x", "y", "x"],
+            "datetime_column": ["2022-01-01", "2022-01-02", "2022-01-03"],
+        }
+    )
+
+    schema_obj = pickle.loads(pickle.dumps(PicklableSchema()))
+
+    assert set(schema_obj.get_columns()) == set(PicklableSchema().get_columns())
+    assert set(schema_obj.get_frame_validators()) == {"ordered"}
+
+    result, evaluation = schema_obj.evaluate(df, "test")
+
+    assert evaluation.int_column.valid
+    assert evaluation.int_column.amended
+    assert evaluation.ordered.valid
+    assert list(result.int_column) == [1, 0, 3]
@@ -0,0 +1,134 @@
+# pylint: disable=unused-import
+import numpy as np
+import pandas as pd
+import pytest
+
+from pandantic import columns, schemas, shortcuts
+
+
+class SplitSchema(schemas.DataFrameModel):
+
+    key = columns.IntColumn([shortcuts.is_unique()])
+    value = columns.NumberColumn([shortcuts.non_null(), shortcuts.between_range(0, 10)])
+    label = columns.Column([shortcuts.in_categories(["a", "b"], mandatory=False)])
+    ordered = shortcuts.satisfies("value <= key")
+
+
+def test_schema_split_rows():
+
+    df = pd.DataFrame(
+        {
+            "key": [1, 2, 3, 3, 5, 6],
+            "value": [1.0, np.nan, 3.0, 1.0, 50.0, 7.0],
+            "label": ["a", "b", "c", "a", "b", "a"],
+        }
+    )
+
+    valid_df, rejected_df, evaluation = SplitSchema().evaluate_split(
+        df, "test", warn=False
+    )
+
+    assert list(valid_df.index) == [0, 2]
+    assert list(rejected_df.index) == [1, 3, 4, 5]
+    assert list(rejected_df.rejection_reason.astype(str)) == [
+        "value: No null values.",
+        "key: Only unique values.",
+        "value: Values are between 0 and 10 (both inclusive)",
+        "ordered: Rows satisfy value <= key.",
+    ]
+    assert rejected_df.rejection_reason.dtype == "category"
+    assert evaluation.value.valid is False
+    assert evaluation.label.warnings
+
+    range_validation = evaluation.value.validation_set.validations[1]
+    assert range_validation.original_issues == 1
+
+
+def test_schema_split_all_valid():
+
+    df = pd.DataFrame({"key": [1, 2], "value": [1.0, 2.0], "label": ["a", "b"]})
+
+    valid_df, rejected_df, evaluation = SplitSchema().evaluate_split(df, "test")
+
+    assert len(valid_df) == 2
+    assert rejected_df.empty
+    assert evaluation.key.valid
+
+
+def test_schema_split_column_failure_rejects_all_rows():
+
+    df = pd.DataFrame({"key": ["x", "y"], "value": [1.0, 2.0], "label": ["a", "b"]})
+
+    valid_df, rejected_df, _ = SplitSchema().evaluate_split(df, "test", warn=False)
+
+    assert valid_df.empty
+    assert len(rejected_df) == 2
+    assert set(rejected_df.rejection_reason.astype(str)) == {
+        "key: Column is integer numeric dtype."
+    }
+
+
+def test_schema_split_scans_failing_rows_once(monkeypatch):
+
+    from pandantic import frame_validators, validators
+
+    calls = []
+    for validator_class in (
+        validators.UniqueValidator,
+        validators.RangeValidator,
+        frame_validators.ExpressionValidator,
+    ):
+        failure_mask = validator_class.failure_mask
+
+        def counting_failure_mask(self, column, failure_mask=failure_mask):
+            calls.append(type(self).__name__)
+            return failure_mask(self, column)
+
+        monkeypatch.setattr(validator_class, "failure_mask", counting_failure_mask)
+
+    df = pd.DataFrame(
+        {
+            "key": [1, 2, 3, 3, 5, 6],
+            "value": [1.0, 2.0, 3.0, 1.0, 50.0, 7.0],
+            "label": ["a", "b", "a", "a", "b", "a"],
+        }
+    )
+
+    valid_df, rejected_df, evaluation = SplitSchema().evaluate_split(
+        df, "test", warn=False
+    )
+
+    assert sorted(calls) == [
+        "ExpressionValidator",
+        "RangeValidator",
+        "UniqueValidator",
+    ]
+    assert list(rejected_df.index) == [3, 4, 5]
+    assert evaluation.key.validation_set.validations[0].original_issues == 1
+    assert evaluation.ordered.validation_set.validations[0].original_issues == 2
+
+
+@pytest.mark.parametrize("masked", [False, True])
+def test_schema_split_keeps_rows_repaired_by_amendments(masked):
+    class ClippedSchema(schemas.DataFrameModel):
+
+        # Clipping repairs the negative values only.
+        value = columns.NumberColumn(
+            [
+                shortcuts.between_range(0, 100).set_amendment(
+                    lambda column: column.clip(lower=0), masked=masked
+                )
+            ]
+        )
+
+    df = pd.DataFrame({"value": [-5.0, 10.0, 500.0, 20.0]})
+
+    valid_df, rejected_df, evaluation = ClippedSchema().evaluate_split(
+        df, "test", warn=False
+    )
+
+    assert list(valid_df.index) == [0, 1, 3]
+    assert valid_df.loc[0, "value"] == 0
+    assert list(rejected_df.index) == [2]
+    range_validation = evaluation.value.validation_set.validations[0]
+    assert (range_validation.original_issues, range_validation.pending_issues) == (2, 1)
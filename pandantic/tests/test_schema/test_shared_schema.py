@@ -0,0 +1,144 @@
+# pylint: disable=unused-import
+import numpy as np
+import pandas as pd
+import pytest
+
+from pandantic import shared, summaries
+
+
+@pytest.mark.parametrize("rows_per_task", [None, 3])
+def test_shared_evaluation_matches_pandas(
+    rows_per_task, parts_schema, parts_frame, evaluation_counts
+):
+
+    df = parts_frame
+
+    amended, evaluation = shared.evaluate_shared(
+        parts_schema(), df, "test", warn=False, processes=2, rows_per_task=rows_per_task
+    )
+    expected_df, expected = parts_schema().evaluate(df, "test", warn=False)
+
+    assert evaluation_counts(evaluation) == evaluation_counts(expected)
+
+    assert evaluation.key.validation_set.validations[0].original_issues == 2
+    pd.testing.assert_frame_equal(amended, expected_df)
+    assert df["value"].isnull().sum() == 2
+
+
+def test_schema_evaluate_with_processes(parts_schema, parts_frame):
+
+    amended, evaluation = parts_schema().evaluate(
+        parts_frame, "test", warn=False, processes=2
+    )
+
+    assert evaluation.value.amended
+    assert amended["value"].isnull().sum() == 0
+
+
+def test_shared_column_round_trip():
+
+    blocks = []
+    column = pd.Series(np.arange(10, dtype="int32"))
+    try:
+        shared_column = shared.SharedColumn.share(column, blocks)
+        part = shared_column.part(2, 5).read()
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+    assert shared_column.storage == "numpy"
+    assert part.tolist() == [2, 3, 4]
+
+
+def test_shared_arrow_column_round_trip():
+
+    pytest.importorskip("pyarrow")
+
+    blocks = []
+    column = pd.Series(["a", None, "ccc", "d"], dtype="string[pyarrow]")
+    try:
+        shared_column = shared.SharedColumn.share(column, blocks)
+        part = shared_column.part(1, 3).read()
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+    assert shared_column.storage == "arrow"
+    assert part.dtype == column.dtype
+    assert part.isnull().tolist() == [True, False]
+    assert part.iloc[1] == "ccc"
+
+
+@pytest.mark.parametrize("rows_per_task", [None, 2])
+def test_shared_evaluation_with_dtype_amendments(
+    rows_per_task, amended_dtype_schema, amended_dtype_frame, evaluation_counts
+):
+
+    df = amended_dtype_frame
+
+    amended, evaluation = shared.evaluate_shared(
+        amended_dtype_schema(),
+        df,
+        "test",
+        warn=False,
+        processes=2,
+        rows_per_task=rows_per_task,
+    )
+    expected_df, expected = amended_dtype_schema().evaluate(df, "test", warn=False)
+
+    assert evaluation_counts(evaluation) == evaluation_counts(expected)
+    assert evaluation.label.amended
+    pd.testing.assert_frame_equal(amended, expected_df)
+    assert df["count"].tolist() == ["1", "2", "3", "4", "500"]
+
+
+def test_shared_amendments_follow_merged_states(
+    distinct_schema, distinct_frame, evaluation_counts
+):
+
+    amended, evaluation = shared.evaluate_shared(
+        distinct_schema(),
+        distinct_frame,
+        "test",
+        warn=False,
+        processes=2,
+        rows_per_task=2,
+    )
+    expected_df, expected = distinct_schema().evaluate(
+        distinct_frame, "test", warn=False
+    )
+
+    assert evaluation_counts(evaluation) == evaluation_counts(expected)
+    assert evaluation.amount.amended
+    pd.testing.assert_frame_equal(amended, expected_df)
+
+
+@pytest.mark.parametrize("whole_column", [True, False])
+def test_whole_column_tasks_return_counts_only(whole_column, parts_schema, parts_frame):
+
+    schema = parts_schema()
+    validator_list = summaries.validator_list(schema, "key")
+    phase_arguments = (
+        []
+        if whole_column
+        else [summaries.phases(validator_list)[0], summaries.Decision(False, False)]
+    )
+
+    shared._initialize_worker(schema)
+    blocks = []
+    try:
+        shared_column = shared.SharedColumn.share(parts_frame["key"], blocks)
+        column_summary, _ = shared._evaluate_rows(
+            "key", shared_column, *phase_arguments
+        )
+    finally:
+        shared._initialize_worker(None)
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+    unique_summary = column_summary.validation_summaries[0]
+    assert (unique_summary.original_state is None) is whole_column
+    assert unique_summary.to_validation(validator_list[0]).original_issues == 2
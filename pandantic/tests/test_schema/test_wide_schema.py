@@ -0,0 +1,107 @@
+# pylint: disable=unused-import
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pandantic import columns, evaluations, reports, schemas, shortcuts
+
+
+def _wide_schema(column_count):
+    attributes = {
+        f"sensor_{position}": columns.FloatColumn(
+            column_validations=[shortcuts.between_range(0, 1)]
+        )
+        for position in range(column_count)
+    }
+    return type("WideSchema", (schemas.DataFrameModel,), attributes)()
+
+
+def test_wide_evaluation_matches_default():
+
+    schema = _wide_schema(50)
+    df = pd.DataFrame(
+        np.random.default_rng(0).random((20, 50)),
+        columns=[f"sensor_{position}" for position in range(50)],
+        index=[0] * 20,
+    )
+
+    default_df, default_evaluation = schema.evaluate(df, "sensors")
+    wide_df, wide_evaluation = schema.evaluate(df, "sensors", wide=True)
+
+    assert isinstance(wide_evaluation, evaluations.SchemaEvaluation)
+    assert wide_evaluation.name == "sensors"
+    assert list(wide_evaluation) == list(default_evaluation._fields)
+    assert wide_evaluation.sensor_3.valid
+    assert wide_evaluation["sensor_3"] is wide_evaluation.sensor_3
+    pd.testing.assert_frame_equal(wide_df, default_df)
+
+
+def test_wide_evaluation_keeps_amendments_and_unhandled_columns():
+    class TestSchema(schemas.DataFrameModel):
+
+        value = columns.IntColumn(
+            column_validations=[
+                shortcuts.between_range(0, 10).set_amendment(
+                    lambda column: column.clip(0, 10)
+                )
+            ]
+        )
+
+    df = pd.DataFrame({"extra": ["a", "b"], "value": [5, 50]})
+
+    result_df, evaluation = TestSchema().evaluate(df, "test", warn=False, wide=True)
+
+    assert list(result_df.columns) == ["extra", "value"]
+    assert result_df["value"].tolist() == [5, 10]
+    assert result_df["extra"].tolist() == ["a", "b"]
+    assert df["value"].tolist() == [5, 50]
+    assert evaluation.value.amended
+    assert isinstance(evaluation.extra, evaluations.UnhandledColumn)
+
+
+def test_wide_evaluation_raises_with_evaluation():
+
+    schema = _wide_schema(3)
+    df = pd.DataFrame({"sensor_0": [0.5], "sensor_1": [2.0], "sensor_2": [0.1]})
+
+    with pytest.raises(schemas.SchemaEvaluationException) as error:
+        schema.evaluate(df, "sensors", wide=True)
+
+    assert not error.value.evaluation.sensor_1.valid
+    assert error.value.evaluation.sensor_0.valid
+
+
+def test_wide_evaluation_exports_and_pickles():
+
+    pytest.importorskip("pyarrow")
+
+    schema = _wide_schema(2)
+    df = pd.DataFrame({"sensor_0": [0.5], "sensor_1": [0.2]})
+
+    _, evaluation = schema.evaluate(df, "sensors", wide=True)
+
+    table = reports.to_arrow(evaluation)
+    assert set(table.column("evaluation").to_pylist()) == {"sensors"}
+
+    restored = pickle.loads(pickle.dumps(evaluation))
+    assert restored.name == "sensors"
+    assert list(restored) == ["sensor_0", "sensor_1"]
+
+
+def test_wide_evaluation_with_categorical_amendment():
+    class CategorySchema(schemas.DataFrameModel):
+
+        label = columns.CategoryColumn()
+        value = columns.IntColumn()
+
+    df = pd.DataFrame({"label": ["a", "b", "a"], "value": [1, 2, 3]}, index=[7, 8, 9])
+
+    result_df, evaluation = CategorySchema().evaluate(df, "test", warn=False, wide=True)
+
+    assert evaluation.label.amended
+    assert list(result_df.index) == [7, 8, 9]
+    assert isinstance(result_df["label"].dtype, pd.CategoricalDtype)
+    assert result_df["label"].tolist() == ["a", "b", "a"]
+    assert result_df["value"].tolist() == [1, 2, 3]
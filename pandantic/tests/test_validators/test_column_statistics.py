@@ -0,0 +1,95 @@
+# pylint: disable=unused-import
+import numpy as np
+import pandas as pd
+import pytest
+
+from pandantic import shortcuts, statistics, validators
+
+
+def test_column_statistics_values():
+
+    col = pd.Series([1, 2, 2, np.nan, 5])
+
+    column_statistics = statistics.ColumnStatistics(col)
+
+    assert column_statistics.null_count == 1
+    assert column_statistics.non_null_count == 4
+    assert column_statistics.min == 1
+    assert column_statistics.max == 5
+    assert list(column_statistics.uniques) == [1, 2, 5]
+    assert list(column_statistics.unique_counts) == [1, 2, 1]
+    assert column_statistics.distinct_count == 4
+
+
+def test_column_statistics_non_numeric_min_max():
+
+    column_statistics = statistics.ColumnStatistics(pd.Series(["a", "b"]))
+
+    assert column_statistics.min is None
+    assert column_statistics.max is None
+
+
+def test_validator_set_factorizes_once(monkeypatch):
+
+    calls = []
+    factorize = pd.factorize
+
+    def counting_factorize(*args, **kwargs):
+        calls.append(1)
+        return factorize(*args, **kwargs)
+
+    monkeypatch.setattr(pd, "factorize", counting_factorize)
+
+    col = pd.Series(["a", "b", "b", None])
+
+    validator_set = validators.ValidatorSet()
+    validator_set.add_validator(shortcuts.in_categories(["a", "b"]))
+    validator_set.add_validator(shortcuts.is_unique(mandatory=False))
+
+    _, validation_set = validator_set.validate(col)
+
+    assert len(calls) == 1
+    assert validation_set.validations[0].valid
+    assert validation_set.validations[1].original_issues == 1
+
+
+def test_validator_set_statistics_invalidated_by_amendment():
+
+    col = pd.Series(["a", None, None])
+
+    validator_set = validators.ValidatorSet()
+    validator_set.add_validator(
+        shortcuts.non_null().set_amendment(lambda column: column.fillna("b"))
+    )
+    validator_set.add_validator(shortcuts.in_categories(["a"], mandatory=False))
+
+    _, validation_set = validator_set.validate(col)
+
+    assert validation_set.validations[0].amended
+    assert validation_set.validations[0].pending_issues == 0
+    assert validation_set.validations[1].original_issues == 2
+
+
+@pytest.mark.parametrize("unique_first", [False, True])
+def test_categories_factorize_only_when_shared(monkeypatch, unique_first):
+
+    calls = []
+    factorize = pd.factorize
+
+    def counting_factorize(*args, **kwargs):
+        calls.append(1)
+        return factorize(*args, **kwargs)
+
+    monkeypatch.setattr(pd, "factorize", counting_factorize)
+
+    col = pd.Series(["a", "c", "c", None, "b"])
+
+    validator_set = validators.ValidatorSet()
+    if unique_first:
+        validator_set.add_validator(shortcuts.is_unique(mandatory=False))
+    validator_set.add_validator(shortcuts.in_categories(["a", "b"], mandatory=False))
+
+    _, validation_set = validator_set.validate(col)
+
+    assert len(calls) == (1 if unique_first else 0)
+    assert validation_set.validations[-1].original_issues == 2
@@ -0,0 +1,109 @@
+# pylint: disable=unused-import
+import numpy as np
+import pandas as pd
+import pytest
+
+from pandantic import columns, frame_validators, schemas, shortcuts, sketches
+
+
+def build_frame():
+    return pd.DataFrame(
+        {
+            "tenant_id": ["a", "a", "a", "b", "b", "a"],
+            "order_id": [1, 1, 2, 1, 1, 1],
+            "line_no": [1, 2, 1, 1, 1, 1],
+        }
+    )
+
+
+def test_unique_key():
+
+    validator = shortcuts.unique_key(["tenant_id", "order_id", "line_no"])
+
+    _, validation = validator.evaluate(build_frame())
+
+    assert validation.original_issues == 2
+    assert validation.valid is False
+    assert list(validator.failure_mask(build_frame())) == [
+        False,
+        False,
+        False,
+        False,
+        True,
+        True,
+    ]
+
+
+def test_unique_key_confirms_fingerprint_collisions(monkeypatch):
+
+    # Every row shares the same fingerprint; only equal keys are duplicates.
+    monkeypatch.setattr(
+        sketches, "hash_values", lambda frame: np.zeros(len(frame), dtype=np.uint64)
+    )
+    validator = shortcuts.unique_key(["tenant_id", "order_id", "line_no"])
+
+    _, validation = validator.evaluate(build_frame())
+
+    assert validation.original_issues == 2
+    assert validator.failure_mask(build_frame()).sum() == 2
+
+
+def test_unique_key_states_merge():
+
+    validator = shortcuts.unique_key(["tenant_id", "order_id", "line_no"])
+    frame = build_frame()
+
+    state = validator.merge(
+        validator.partial(frame.iloc[:4]), validator.partial(frame.iloc[4:])
+    )
+
+    assert validator.finalize(state) == (2, False)
+
+
+def test_unique_key_states_confirm_fingerprint_collisions(monkeypatch):
+
+    monkeypatch.setattr(
+        sketches, "hash_values", lambda frame: np.zeros(len(frame), dtype=np.uint64)
+    )
+    validator = shortcuts.unique_key(["tenant_id", "order_id", "line_no"])
+    frame = build_frame()
+
+    state = validator.merge(
+        validator.partial(frame.iloc[:4]), validator.partial(frame.iloc[4:])
+    )
+    buckets = [
+        validator.compact(bucket_state) for bucket_state in validator.split(state, 3)
+    ]
+
+    assert validator.finalize(state) == (2, False)
+    assert sum(validator.finalize(bucket_state)[0] for bucket_state in buckets) == 2
+    assert validator.finalize(
+        validator.merge(
+            validator.partial(frame.iloc[:3]), validator.partial(frame.iloc[3:4])
+        )
+    ) == (0, True)
+
+
+def test_unique_key_in_chunked_evaluation():
+    class KeySchema(schemas.DataFrameModel):
+        tenant_id = columns.ObjectColumn()
+        order_id = columns.IntColumn()
+        line_no = columns.IntColumn()
+
+        primary_key = shortcuts.unique_key(
+            ["tenant_id", "order_id", "line_no"], mandatory=False
+        )
+
+    frame = build_frame()
+    evaluation = KeySchema().evaluate_chunks(
+        [frame.iloc[:3], frame.iloc[3:]], "keys", warn=False
+    )
+
+    assert evaluation.primary_key.warnings is True
+    assert list(evaluation.primary_key.validation_set)[0].original_issues == 2
+
+
+def test_unique_key_requires_columns():
+
+    with pytest.raises(ValueError):
+        shortcuts.unique_key([])
@@ -0,0 +1,80 @@
+# pylint: disable=unused-import
+import numpy as np
+import pandas as pd
+import pytest
+
+from pandantic import frame_validators, shortcuts, validations
+
+
+def test_expression_validator_correct_frame():
+
+    df = pd.DataFrame({"start": [1, 2, 3], "end": [2, 2, 5]})
+
+    validator = frame_validators.ExpressionValidator("end >= start")
+
+    frame, validation = validator.evaluate(df)
+    assert df.equals(frame)
+    assert not validation.original_issues
+    assert validation.valid
+    assert validation.amended is False
+
+
+def test_expression_validator_wrong_frame():
+
+    df = pd.DataFrame({"gross": [10, 20, 30], "tax": [1, 2, 3], "net": [9, 17, 27]})
+
+    validator = shortcuts.satisfies("net == gross - tax", mandatory=False)
+
+    _, validation = validator.evaluate(df)
+    assert validation.original_issues == 1
+    assert validation.valid is False
+
+
+def test_expression_validator_amend():
+
+    df = pd.DataFrame({"gross": [10, 20, 30], "tax": [1, 2, 3], "net": [9, 17, 27]})
+
+    validator = shortcuts.satisfies("net == gross - tax").set_amendment(
+        lambda frame: frame.assign(net=frame.gross - frame.tax)
+    )
+
+    frame, validation = validator.evaluate(df)
+    assert validation.original_issues == 1
+    assert validation.pending_issues == 0
+    assert validation.valid
+    assert validation.amended
+    assert list(frame.net) == [9, 18, 27]
+
+
+def test_expression_validator_copies_frames_to_amend_only():
+
+    df = pd.DataFrame({"gross": [10, 20], "net": [9, 30]})
+
+    validator = shortcuts.satisfies("net <= gross", mandatory=False)
+    frame, _ = validator.evaluate(df)
+    assert frame is df
+
+    def cap_in_place(frame):
+        frame.loc[frame.net > frame.gross, "net"] = frame.gross
+        return frame
+
+    frame, validation = validator.set_amendment(cap_in_place).evaluate(df)
+    assert validation.amended
+    assert list(frame.net) == [9, 20]
+    assert list(df.net) == [9, 30]
+
+
+def test_expression_validator_requires_frame():
+
+    validator = shortcuts.satisfies("a > 0")
+
+    with pytest.raises(TypeError):
+        validator.evaluate(pd.Series([1, 2]))
+
+
+def test_expression_validator_unknown_column():
+
+    validator = shortcuts.satisfies("missing > 0")
+
+    with pytest.raises(validations.ValidationError):
+        validator.evaluate(pd.DataFrame({"a": [1]}))
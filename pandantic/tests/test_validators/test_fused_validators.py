@@ -0,0 +1,167 @@
+# pylint: disable=unused-import
+import numpy as np
+import pandas as pd
+import pytest
+
+from pandantic import fusion, shortcuts, validations, validators
+
+
+@pytest.fixture(params=[True, False], ids=["numba", "fallback"])
+def fusion_backend(request, monkeypatch):
+    if request.param and fusion.numba is None:
+        pytest.skip("numba is not installed")
+    if not request.param:
+        monkeypatch.setattr(fusion, "numba", None)
+    return request.param
+
+
+@pytest.fixture(autouse=True)
+def fuse_short_columns(monkeypatch):
+    monkeypatch.setattr(validators.ValidatorSet, "fuse_min_rows", 0)
+
+
+@pytest.fixture
+def fused_calls(monkeypatch):
+    calls = []
+    count_issues = fusion.count_issues
+
+    def record_call(values, checks):
+        calls.append(len(checks))
+        return count_issues(values, checks)
+
+    monkeypatch.setattr(fusion, "count_issues", record_call)
+    return calls
+
+
+def build_validator_set(*column_validators, fuse=True):
+    validator_set = validators.ValidatorSet()
+    validator_set.fuse = fuse
+    for validator in column_validators:
+        validator_set.add_validator(validator)
+    return validator_set
+
+
+def build_validators():
+    return [
+        shortcuts.non_null(mandatory=False),
+        shortcuts.between_range(0, 10, inclusive="left", mandatory=False),
+        shortcuts.lower_than(8, mandatory=False),
+        shortcuts.in_categories([1, 2, 2.5, 3], mandatory=False),
+    ]
+
+
+def issues(validator_set, column):
+    return [
+        (type(validation).__name__, validation.original_issues, validation.valid)
+        for _, _, _, validation in validator_set.iter_validate(column)
+    ]
+
+
+@pytest.mark.parametrize(
+    "column, fused_count",
+    [
+        (pd.Series([1.0, 2.5, np.nan, 10.0, -np.inf, 3.0, 9.0]), 4),
+        # non_null is proven from the dtype of integer columns.
+        (pd.Series([1, 2, 3, 10, -1, 7, 3]), 3),
+        (pd.Series([1, 2, 3, 200, 0], dtype="uint8"), 3),
+    ],
+    ids=["float", "int", "uint8"],
+)
+def test_fused_evaluation_matches_separate_scans(
+    fusion_backend, fused_calls, column, fused_count
+):
+
+    fused = issues(build_validator_set(*build_validators()), column)
+    separate = issues(build_validator_set(*build_validators(), fuse=False), column)
+
+    assert fused == separate
+    assert fused_calls == [fused_count]
+
+
+def test_fused_evaluation_keeps_suspensions(fusion_backend, fused_calls):
+
+    validator_set = build_validator_set(
+        shortcuts.non_null(),
+        shortcuts.between_range(0, 1),
+        shortcuts.in_categories([0, 1]),
+    )
+
+    result = issues(validator_set, pd.Series([0.0, 1.0, 5.0]))
+
+    assert result == [
+        ("Validation", 0, True),
+        ("Validation", 1, False),
+        ("SuspendedValidation", None, False),
+    ]
+    assert fused_calls == [3]
+
+
+def test_amending_validators_are_not_fused(fused_calls):
+
+    validator_set = build_validator_set(
+        shortcuts.non_null(mandatory=False),
+        shortcuts.between_range(0, 1).set_amendment(lambda column: column.clip(0, 1)),
+        shortcuts.in_categories([0, 1], mandatory=False),
+        shortcuts.non_null(mandatory=False),
+    )
+
+    column, validation_set = validator_set.validate(pd.Series([0.0, 0.5, 5.0]))
+
+    assert column.tolist() == [0.0, 0.5, 1.0]
+    assert [validation.pending_issues for validation in validation_set] == [0, 0, 1, 0]
+    assert fused_calls == [2]
+
+
+def test_non_numeric_columns_are_not_fused(fused_calls):
+
+    validator_set = build_validator_set(
+        shortcuts.non_null(mandatory=False), shortcuts.in_categories(["a", "b"])
+    )
+
+    assert issues(validator_set, pd.Series(["a", "c", None])) == [
+        ("Validation", 1, False),
+        ("Validation", 1, False),
+    ]
+    assert fused_calls == []
+
+
+@pytest.mark.parametrize(
+    "validator, column",
+    [
+        (shortcuts.between_range(0, 2**53), pd.Series([2**53 + 1, 2**53, 0])),
+        (
+            shortcuts.between_range(-(2**62), 2**62, inclusive="neither"),
+            pd.Series([2**62, 2**62 - 1, -(2**62)]),
+        ),
+        (shortcuts.between_range(0.5, 2.5), pd.Series([0, 1, 2, 3])),
+        (shortcuts.between_range(-1000, 200), pd.Series([0, 255], dtype="uint8")),
+        (
+            shortcuts.greater_than(2**63),
+            pd.Series([2**63 + 1, 2**63 - 1], dtype="uint64"),
+        ),
+    ],
+    ids=["beyond-2**53", "exclusive", "fractional", "wider-bounds", "uint64"],
+)
+def test_fused_integer_ranges_are_exact(fusion_backend, fused_calls, validator, column):
+
+    column_validators = [
+        validator,
+        shortcuts.in_categories([0, 1, 2**53 + 1], mandatory=False),
+    ]
+
+    fused = issues(build_validator_set(*column_validators), column)
+    separate = issues(build_validator_set(*column_validators, fuse=False), column)
+
+    assert fused == separate
+    assert fused_calls == [2]
+
+
+def test_short_columns_are_not_fused(monkeypatch, fused_calls):
+
+    monkeypatch.setattr(validators.ValidatorSet, "fuse_min_rows", 4)
+    validator_set = build_validator_set(*build_validators())
+
+    issues(validator_set, pd.Series([1.0, 2.0, np.nan]))
+    issues(validator_set, pd.Series([1.0, 2.0, np.nan, 4.0]))
+
+    assert fused_calls == [4]
@@ -0,0 +1,123 @@
+# pylint: disable=unused-import
+import numpy as np
+import pandas as pd
+import pytest
+
+from pandantic import columns, frame_validators, schemas, shortcuts
+
+
+def build_frame():
+    return pd.DataFrame(
+        {
+            "tenant": ["a", "a", "a", "b", "b", "c", "c"],
+            "region": ["eu", "eu", "us", "us", "us", "eu", "eu"],
+            "user": [1, 1, 2, 1, 2, 3, 3],
+            "score": [5.0, np.nan, 50.0, 7.0, np.nan, np.nan, np.nan],
+        },
+        index=[10, 10, 11, 12, 13, 14, 15],
+    )
+
+
+def test_unique_per_group():
+
+    validator = shortcuts.unique_per_group("tenant", "user")
+
+    _, validation = validator.evaluate(build_frame())
+
+    assert validation.original_issues == 2
+    assert validation.valid is False
+    assert validation.additional_info == "2 of 3 groups failing: a (1), c (1)."
+    assert validator.group_issues(build_frame()).to_dict() == {"a": 1, "b": 0, "c": 1}
+    assert validation.details.to_dict() == {"a": 1, "b": 0, "c": 1}
+
+
+def test_non_null_ratio_per_group():
+
+    validator = shortcuts.non_null_ratio_per_group("tenant", "score", min_ratio=0.5)
+
+    _, validation = validator.evaluate(build_frame())
+
+    # Only tenant c is below the ratio; its null values are the issues.
+    assert validation.original_issues == 2
+    assert list(validator.failure_mask(build_frame())) == [
+        False,
+        False,
+        False,
+        False,
+        False,
+        True,
+        True,
+    ]
+
+
+def test_between_range_per_group():
+
+    validator = shortcuts.between_range_per_group(
+        "region", "score", {"eu": (0, 10), "us": (0, 20)}
+    )
+
+    _, validation = validator.evaluate(build_frame())
+
+    assert validation.original_issues == 1
+    assert validator.group_issues(build_frame()).to_dict() == {"eu": 0, "us": 1}
+
+
+def test_between_range_per_group_with_several_keys():
+
+    validator = shortcuts.between_range_per_group(
+        ["tenant", "region"], "score", {("a", "us"): (0, 100)}, default=(0, 6)
+    )
+
+    _, validation = validator.evaluate(build_frame())
+
+    assert validation.original_issues == 1
+    assert validator.group_issues(build_frame()).loc[("b", "us")] == 1
+
+
+def test_per_group_counts_column_validator():
+
+    validator = shortcuts.per_group("tenant", "score", shortcuts.non_null())
+
+    _, validation = validator.evaluate(build_frame())
+
+    assert validation.original_issues == 4
+    assert validator.group_issues(build_frame()).to_dict() == {"a": 1, "b": 1, "c": 2}
+
+    with pytest.raises(ValueError):
+        shortcuts.per_group("tenant", "user", shortcuts.is_unique())
+
+
+def test_group_validators_in_schema():
+    class TenantSchema(schemas.DataFrameModel):
+
+        tenant = columns.ObjectColumn()
+        region = columns.ObjectColumn()
+        user = columns.IntColumn()
+        score = columns.NumberColumn()
+
+        unique_users = shortcuts.unique_per_group("tenant", "user")
+
+    valid, rejected, evaluation = TenantSchema().evaluate_split(
+        build_frame(), "tenants", warn=False
+    )
+
+    assert evaluation.unique_users.valid is False
+    assert len(rejected) == 2
+    assert len(valid) == 5
+
+
+def test_group_issues_add_up_across_chunks():
+    class ScoreSchema(schemas.DataFrameModel):
+
+        score_per_tenant = shortcuts.per_group(
+            "tenant", "score", shortcuts.non_null(), mandatory=False
+        )
+
+    frame = build_frame()
+    evaluation = ScoreSchema().evaluate_chunks(
+        [frame.iloc[:3], frame.iloc[3:]], "scores", warn=False
+    )
+
+    (validation,) = evaluation.score_per_tenant.validation_set
+    assert validation.original_issues == 4
+    assert validation.details.to_dict() == {"a": 1, "b": 1, "c": 2}
@@ -0,0 +1,93 @@
+# pylint: disable=unused-import
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pandantic import kernels
+
+
+@kernels.kernel_validator
+def even_digit_sum(value):
+    total = 0
+    value = abs(int(value))
+    while value:
+        total += value % 10
+        value //= 10
+    return total % 2 == 0
+
+
+@kernels.kernel_validator(vectorized=True)
+def non_decreasing(values, null_mask):
+    valid = np.ones(values.shape[0], dtype=np.bool_)
+    for i in range(1, values.shape[0]):
+        valid[i] = values[i] >= values[i - 1]
+    return valid
+
+
+@pytest.fixture(params=[True, False], ids=["numba", "fallback"])
+def kernel_backend(request, monkeypatch):
+    if request.param and kernels.numba is None:
+        pytest.skip("numba is not installed")
+    if not request.param:
+        monkeypatch.setattr(kernels, "numba", None)
+    monkeypatch.setattr(kernels, "_KERNEL_CACHE", {})
+    return request.param
+
+
+def test_scalar_kernel_validator(kernel_backend):
+
+    col = pd.Series([11, 22, 13, np.nan])
+
+    _, validation = even_digit_sum().evaluate(col)
+    assert validation.original_issues == 0
+    assert validation.valid
+
+    _, validation = even_digit_sum(mandatory=False).evaluate(pd.Series([11, 12, 21]))
+    assert validation.original_issues == 2
+    assert validation.valid is False
+
+
+def test_vectorized_kernel_validator(kernel_backend):
+
+    col = pd.Series([1, 2, 2, 1, 3], dtype="int64")
+
+    _, validation = non_decreasing().evaluate(col)
+    assert validation.original_issues == 1
+    assert validation.valid is False
+
+
+def test_kernel_validator_nullable_dtype(kernel_backend):
+
+    col = pd.Series([11, None, 12], dtype="Int64")
+
+    _, validation = even_digit_sum().evaluate(col)
+    assert validation.original_issues == 1
+
+
+def test_kernel_validator_object_dtype(kernel_backend):
+
+    validator = kernels.KernelValidator(lambda value: value.isupper())
+
+    _, validation = validator.evaluate(pd.Series(["A", "b", None]))
+    assert validation.original_issues == 1
+
+
+def test_kernel_cached_per_dtype(kernel_backend):
+
+    even_digit_sum().evaluate(pd.Series([11, 22], dtype="int64"))
+    even_digit_sum().evaluate(pd.Series([33, 44], dtype="int64"))
+    even_digit_sum().evaluate(pd.Series([11.0, 22.0], dtype="float64"))
+
+    assert len(kernels._KERNEL_CACHE) == 2
+
+
+def test_kernel_validator_pickles():
+
+    validator = even_digit_sum(mandatory=False)
+
+    restored = pickle.loads(pickle.dumps(validator))
+
+    assert restored.mandatory is False
+    assert restored.predicate is even_digit_sum.predicate
@@ -3,7 +3,7 @@ import numpy as np
 import pandas as pd
 import pytest
 
-from pandantic import validators
+from pandantic import shortcuts, validators
 
 
 def test_pattern_validator_correct_series():
@@ -32,3 +32,15 @@ def test_pattern_validator_wrong_series():
 
     _, validation = validator.evaluate(col)
     assert validation.original_issues == 1
+
+
+def test_length_validator():
+
+    col = pd.Series(["a", "bb", "ccc", None])
+
+    validator = shortcuts.has_length(1, 2, mandatory=False)
+
+    _, validation = validator.evaluate(col)
+    assert validation.original_issues == 1
+    assert validation.valid is False
+    assert list(validator.failure_mask(col)) == [False, False, True, False]
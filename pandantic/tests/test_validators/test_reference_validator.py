@@ -0,0 +1,206 @@
+# pylint: disable=unused-import
+import multiprocessing
+import os
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pandantic import references, shortcuts, validators
+
+
+def test_reference_validator_correct_series():
+
+    reference = references.ReferenceIndex.from_values([3, 1, 2, 2, None])
+
+    col = pd.Series([1, 2, 3, np.nan, 1])
+
+    series, validation = shortcuts.in_reference(reference).evaluate(col)
+    assert col.equals(series)
+    assert not validation.original_issues
+    assert validation.valid
+    assert len(reference) == 3
+
+
+def test_reference_validator_wrong():
+
+    customers = pd.DataFrame({"customer_id": ["a", "b", "c"]})
+    reference = references.ReferenceIndex.from_frame(customers, "customer_id")
+
+    col = pd.Series(["a", "d", "d", None, "z"])
+
+    validator = validators.ReferenceValidator(reference, mandatory=False)
+
+    _, validation = validator.evaluate(col)
+    assert validation.original_issues == 3
+    assert validation.valid is False
+    assert list(validator.failure_mask(col)) == [False, True, True, False, True]
+
+
+def test_reference_index_memory_mapped(tmp_path):
+
+    path = str(tmp_path / "customers")
+    references.ReferenceIndex.from_values(np.arange(0, 1_000, 2)).save(path)
+
+    reference = references.ReferenceIndex.load(path)
+    assert isinstance(reference.values, np.memmap)
+
+    restored = pickle.loads(pickle.dumps(reference))
+    assert isinstance(restored.values, np.memmap)
+    assert list(restored.contains([2, 3])) == [True, False]
+
+
+def test_reference_index_incremental_refresh(tmp_path):
+
+    path = str(tmp_path / "customers")
+    writer = references.ReferenceIndex.from_values([1, 5, 9])
+    writer.save(path)
+
+    reader = references.ReferenceIndex.load(path)
+    validator = shortcuts.in_reference(reader)
+
+    _, validation = validator.evaluate(pd.Series([1, 4, 6]))
+    assert validation.original_issues == 2
+
+    writer.update(added=[6, 4, 5], removed=[9])
+    assert list(writer.values) == [1, 4, 5, 6]
+
+    _, validation = validator.evaluate(pd.Series([1, 4, 6, 9]))
+    assert validation.original_issues == 1
+
+
+def test_reference_index_strings_stored_as_bytes():
+
+    reference = references.ReferenceIndex.from_values(["ab", "c", "ab", "déf"])
+
+    _, base, _, _ = reference.state
+    assert isinstance(base, references.StringKeys)
+    assert base.data.dtype == np.uint8
+    assert sorted(reference.values) == ["ab", "c", "déf"]
+    assert list(reference.contains(["déf", "a", "abc", None])) == [
+        True,
+        False,
+        False,
+        False,
+    ]
+
+
+def test_reference_index_float_values_match_integer_strings():
+
+    reference = references.ReferenceIndex.from_values(["1", "2"])
+
+    assert list(reference.contains([1.0, 2.5, 2])) == [True, False, True]
+
+
+def test_reference_index_hash_collisions_compared_exactly(monkeypatch):
+
+    monkeypatch.setattr(
+        references.pd.util,
+        "hash_array",
+        lambda values, **kwargs: np.zeros(len(values), dtype=np.uint64),
+    )
+
+    reference = references.ReferenceIndex.from_values(["a", "bb", "ccc"])
+
+    assert list(reference.contains(["ccc", "bb", "cc", "a", "d"])) == [
+        True,
+        True,
+        False,
+        True,
+        False,
+    ]
+
+
+def test_reference_index_update_appends_deltas(tmp_path, monkeypatch):
+
+    monkeypatch.setattr(references, "MAX_DELTAS", 2)
+
+    path = str(tmp_path / "customers")
+    writer = references.ReferenceIndex.from_values(["a", "b", "c"])
+    writer.save(path)
+    base = writer._manifest(path)["base"]
+    reader = references.ReferenceIndex.load(path)
+
+    writer.update(added=["d"], removed=["a"])
+    manifest = writer._manifest(path)
+    assert manifest["base"] == base
+    assert len(manifest["deltas"]) == 1
+    assert os.path.isdir(os.path.join(path, base))
+
+    assert list(reader.contains(["a", "d"])) == [True, False]
+    assert reader.refresh()
+    assert list(reader.contains(["a", "d"])) == [False, True]
+    assert len(reader) == 3
+
+    writer.update(added=["e"])
+    manifest = writer._manifest(path)
+    assert manifest["base"] != base
+    assert not manifest["deltas"]
+    # Kept for readers of the previous manifest until the next merge.
+    assert os.path.isdir(os.path.join(path, base))
+
+    assert reader.refresh()
+    assert sorted(reader.values) == ["b", "c", "d", "e"]
+
+    writer.save(path)
+    assert not os.path.exists(os.path.join(path, base))
+
+
+def test_reference_index_in_memory_pickled():
+
+    reference = references.ReferenceIndex.from_values(["a", "b"])
+    reference.update(added=["c"])
+
+    restored = pickle.loads(pickle.dumps(reference))
+    assert list(restored.contains(["a", "c", "d"])) == [True, True, False]
+
+
+def add_references(path, values):
+    reference = references.ReferenceIndex.load(path)
+    for value in values:
+        reference.update(added=[value])
+
+
+def test_reference_index_concurrent_updates(tmp_path):
+
+    path = str(tmp_path / "customers")
+    references.ReferenceIndex.from_values([0]).save(path)
+
+    context = multiprocessing.get_context("spawn")
+    processes = [
+        context.Process(target=add_references, args=(path, range(start, 80, 4)))
+        for start in range(1, 5)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+
+    reference = references.ReferenceIndex.load(path)
+    assert list(reference.values) == list(range(80))
+    assert len(reference) == 80
+
+
+def test_reference_index_refresh_after_keys_are_deleted(tmp_path, monkeypatch):
+
+    path = str(tmp_path / "customers")
+    writer = references.ReferenceIndex.from_values(["a"])
+    writer.save(path)
+    stale_manifest = writer._manifest(path)
+    writer.save(path)
+    writer.save(path)
+
+    manifests = [stale_manifest]
+    read_manifest = references.ReferenceIndex._manifest
+    monkeypatch.setattr(
+        references.ReferenceIndex,
+        "_manifest",
+        staticmethod(
+            lambda path: manifests.pop() if manifests else read_manifest(path)
+        ),
+    )
+
+    reader = references.ReferenceIndex.load(path)
+    assert list(reader.contains(["a", "b"])) == [True, False]
+    assert reader.names.keys() == {writer._manifest(path)["base"]}
@@ -0,0 +1,175 @@
+# pylint: disable=unused-import
+import numpy as np
+import pandas as pd
+import pytest
+
+from pandantic import shortcuts, sketches, validators
+
+
+def test_hyperloglog_estimate_within_bounds():
+
+    column = pd.Series(np.arange(100_000))
+
+    sketch = sketches.HyperLogLog.from_column(column)
+    lower_bound, upper_bound = sketch.bounds()
+
+    assert lower_bound <= 100_000 <= upper_bound
+    assert abs(sketch.estimate() - 100_000) / 100_000 < 0.03
+
+
+def test_hyperloglog_small_cardinality():
+
+    sketch = sketches.HyperLogLog.from_column(pd.Series(["a", "b", "a", None]))
+
+    assert round(sketch.estimate()) == 2
+
+
+def test_hyperloglog_merge():
+
+    sketch = sketches.HyperLogLog.from_column(pd.Series(np.arange(0, 60_000)))
+    other_sketch = sketches.HyperLogLog.from_column(
+        pd.Series(np.arange(40_000, 100_000))
+    )
+
+    merged = sketch.merge(other_sketch)
+
+    assert abs(merged.estimate() - 100_000) / 100_000 < 0.03
+    assert merged.registers.nbytes == sketch.registers.nbytes
+
+
+def test_distinct_count_validator():
+
+    column = pd.Series(np.arange(1_000) % 100)
+
+    _, validation = shortcuts.distinct_count_between(90, 110).evaluate(column)
+    assert validation.valid
+    assert validation.original_issues == 0
+    assert validation.additional_info.startswith("Estimated 100 distinct values")
+
+    _, validation = shortcuts.distinct_count_between(500, 1_000).evaluate(column)
+    assert validation.valid is False
+    assert validation.original_issues == 400
+
+
+def test_duplicate_rate_validator():
+
+    column = pd.Series(np.arange(1_000) % 900)
+
+    _, validation = shortcuts.max_duplicate_rate(0.05).evaluate(column)
+    assert validation.valid is False
+    assert 70 <= validation.original_issues <= 130
+
+    _, validation = shortcuts.max_duplicate_rate(0.15).evaluate(column)
+    assert validation.valid
+    assert validation.additional_info.startswith("Estimated duplicate rate")
+
+
+def test_duplicate_rate_validator_merged_states():
+
+    validator = validators.DuplicateRateValidator(0.05)
+
+    state = validator.partial(pd.Series(np.arange(0, 1_000)))
+    other_state = validator.partial(pd.Series(np.arange(500, 1_500)))
+
+    issues, valid, _ = validator.finalize(validator.merge(state, other_state))
+
+    assert valid is False
+    assert abs(issues - 500) < 50
+
+
+def test_kll_sketch_quantiles_within_rank_error():
+
+    values = np.random.default_rng(0).normal(size=200_000)
+
+    sketch = sketches.KLLSketch.from_column(pd.Series(values))
+
+    assert sketch.count == 200_000
+    assert sum(map(len, sketch.compactors)) < 1_000
+    for quantile in (0.01, 0.5, 0.99):
+        rank = (values <= sketch.quantile(quantile)).mean()
+        assert abs(rank - quantile) < 0.02
+    assert sketch.quantile(0) == values.min()
+    assert sketch.quantile(1) == values.max()
+
+
+def test_kll_sketch_merge():
+
+    values = np.random.default_rng(1).exponential(size=100_000)
+    parts = [
+        sketches.KLLSketch.from_column(pd.Series(part))
+        for part in np.array_split(values, 7)
+    ]
+
+    merged = parts[0]
+    for part in parts[1:]:
+        merged = merged.merge(part)
+
+    assert merged.count == 100_000
+    rank = (values <= merged.quantile(0.9)).mean()
+    assert abs(rank - 0.9) < 0.02
+
+
+def test_quantile_validator():
+
+    column = pd.Series(np.arange(1, 1_001, dtype=float))
+
+    _, validation = shortcuts.quantile_between(0.99, max_value=2_000).evaluate(column)
+    assert validation.valid
+    assert validation.additional_info.startswith("Estimated quantile 0.99 is")
+
+    _, validation = shortcuts.quantile_between(0.5, max_value=250).evaluate(column)
+    assert validation.valid is False
+    assert 200 < validation.original_issues < 300
+
+    _, validation = shortcuts.quantile_between(0.5, min_value=750).evaluate(column)
+    assert validation.valid is False
+    assert 200 < validation.original_issues < 300
+
+
+def test_quantile_validator_merged_states():
+
+    validator = shortcuts.quantile_between(0.5, 400, 600)
+    column = pd.Series(np.arange(1_000, dtype=float))
+
+    state = validator.merge(
+        validator.partial(column.iloc[:300]), validator.partial(column.iloc[300:])
+    )
+
+    issues, valid, _ = validator.finalize(state)
+    assert valid and issues == 0
+
+
+def test_histogram_validator():
+
+    edges = [0, 10, 20]
+    reference = sketches.FixedHistogram.from_column(
+        pd.Series([1, 2, 11, 12, 13, 15, np.nan]), edges
+    )
+    assert reference.counts.tolist() == [0, 2, 4, 0]
+
+    validator = shortcuts.follows_histogram(edges, reference, max_distance=0.1)
+
+    _, validation = validator.evaluate(pd.Series([5, 6, 14, 15, 16, 17]))
+    assert validation.valid
+
+    _, validation = validator.evaluate(pd.Series([5, 6, 7, 8, 9, 30]))
+    assert validation.valid is False
+    assert validation.original_issues == 4
+
+    state = validator.merge(
+        validator.partial(pd.Series([5, 6])), validator.partial(pd.Series([14, 15]))
+    )
+    assert state.counts.tolist() == [0, 2, 2, 0]
+
+
+def test_histogram_validator_requires_a_weight_per_bin():
+
+    with pytest.raises(ValueError):
+        shortcuts.follows_histogram([0, 10], [0.5, 0.5], max_distance=0.1)
+
+
+def test_kll_sketch_coins_are_vectorized():
+
+    assert list(sketches._coins(5, 50)) == [
+        sketches._coin(counter) for counter in range(5, 55)
+    ]
@@ -29,3 +29,17 @@ def test_unique_validator_wrong():
     _, validation = validator.evaluate(col)
     assert validation.original_issues == 3
     assert validation.valid is False
+
+
+def test_unique_validator_merged_states():
+
+    validator = validators.UniqueValidator()
+
+    state = validator.partial(pd.Series(["a", "b", None]))
+    other_state = validator.partial(pd.Series(["b", "c", None, "c"]))
+
+    non_unique, valid = validator.finalize(validator.merge(state, other_state))
+
+    expected = pd.Series(["a", "b", None, "b", "c", None, "c"]).duplicated().sum()
+    assert non_unique == expected == 3
+    assert valid is False
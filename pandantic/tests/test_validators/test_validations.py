@@ -0,0 +1,68 @@
+# pylint: disable=unused-import
+import pickle
+
+import pytest
+
+from pandantic import evaluations, validations
+
+
+def test_validation_is_slotted():
+
+    validation = validations.Validation("Test validation", True)
+
+    assert not hasattr(validation, "__dict__")
+    assert validation.valid is False
+    assert validation.amended is False
+    assert validation.original_issues is None
+
+    with pytest.raises(AttributeError):
+        validation.unknown_attribute = 1
+
+
+def test_suspended_validation_is_slotted():
+
+    validation = validations.SuspendedValidation("Test validation", False)
+
+    assert not hasattr(validation, "__dict__")
+    assert validation.additional_info == "Validation was suspended"
+    assert isinstance(validation, validations.Validation)
+
+
+def test_validation_error_is_validation():
+
+    error = validations.ValidationError("Test validation", True, ValueError())
+
+    assert isinstance(error, validations.Validation)
+    assert isinstance(error, Exception)
+    assert error.valid is False
+
+    validation_set = validations.ValidationSet()
+    validation_set.add_validation(error)
+
+    assert list(validation_set) == [error]
+
+
+def test_column_evaluation_is_slotted():
+
+    validation = validations.Validation("Test validation", True)
+    validation.valid = True
+    validation_set = validations.ValidationSet()
+    validation_set.add_validation(validation)
+
+    column_evaluation = evaluations.ColumnEvaluation(validation_set)
+
+    assert not hasattr(validation_set, "__dict__")
+    assert not hasattr(column_evaluation, "__dict__")
+    assert not hasattr(evaluations.MissingColumn(), "__dict__")
+    assert column_evaluation.valid
+
+
+def test_slotted_validation_pickles():
+
+    validation = validations.Validation("Test validation", True)
+    validation.original_issues = 3
+
+    restored = pickle.loads(pickle.dumps(validation))
+
+    assert restored.original_issues == 3
+    assert restored.description == "Test validation"
@@ -20,3 +20,63 @@ def test_categories_validator_correct_series():
     assert validation.pending_issues == 0
     assert validation.valid
     assert validation.amended
+
+
+def test_masked_amendment_receives_failing_rows_only():
+
+    received = []
+
+    def clip(column):
+        received.append(column.copy())
+        return column.clip(upper=10)
+
+    col = pd.Series([1, 50, 3, np.nan, 20], index=list("abcde"))
+
+    validator = validators.RangeValidator(0, 10).set_amendment(clip, masked=True)
+
+    series, validation = validator.evaluate(col)
+
+    assert list(received[0].index) == ["b", "e"]
+    assert list(series.index) == list("abcde")
+    assert series.tolist()[:3] == [1, 10, 3]
+    assert validation.original_issues == 2
+    assert validation.pending_issues == 0
+    assert validation.valid and validation.amended
+
+
+def test_masked_amendment_counts_remaining_issues():
+
+    col = pd.Series(["a", "x", "y", "b"])
+
+    validator = validators.CategoriesValidator(["a", "b"]).set_amendment(
+        lambda column: column.replace({"x": "a"}), masked=True
+    )
+
+    series, validation = validator.evaluate(col)
+
+    assert series.tolist() == ["a", "a", "y", "b"]
+    assert validation.original_issues == 2
+    assert validation.pending_issues == 1
+    assert not validation.valid
+
+
+def test_masked_amendment_upcasts_merged_column():
+
+    col = pd.Series([1, -5, 3])
+
+    validator = validators.RangeValidator(0, 10).set_amendment(
+        lambda column: column * 0.5 + 2.5, masked=True
+    )
+
+    series, validation = validator.evaluate(col)
+
+    assert series.tolist() == [1.0, 0.0, 3.0]
+    assert validation.valid
+
+
+def test_masked_amendment_rejected_for_unique_validator():
+
+    with pytest.raises(ValueError):
+        validators.UniqueValidator().set_amendment(
+            lambda column: column.drop_duplicates(), masked=True
+        )
@@ -0,0 +1,127 @@
+# pylint: disable=unused-import
+import numpy as np
+import pandas as pd
+import pytest
+
+from pandantic import references, validators
+
+
+def _validate(validator, column):
+    validator_set = validators.ValidatorSet()
+    validator_set.add_validator(validator)
+    return validator_set.validate(column)
+
+
+def _fail_on_scan(monkeypatch, validator_class):
+    def scan(*args, **kwargs):
+        raise AssertionError("Values were scanned.")
+
+    monkeypatch.setattr(validator_class, "_evaluate_statistics", scan)
+
+
+@pytest.mark.parametrize("dtype", ["int64", "uint8", "bool"])
+def test_non_null_proven_from_dtype(monkeypatch, dtype):
+
+    _fail_on_scan(monkeypatch, validators.NonNullValidator)
+
+    _, validation_set = _validate(
+        validators.NonNullValidator(), pd.Series([0, 1, 1], dtype=dtype)
+    )
+    validation = validation_set.validations[0]
+
+    assert validation.valid
+    assert validation.original_issues == 0
+    assert validation.additional_info == validators.PROOF_INFO
+
+
+def test_non_null_not_proven_for_nullable_dtype():
+
+    _, validation_set = _validate(
+        validators.NonNullValidator(), pd.Series([1, None], dtype="Int64")
+    )
+    validation = validation_set.validations[0]
+
+    assert not validation.valid
+    assert validation.original_issues == 1
+    assert validation.additional_info is None
+
+
+def test_range_proven_from_dtype(monkeypatch):
+
+    _fail_on_scan(monkeypatch, validators.RangeValidator)
+
+    _, validation_set = _validate(
+        validators.RangeValidator(0, 255), pd.Series([0, 7, 255], dtype="uint8")
+    )
+
+    assert validation_set.validations[0].valid
+
+
+def test_range_disproven_from_dtype(monkeypatch):
+
+    _fail_on_scan(monkeypatch, validators.RangeValidator)
+
+    _, validation_set = _validate(
+        validators.RangeValidator(300, 400), pd.Series([0, 7, 255], dtype="uint8")
+    )
+    validation = validation_set.validations[0]
+
+    assert not validation.valid
+    assert validation.original_issues == 3
+
+
+def test_range_disproof_applies_amendment():
+
+    validator = validators.RangeValidator(300, 400).set_amendment(
+        lambda column: column.astype("int64") + 300
+    )
+
+    column, validation_set = _validate(validator, pd.Series([0, 7], dtype="uint8"))
+    validation = validation_set.validations[0]
+
+    assert validation.amended and validation.valid
+    assert list(column) == [300, 307]
+
+
+def test_range_scans_when_dtype_exceeds_bounds():
+
+    _, validation_set = _validate(
+        validators.RangeValidator(0, 100), pd.Series([0, 200], dtype="uint8")
+    )
+    validation = validation_set.validations[0]
+
+    assert validation.original_issues == 1
+    assert validation.additional_info is None
+
+
+def test_categories_proven_from_categorical(monkeypatch):
+
+    _fail_on_scan(monkeypatch, validators.CategoriesValidator)
+
+    column = pd.Series(["a", "b", "a"], dtype=pd.CategoricalDtype(["a", "b"]))
+    _, validation_set = _validate(
+        validators.CategoriesValidator(["a", "b", "c"]), column
+    )
+
+    assert validation_set.validations[0].valid
+
+
+def test_categories_scanned_for_unused_category():
+
+    column = pd.Series(["a", "b"], dtype=pd.CategoricalDtype(["a", "b", "z"]))
+    _, validation_set = _validate(validators.CategoriesValidator(["a", "b"]), column)
+    validation = validation_set.validations[0]
+
+    assert validation.valid
+    assert validation.additional_info is None
+
+
+def test_reference_proven_from_categorical(monkeypatch):
+
+    _fail_on_scan(monkeypatch, validators.ReferenceValidator)
+
+    reference = references.ReferenceIndex.from_values(["a", "b", "c"])
+    column = pd.Series(["a", "b"], dtype="category")
+    _, validation_set = _validate(validators.ReferenceValidator(reference), column)
+
+    assert validation_set.validations[0].valid
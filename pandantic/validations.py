@@ -1,7 +1,10 @@
-from typing import List, Optional, Iterator
+import abc
+from typing import Any, List, Optional, Iterator
 
 
-class Validation:
+class ValidationFields:
+
+    __slots__ = ()
 
     description: str
     original_issues: Optional[int]
@@ -10,6 +13,10 @@ class Validation:
     amended: bool
     mandatory: bool
     additional_info: Optional[str]
+    # Structured counterpart of additional_info, such as the issue count of
+    # every group of group validators.
+    details: Any
+    elapsed: Optional[float]
 
     def __init__(self, description: str, mandatory: bool) -> None:
         self.description = description
@@ -19,15 +26,37 @@ class Validation:
         self.original_issues = None
         self.pending_issues = None
         self.additional_info = None
+        self.details = None
+        self.elapsed = None
+
+
+class Validation(ValidationFields, metaclass=abc.ABCMeta):
+
+    __slots__ = (
+        "description",
+        "original_issues",
+        "pending_issues",
+        "valid",
+        "amended",
+        "mandatory",
+        "additional_info",
+        "details",
+        "elapsed",
+    )
 
 
 class SuspendedValidation(Validation):
+
+    __slots__ = ()
+
     def __init__(self, description: str, mandatory: bool) -> None:
         super().__init__(description, mandatory)
         self.additional_info = "Validation was suspended"
 
 
-class ValidationError(Validation, Exception):
+class ValidationError(ValidationFields, Exception):
+    # Exception instances cannot share the slotted layout of Validation,
+    # so the error is registered as a virtual Validation subclass instead.
     def __init__(
         self, description: str, mandatory: bool, original_error: Exception
     ) -> None:
@@ -35,8 +64,13 @@ class ValidationError(Validation, Exception):
         self.original_error = original_error
 
 
+Validation.register(ValidationError)
+
+
 class ValidationSet:
 
+    __slots__ = ("validations",)
+
     validations: List[Validation]
 
     def __init__(self) -> None:
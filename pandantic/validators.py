@@ -2,69 +2,566 @@
 Validators for data validation and amendment.
 """
 import abc
+import math
+import time
 from numbers import Number
-from typing import Callable, List, Literal, Pattern, Tuple, Type, Union, Iterator
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Literal,
+    Pattern,
+    Tuple,
+    Type,
+    Union,
+    Iterable,
+    Iterator,
+)
 
 import numpy as np
 import pandas as pd
 
-from pandantic import validations
+from pandantic import (
+    fusion,
+    metrics,
+    references,
+    sketches,
+    statistics,
+    validations,
+)
 
+PROOF_INFO = "Proven from the column dtype, without scanning its values."
+
+
+class Immutable:
+    """
+    Declaration whose attributes cannot be set once frozen. Schemas freeze
+    their declarations when instantiated, so that one schema instance can
+    evaluate DataFrames from several threads at once.
+    """
+
+    _frozen = False
+
+    def freeze(self) -> "Immutable":
+        object.__setattr__(self, "_frozen", True)
+        return self
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if self._frozen:
+            raise AttributeError(
+                f"{type(self).__name__} is frozen by its schema, {name} cannot be set."
+            )
+        object.__setattr__(self, name, value)
+
+
+class Validator(Immutable, abc.ABC):
+
+    row_wise = False
+    # Whether the failure of a row depends on that row alone.
+    row_local = True
+    # Copies of the column and bytes per row of the temporary masks and
+    # arrays alive at the peak of an evaluation, see memory_per_row.
+    column_copies = 1
+    temporary_row_bytes = 1
 
-class Validator(abc.ABC):
     def __init__(self, mandatory: bool = True, description: str = None) -> None:
         self.mandatory = mandatory if mandatory is not None else True
         self.description = description if description is not None else "N/A"
         self.amendment = None
+        self.masked_amendment = False
 
     def validate_pandas_series(self, column) -> None:
         if not isinstance(column, pd.Series):
             raise TypeError("A pandas.Series object must be provided")
 
-    def evaluate(self, column) -> Tuple[pd.Series, validations.Validation]:
+    def evaluate(
+        self, column, column_statistics: statistics.ColumnStatistics = None
+    ) -> Tuple[pd.Series, validations.Validation]:
+        column, validation, _ = self.evaluate_failures(
+            column, column_statistics, failure_mask=False
+        )
+        return column, validation
+
+    def evaluate_failures(
+        self,
+        column,
+        column_statistics: statistics.ColumnStatistics = None,
+        failure_mask: bool = True,
+    ) -> Tuple[pd.Series, validations.Validation, Optional[np.ndarray]]:
+        """
+        Evaluates the column as evaluate does, also returning the failure
+        mask for row-wise validators when failure_mask is set: the issues are
+        then counted from the mask, in the same scan. After an amendment, the
+        mask is that of the amended column, so repaired rows do not fail.
+        """
         self.validate_pandas_series(column)
 
-        column = column.copy()
+        column = self._working_copy(column)
+        started = time.perf_counter()
 
         try:
 
             validation = validations.Validation(self.description, self.mandatory)
 
-            original_issue_count, valid = self._evaluate(column)
+            mask = None
+            if failure_mask and self.row_wise:
+                result, mask = self._evaluate_failures(column, column_statistics)
+            else:
+                result = self._evaluate_with_statistics(column, column_statistics)
+            original_issue_count, valid, *additional_info = result
             validation.original_issues = original_issue_count
             validation.pending_issues = original_issue_count
 
             if not valid and self.amendment is not None:
-                column = self.amendment(column)
-                issue_count, valid = self._evaluate(column)
+                if self.masked_amendment:
+                    column, issue_count = self._amend_failing_rows(column)
+                    valid = not issue_count
+                    if mask is not None:
+                        mask = np.asarray(self.failure_mask(column), dtype=bool)
+                elif mask is not None:
+                    column = self.amendment(column)
+                    (
+                        (issue_count, valid, *additional_info),
+                        mask,
+                    ) = self._evaluate_failures(column, None)
+                else:
+                    column = self.amendment(column)
+                    (
+                        issue_count,
+                        valid,
+                        *additional_info,
+                    ) = self._evaluate_with_statistics(column, None)
                 validation.pending_issues = issue_count
                 validation.amended = True
 
+            if additional_info:
+                validation.additional_info = additional_info[0]
+            if len(additional_info) > 1:
+                validation.details = additional_info[1]
+
             validation.valid = valid
+            validation.elapsed = time.perf_counter() - started
+            metrics.record_validation(self, validation)
 
-            return column, validation
+            return column, validation, mask
 
         except Exception as error:
-            raise validations.ValidationError(
+            validation_error = validations.ValidationError(
                 self.description, self.mandatory, error
-            ).with_traceback(error.__traceback__)
+            )
+            validation_error.elapsed = time.perf_counter() - started
+            metrics.record_validation_error(self)
+            raise validation_error.with_traceback(error.__traceback__)
+
+    def _working_copy(self, column):
+        # The evaluated column is returned, and amended, apart from the input.
+        return column.copy()
 
     def _evaluate(self, column: pd.Series) -> Tuple[int, bool]:
         raise NotImplementedError()
 
+    def _evaluate_with_statistics(
+        self, column: pd.Series, column_statistics: statistics.ColumnStatistics
+    ) -> Tuple[int, bool]:
+        return self._evaluate(column)
+
+    def _evaluate_failures(
+        self, column, column_statistics: statistics.ColumnStatistics
+    ) -> Tuple[Tuple, np.ndarray]:
+        failure_mask = np.asarray(self.failure_mask(column), dtype=bool)
+        issue_count = int(np.count_nonzero(failure_mask))
+        return (issue_count, not issue_count), failure_mask
+
+    def failure_mask(self, column) -> Optional[np.ndarray]:
+        """
+        Boolean mask of the failing rows, or None when the validator does not
+        fail row by row (row_wise = False).
+        """
+        return None
+
+    def prove(self, column: pd.Series) -> Optional[Tuple[int, bool]]:
+        """
+        Issues and result decided from the dtype and categorical metadata of
+        the column alone, or None when its values must be scanned.
+        """
+        return None
+
+    def fused_check(self, column: pd.Series) -> Optional[fusion.FusedCheck]:
+        """
+        Description of the check for a single-pass evaluation together with
+        the neighbouring validators (see fusion), or None when the validator
+        must scan the column on its own.
+        """
+        return None
+
+    def memory_per_row(self, column_row_bytes: float) -> float:
+        """
+        Estimated peak bytes per row of an evaluation of a column taking
+        column_row_bytes per row. An amendment returns another copy; a masked
+        one also needs the failure mask and the positions to reorder rows.
+        """
+        copies = self.column_copies
+        temporary_row_bytes = self.temporary_row_bytes
+        if self.amendment is not None:
+            copies += 1
+            if self.masked_amendment:
+                temporary_row_bytes += 1 + 2 * np.dtype(np.int64).itemsize
+        return copies * column_row_bytes + temporary_row_bytes
+
+    def _amend_failing_rows(self, column) -> Tuple[Any, int]:
+        """
+        Applies the amendment to the failing rows only, re-checks them and
+        merges them back in place. Returns the column and the pending issues.
+        """
+        failing = np.asarray(self.failure_mask(column), dtype=bool)
+        amended = self.amendment(column[failing])
+        if len(amended) != int(failing.sum()):
+            raise ValueError("A masked amendment must keep every row it receives.")
+
+        issue_count = int(np.count_nonzero(self.failure_mask(amended)))
+
+        if failing.all():
+            return amended, issue_count
+
+        order = np.concatenate([np.flatnonzero(~failing), np.flatnonzero(failing)])
+        merged = pd.concat([column[~failing], amended])
+        return merged.iloc[np.argsort(order, kind="stable")], issue_count
+
     def set_amendment(
-        self, amendment: Callable[[pd.Series], pd.Series]
+        self, amendment: Callable[[pd.Series], pd.Series], masked: bool = False
     ) -> Type["Validator"]:
+        """
+        With masked=True, the amendment only receives the failing rows, and
+        only those are evaluated again.
+        """
+        if masked and not (self.row_wise and self.row_local):
+            raise ValueError(
+                f"{type(self).__name__} does not support masked amendments."
+            )
         self.amendment = amendment
+        self.masked_amendment = masked
         return self
 
 
-class ValidatorSet:
+class StatisticsValidator(Validator, abc.ABC):
+    def _evaluate(self, column: pd.Series) -> Tuple[int, bool]:
+        return self._evaluate_statistics(column, statistics.ColumnStatistics(column))
+
+    def _evaluate_with_statistics(
+        self, column: pd.Series, column_statistics: statistics.ColumnStatistics
+    ) -> Tuple[int, bool]:
+        if column_statistics is None:
+            return self._evaluate(column)
+        return self._evaluate_statistics(column, column_statistics)
+
+    def _evaluate_statistics(
+        self, column: pd.Series, column_statistics: statistics.ColumnStatistics
+    ) -> Tuple[int, bool]:
+        raise NotImplementedError()
+
+
+class MergeableValidator(Validator, abc.ABC):
+    """
+    Validator whose issues are not additive across partitions or chunks.
+    Each part produces a partial state; merged states give the global result.
+    """
 
-    validators: List[Validator]
+    def partial(self, column: pd.Series) -> Any:
+        raise NotImplementedError()
+
+    def merge(self, state: Any, other_state: Any) -> Any:
+        raise NotImplementedError()
+
+    def finalize(self, state: Any) -> Tuple[int, bool]:
+        raise NotImplementedError()
+
+
+class KeyedValidator(MergeableValidator, abc.ABC):
+    """
+    Mergeable validator whose state holds counts of values (a Series indexed
+    by value) and an additive count. Equal values must meet to be merged, but
+    states split by value hash merge bucket by bucket, so that no state needs
+    to hold every distinct value of a partitioned frame.
+    """
+
+    def merge(
+        self, state: Tuple[pd.Series, int], other_state: Tuple[pd.Series, int]
+    ) -> Tuple[pd.Series, int]:
+        value_counts, count = state
+        other_value_counts, other_count = other_state
+        # Hash aggregation: the index alignment joins equal values of both parts.
+        merged_counts = value_counts.add(other_value_counts, fill_value=0)
+        return merged_counts.astype("int64"), count + other_count
+
+    def split(self, state: Tuple[pd.Series, int], parts: int) -> List[Any]:
+        """
+        States of the values hashed to each of parts buckets. The additive
+        count goes to the first bucket.
+        """
+        value_counts, count = state
+        buckets = self._buckets(value_counts.index, parts)
+        return [
+            (value_counts[buckets == part], count if part == 0 else 0)
+            for part in range(parts)
+        ]
+
+    @staticmethod
+    def _buckets(values: pd.Index, parts: int) -> np.ndarray:
+        return pd.util.hash_pandas_object(values).to_numpy() % np.uint64(parts)
+
+    def compact(self, state: Tuple[pd.Series, int]) -> Tuple[pd.Series, int]:
+        """
+        Smaller state finalized like state, once it holds every occurrence of
+        its values: values seen once add nothing.
+        """
+        value_counts, count = state
+        return value_counts[value_counts > 1], count
+
+
+class SketchValidator(MergeableValidator, abc.ABC):
+    """
+    Mergeable validator evaluated from a fixed-memory sketch of the column.
+    Its evaluation may add an estimate description as additional info.
+    """
+
+    # 64-bit hashes or float values, plus the masks derived from them.
+    temporary_row_bytes = 16
+
+    def _evaluate(self, column: pd.Series) -> Tuple[int, bool, str]:
+        return self.finalize(self.partial(column))
+
+
+class DistinctCountValidator(SketchValidator):
+    def __init__(
+        self,
+        min_count: Number = 0,
+        max_count: Number = np.inf,
+        precision: int = 14,
+        mandatory: bool = True,
+        description: str = None,
+    ) -> None:
+
+        if min_count is None or max_count is None:
+            raise ValueError("min_count and max_count must be provided.")
+
+        if description is None:
+            description = (
+                f"Approximately between {min_count} and {max_count} distinct values."
+            )
+
+        super().__init__(mandatory, description)
+
+        self.min_count, self.max_count = min_count, max_count
+        self.precision = precision
+
+    def partial(self, column: pd.Series) -> sketches.HyperLogLog:
+        return sketches.HyperLogLog.from_column(column, self.precision)
+
+    def merge(
+        self, state: sketches.HyperLogLog, other_state: sketches.HyperLogLog
+    ) -> sketches.HyperLogLog:
+        return state.merge(other_state)
+
+    def finalize(self, state: sketches.HyperLogLog) -> Tuple[int, bool, str]:
+        estimate = state.estimate()
+        lower_bound, upper_bound = state.bounds()
+
+        out_of_range = max(self.min_count - estimate, estimate - self.max_count, 0)
+        issues = int(math.ceil(out_of_range))
+
+        return (
+            issues,
+            not issues,
+            f"Estimated {estimate:.0f} distinct values ({lower_bound:.0f} to {upper_bound:.0f}).",
+        )
+
+
+class DuplicateRateValidator(SketchValidator):
+    def __init__(
+        self,
+        max_rate: float,
+        precision: int = 14,
+        mandatory: bool = True,
+        description: str = None,
+    ) -> None:
+
+        if max_rate is None or not 0 <= max_rate <= 1:
+            raise ValueError("max_rate must be between 0 and 1.")
 
-    def __init__(self) -> None:
+        if description is None:
+            description = f"Approximately at most {max_rate:.2%} duplicated values."
+
+        super().__init__(mandatory, description)
+
+        self.max_rate = max_rate
+        self.precision = precision
+
+    def partial(self, column: pd.Series) -> Tuple[sketches.HyperLogLog, int]:
+        return (
+            sketches.HyperLogLog.from_column(column, self.precision),
+            int(column.count()),
+        )
+
+    def merge(
+        self,
+        state: Tuple[sketches.HyperLogLog, int],
+        other_state: Tuple[sketches.HyperLogLog, int],
+    ) -> Tuple[sketches.HyperLogLog, int]:
+        return state[0].merge(other_state[0]), state[1] + other_state[1]
+
+    def finalize(
+        self, state: Tuple[sketches.HyperLogLog, int]
+    ) -> Tuple[int, bool, str]:
+        sketch, non_null = state
+        if not non_null:
+            return 0, True, "No values to estimate duplicates."
+
+        lower_bound, upper_bound = sketch.bounds()
+        duplicates = max(non_null - min(sketch.estimate(), non_null), 0)
+        rate = duplicates / non_null
+        issues = int(round(duplicates)) if rate > self.max_rate else 0
+
+        lower_rate = max(non_null - min(upper_bound, non_null), 0) / non_null
+        upper_rate = max(non_null - min(lower_bound, non_null), 0) / non_null
+
+        return (
+            issues,
+            not issues,
+            f"Estimated duplicate rate {rate:.2%} ({lower_rate:.2%} to {upper_rate:.2%}).",
+        )
+
+
+class QuantileValidator(SketchValidator):
+    def __init__(
+        self,
+        quantile: float,
+        min_value: Number = -np.inf,
+        max_value: Number = np.inf,
+        capacity: int = 200,
+        mandatory: bool = True,
+        description: str = None,
+    ) -> None:
+
+        if quantile is None or not 0 < quantile < 1:
+            raise ValueError("quantile must be between 0 and 1 (exclusive).")
+
+        if min_value is None or max_value is None:
+            raise ValueError("min_value and max_value must be provided.")
+
+        if description is None:
+            description = f"Approximately, quantile {quantile:g} is between {min_value} and {max_value}."
+
+        super().__init__(mandatory, description)
+
+        self.quantile = quantile
+        self.min_value, self.max_value = min_value, max_value
+        self.capacity = capacity
+
+    def partial(self, column: pd.Series) -> sketches.KLLSketch:
+        return sketches.KLLSketch.from_column(column, self.capacity)
+
+    def merge(
+        self, state: sketches.KLLSketch, other_state: sketches.KLLSketch
+    ) -> sketches.KLLSketch:
+        return state.merge(other_state)
+
+    def finalize(self, state: sketches.KLLSketch) -> Tuple[int, bool, str]:
+        if not state.count:
+            return 0, True, "No values to estimate quantiles."
+
+        target_rank = self.quantile * state.count
+        # Values to move for the quantile to reach each bound.
+        below_max = target_rank - state.rank(self.max_value)
+        above_min = state.rank(self.min_value, inclusive=False) - target_rank
+
+        issues = 0
+        if below_max > 0:
+            issues += int(math.ceil(below_max))
+        if above_min >= 0:
+            issues += int(math.floor(above_min)) + 1
+
+        return (
+            issues,
+            not issues,
+            f"Estimated quantile {self.quantile:g} is {state.quantile(self.quantile):.6g}.",
+        )
+
+
+class HistogramValidator(SketchValidator):
+    def __init__(
+        self,
+        edges: List[Number],
+        expected: Union[List[float], sketches.FixedHistogram],
+        max_distance: float,
+        mandatory: bool = True,
+        description: str = None,
+    ) -> None:
+
+        if isinstance(expected, sketches.FixedHistogram):
+            if not np.array_equal(expected.edges, np.asarray(edges, dtype=np.float64)):
+                raise ValueError("The expected histogram must have the same edges.")
+            expected = expected.counts
+
+        expected = np.asarray(expected, dtype=np.float64)
+        if len(expected) != len(edges) + 1 or expected.sum() <= 0:
+            raise ValueError(
+                "expected must hold a weight for each bin, including the bins below and above the edges."
+            )
+
+        if max_distance is None or not 0 <= max_distance <= 1:
+            raise ValueError("max_distance must be between 0 and 1.")
+
+        if description is None:
+            description = f"Distribution within a total variation distance of {max_distance} from the expected histogram."
+
+        super().__init__(mandatory, description)
+
+        self.edges = edges
+        self.expected = expected / expected.sum()
+        self.max_distance = max_distance
+
+    def partial(self, column: pd.Series) -> sketches.FixedHistogram:
+        return sketches.FixedHistogram.from_column(column, self.edges)
+
+    def merge(
+        self, state: sketches.FixedHistogram, other_state: sketches.FixedHistogram
+    ) -> sketches.FixedHistogram:
+        return state.merge(other_state)
+
+    def finalize(self, state: sketches.FixedHistogram) -> Tuple[int, bool, str]:
+        total = state.total
+        if not total:
+            return 0, True, "No values to compare with the expected histogram."
+
+        distance = float(np.abs(state.fractions() - self.expected).sum() / 2)
+        # Roughly, the values that would have to move to another bin.
+        issues = (
+            max(int(round(distance * total)), 1) if distance > self.max_distance else 0
+        )
+
+        return (
+            issues,
+            not issues,
+            f"Total variation distance {distance:.4f} from the expected histogram.",
+        )
+
+
+class ValidatorSet(Immutable):
+
+    validators: List[Validator]
+    # Whether consecutive validators that do not amend the column are
+    # evaluated in a single pass when they support it (see fusion).
+    fuse = True
+    # Shorter columns are scanned by each validator, since a single pass
+    # saves less than the compilation of the kernel for a new dtype costs.
+    fuse_min_rows = 10_000
+
+    def __init__(self, validator_list: Iterable[Validator] = ()) -> None:
         self.validators = []
+        for validator in validator_list:
+            self.add_validator(validator)
 
     def __iter__(self) -> Iterator[Validator]:
         return iter(self.validators)
@@ -72,41 +569,218 @@ class ValidatorSet:
     def add_validator(self, validator: Validator):
         if not isinstance(validator, Validator):
             raise ValueError(f"Validator expected, got {type(validator)} instead.")
+        elif self._frozen:
+            raise AttributeError("ValidatorSet is frozen by its schema.")
         else:
             self.validators.append(validator)
 
+    def freeze(self) -> "ValidatorSet":
+        if self._frozen:
+            return self
+        for validator in self.validators:
+            validator.freeze()
+        self.validators = tuple(self.validators)
+        return super().freeze()
+
     def validate(
         self, column: pd.Series
     ) -> Tuple[pd.Series, validations.ValidationSet]:
 
         column = column.copy()
         validation_set = validations.ValidationSet()
+
+        for _, _, column, validation in self.iter_validate(column):
+            validation_set.add_validation(validation)
+
+        return column, validation_set
+
+    def iter_validate(
+        self, column: pd.Series, states: bool = False
+    ) -> Iterator[
+        Tuple[Validator, pd.Series, pd.Series, Optional[validations.Validation]]
+    ]:
+        """
+        Yields each validator with the column it received, the column it
+        returned and its validation. With states, for the evaluation of a
+        part of a column, mergeable validators are not evaluated: their
+        validation is None and they never suspend the following validators,
+        as only the states of every part merged decide them.
+        """
+        for validator, evaluated, column, validation, _ in self._iter_evaluate(
+            column, quarantine=False, states=states
+        ):
+            yield validator, evaluated, column, validation
+
+    def iter_quarantine(
+        self, column: pd.Series
+    ) -> Iterator[
+        Tuple[
+            Validator,
+            pd.Series,
+            pd.Series,
+            validations.Validation,
+            Optional[np.ndarray],
+        ]
+    ]:
+        """
+        Yields what iter_validate does plus, for mandatory row-wise
+        validators, the failure mask of the column they return (amended, if
+        so), computed by their evaluation. Failing row-wise validators do not suspend the
+        following ones, as their failing rows are set apart by the caller.
+        """
+        return self._iter_evaluate(column, quarantine=True)
+
+    def _iter_evaluate(self, column: pd.Series, quarantine: bool, states: bool = False):
+        column_statistics = statistics.ColumnStatistics(column)
         keep_validating = True
+        fused_validations = dict()
 
-        for validator in self.validators:
+        for position, validator in enumerate(self.validators):
 
+            evaluated_column = column
+            failure_mask = None
+            if keep_validating and states and isinstance(validator, MergeableValidator):
+                yield validator, column, column, None, None
+                continue
             if keep_validating:
-                try:
-                    column, validation = validator.evaluate(column)
-                except validations.ValidationError as error:
-                    validation = error
+                validation = self._prove(validator, column)
+                if (
+                    validation is None
+                    # Fused checks only count issues, without failure masks.
+                    and self.fuse
+                    and not quarantine
+                    and position not in fused_validations
+                ):
+                    fused_validations.update(self._fuse(position, column))
+                if validation is None:
+                    validation = fused_validations.get(position)
+                    if validation is not None:
+                        metrics.record_validation(validator, validation)
+                if validation is None:
+                    try:
+                        column, validation, failure_mask = validator.evaluate_failures(
+                            column,
+                            column_statistics,
+                            failure_mask=quarantine and validator.mandatory,
+                        )
+                    except validations.ValidationError as error:
+                        validation = error
+                    else:
+                        if validation.amended:
+                            column_statistics = statistics.ColumnStatistics(column)
             else:
                 validation = validations.SuspendedValidation(
                     validator.description, validator.mandatory
                 )
 
-            validation_set.add_validation(validation)
+            yield validator, evaluated_column, column, validation, failure_mask
+
             if (
-                (validation.valid is False and validator.mandatory)
+                (
+                    validation.valid is False
+                    and validator.mandatory
+                    and not (quarantine and validator.row_wise)
+                )
                 or isinstance(validation, validations.ValidationError)
                 or (not keep_validating)
             ):
                 keep_validating = False
 
-        return column, validation_set
+    def _fuse(
+        self, position: int, column: pd.Series
+    ) -> Dict[int, validations.Validation]:
+        """
+        Validations of the run of fusable validators starting at position,
+        counted in one traversal of the column. Validators proven from the
+        column metadata are left out; runs of a single validator, columns
+        shorter than fuse_min_rows and columns the kernel cannot read are
+        evaluated as usual.
+        """
+        if not isinstance(column, pd.Series) or len(column) < self.fuse_min_rows:
+            return dict()
+        values = fusion.column_values(column)
+        if values is None:
+            return dict()
+
+        fused_checks = dict()
+        for offset, validator in enumerate(self.validators[position:]):
+            fused_check = (
+                validator.fused_check(column) if validator.amendment is None else None
+            )
+            if fused_check is None:
+                break
+            if validator.prove(column) is None:
+                fused_checks[position + offset] = fused_check
+
+        if len(fused_checks) < 2:
+            return dict()
+
+        started = time.perf_counter()
+        try:
+            issue_counts = fusion.count_issues(values, list(fused_checks.values()))
+        except Exception:  # pylint: disable=broad-except
+            # Each validator then reports its own errors.
+            return dict()
+        elapsed = (time.perf_counter() - started) / len(fused_checks)
+
+        fused_validations = dict()
+        for fused_position, issue_count in zip(fused_checks, issue_counts):
+            validator = self.validators[fused_position]
+            validation = validations.Validation(
+                validator.description, validator.mandatory
+            )
+            validation.original_issues = issue_count
+            validation.pending_issues = issue_count
+            validation.valid = not issue_count
+            validation.elapsed = elapsed
+            fused_validations[fused_position] = validation
+        return fused_validations
+
+    @staticmethod
+    def _prove(
+        validator: Validator, column: pd.Series
+    ) -> Optional[validations.Validation]:
+        """
+        Validation of a validator proven from the column metadata. Failures
+        are only recorded when there is no amendment to apply.
+        """
+        if not isinstance(column, pd.Series):
+            return None
+
+        started = time.perf_counter()
+        proof = validator.prove(column)
+        if proof is None:
+            return None
+
+        issue_count, valid = proof
+        if not valid and validator.amendment is not None:
+            return None
+
+        validation = validations.Validation(validator.description, validator.mandatory)
+        validation.original_issues = issue_count
+        validation.pending_issues = issue_count
+        validation.valid = valid
+        validation.additional_info = PROOF_INFO
+        validation.elapsed = time.perf_counter() - started
+        metrics.record_validation(validator, validation)
+
+        return validation
+
 
+def _numpy_dtype(column: pd.Series, kinds: str) -> Optional[np.dtype]:
+    # Extension dtypes (nullable integers, Arrow) may hold missing values.
+    dtype = column.dtype
+    if isinstance(dtype, np.dtype) and dtype.kind in kinds:
+        return dtype
+    return None
+
+
+class RangeValidator(StatisticsValidator):
+
+    row_wise = True
+    # Two comparison masks and their combination.
+    temporary_row_bytes = 3
 
-class RangeValidator(Validator):
     def __init__(
         self,
         min_value: Number,
@@ -127,10 +801,55 @@ class RangeValidator(Validator):
         self.inclusive = inclusive
         self.min_value, self.max_value = min_value, max_value
 
-    def _evaluate(self, column: pd.Series) -> Tuple[int, bool]:
-        result = False
-        non_null = column.count()
+    def _evaluate_statistics(
+        self, column: pd.Series, column_statistics: statistics.ColumnStatistics
+    ) -> Tuple[int, bool]:
+        non_null = column_statistics.non_null_count
+
+        if self._bounds_contain(column_statistics.min, column_statistics.max):
+            return 0, True
+
+        result = self._in_range(column).sum()
+
+        return (non_null - result), not ((non_null - result) > 0)
+
+    def prove(self, column: pd.Series) -> Optional[Tuple[int, bool]]:
+        dtype = _numpy_dtype(column, "iu")
+        if dtype is None:
+            return None
+
+        dtype_info = np.iinfo(dtype)
+        if self._bounds_contain(dtype_info.min, dtype_info.max):
+            return 0, True
+
+        if dtype_info.max < self.min_value or dtype_info.min > self.max_value:
+            # No representable value is in range, and none can be null.
+            return len(column), not len(column)
+
+        return None
+
+    def failure_mask(self, column: pd.Series) -> np.ndarray:
+        return ~np.asarray(self._in_range(column)) & ~np.asarray(column.isnull())
+
+    def fused_check(self, column: pd.Series) -> Optional[fusion.FusedCheck]:
+        if not (
+            isinstance(self.min_value, Number) and isinstance(self.max_value, Number)
+        ):
+            return None
 
+        lower_inclusive = self.inclusive in ("both", "left")
+        upper_inclusive = self.inclusive in ("both", "right")
+        # Mirrors _in_range, which ignores an infinite bound.
+        if np.isinf(self.max_value):
+            upper_inclusive = True
+        elif np.isneginf(self.min_value):
+            lower_inclusive = True
+
+        return fusion.FusedCheck.range(
+            self.min_value, self.max_value, lower_inclusive, upper_inclusive
+        )
+
+    def _in_range(self, column: pd.Series) -> pd.Series:
         if np.isinf(self.max_value):
             if self.inclusive == "left" or self.inclusive == "both":
                 result = column.ge(self.min_value)
@@ -148,12 +867,29 @@ class RangeValidator(Validator):
                 self.min_value, self.max_value, inclusive=self.inclusive
             )
 
-        result = result.sum()
+        return result
 
-        return (non_null - result), not ((non_null - result) > 0)
+    def _bounds_contain(self, column_min, column_max) -> bool:
+        if column_min is None or pd.isnull(column_min) or pd.isnull(column_max):
+            return False
+
+        if self.inclusive in ("both", "left"):
+            above_min = column_min >= self.min_value
+        else:
+            above_min = column_min > self.min_value
 
+        if self.inclusive in ("both", "right"):
+            below_max = column_max <= self.max_value
+        else:
+            below_max = column_max < self.max_value
+
+        return bool(above_min and below_max)
+
+
+class CategoriesValidator(StatisticsValidator):
+
+    row_wise = True
 
-class CategoriesValidator(Validator):
     def __init__(
         self, categories: List, mandatory: bool = True, description: str = None
     ) -> None:
@@ -169,15 +905,149 @@ class CategoriesValidator(Validator):
 
         self.categories = categories
 
-    def _evaluate(self, column: pd.Series) -> Tuple[int, bool]:
-        non_null = column.count()
+    def _evaluate_statistics(
+        self, column: pd.Series, column_statistics: statistics.ColumnStatistics
+    ) -> Tuple[int, bool]:
+        if column_statistics.factorized:
+            in_category = column_statistics.uniques.isin(self.categories)
+            not_in_category = int(column_statistics.unique_counts[~in_category].sum())
+        else:
+            not_in_category = int(
+                np.count_nonzero(
+                    ~(
+                        column.isin(self.categories).to_numpy()
+                        | column_statistics.null_mask
+                    )
+                )
+            )
+
+        return not_in_category, not (not_in_category > 0)
+
+    def prove(self, column: pd.Series) -> Optional[Tuple[int, bool]]:
+        if isinstance(column.dtype, pd.CategoricalDtype):
+            possible_values = column.dtype.categories
+        elif _numpy_dtype(column, "b") is not None:
+            possible_values = pd.Index([False, True])
+        else:
+            return None
+
+        if possible_values.isin(self.categories).all():
+            return 0, True
+        return None
+
+    def failure_mask(self, column: pd.Series) -> np.ndarray:
+        # Nulls never fail.
+        return ~(column.isin(self.categories).to_numpy() | np.asarray(column.isnull()))
 
-        in_category = column.isin(self.categories).sum()
+    def fused_check(self, column: pd.Series) -> Optional[fusion.FusedCheck]:
+        return fusion.FusedCheck.in_categories(self.categories, column.dtype)
 
-        return (non_null - in_category), not ((non_null - in_category) > 0)
 
+class ReferenceValidator(StatisticsValidator):
+
+    row_wise = True
+
+    def __init__(
+        self,
+        reference: references.ReferenceIndex,
+        refresh: bool = True,
+        mandatory: bool = True,
+        description: str = None,
+    ) -> None:
+
+        if not isinstance(reference, references.ReferenceIndex):
+            raise ValueError("A ReferenceIndex must be provided.")
+
+        if description is None:
+            description = f"Values exist in a reference of {len(reference)} values."
+
+        super().__init__(mandatory, description)
+
+        self.reference = reference
+        self.refresh = refresh
+
+    def _in_reference(self, values: np.ndarray) -> np.ndarray:
+        if self.refresh:
+            self.reference.refresh()
+        return self.reference.contains(values)
+
+    def _evaluate_statistics(
+        self, column: pd.Series, column_statistics: statistics.ColumnStatistics
+    ) -> Tuple[int, bool]:
+        if column_statistics.factorized:
+            # Only distinct values are searched in the index.
+            in_reference = self._in_reference(column_statistics.uniques.to_numpy())
+            not_in_reference = int(column_statistics.unique_counts[~in_reference].sum())
+        else:
+            values = column.to_numpy()[~column_statistics.null_mask]
+            not_in_reference = int(np.count_nonzero(~self._in_reference(values)))
+
+        return not_in_reference, not (not_in_reference > 0)
+
+    def prove(self, column: pd.Series) -> Optional[Tuple[int, bool]]:
+        if not isinstance(column.dtype, pd.CategoricalDtype):
+            return None
+
+        if self.refresh:
+            self.reference.refresh()
+        categories = column.dtype.categories.to_numpy()
+        if self.reference.contains(categories).all():
+            return 0, True
+        return None
+
+    def failure_mask(self, column: pd.Series) -> np.ndarray:
+        null_mask = np.asarray(column.isnull())
+        failures = np.zeros(len(column), dtype=bool)
+        failures[~null_mask] = ~self._in_reference(column.to_numpy()[~null_mask])
+        return failures
+
+
+class LengthValidator(StatisticsValidator):
+
+    row_wise = True
+    # Lengths (int64) and three masks.
+    temporary_row_bytes = 11
+
+    def __init__(
+        self,
+        min_length: Number = 0,
+        max_length: Number = np.inf,
+        mandatory: bool = True,
+        description: str = None,
+    ) -> None:
+
+        if min_length is None or max_length is None:
+            raise ValueError("min_length and max_length must be provided.")
+
+        if description is None:
+            description = f"Values length is between {min_length} and {max_length}."
+
+        super().__init__(mandatory, description)
+
+        self.min_length, self.max_length = min_length, max_length
+
+    def _in_range(self, column: pd.Series) -> pd.Series:
+        # The .str accessor computes lengths natively on Arrow-backed strings.
+        lengths = column.str.len()
+        return lengths.ge(self.min_length) & lengths.le(self.max_length)
+
+    def _evaluate_statistics(
+        self, column: pd.Series, column_statistics: statistics.ColumnStatistics
+    ) -> Tuple[int, bool]:
+        non_null = column_statistics.non_null_count
+        in_range = int(self._in_range(column).fillna(False).sum())
+
+        return (non_null - in_range), not ((non_null - in_range) > 0)
+
+    def failure_mask(self, column: pd.Series) -> np.ndarray:
+        in_range = self._in_range(column).fillna(True).astype(bool)
+        return ~np.asarray(in_range) & ~np.asarray(column.isnull())
+
+
+class NonNullValidator(StatisticsValidator):
+
+    row_wise = True
 
-class NonNullValidator(Validator):
     def __init__(self, mandatory: bool = True, description: str = None) -> None:
 
         if description is None:
@@ -185,14 +1055,36 @@ class NonNullValidator(Validator):
 
         super().__init__(mandatory, description)
 
-    def _evaluate(self, column: pd.Series) -> Tuple[int, bool]:
+    def _evaluate_statistics(
+        self, column: pd.Series, column_statistics: statistics.ColumnStatistics
+    ) -> Tuple[int, bool]:
 
-        null_values = column.isnull().sum()
+        null_values = column_statistics.null_count
 
         return null_values, not (null_values)
 
+    def prove(self, column: pd.Series) -> Optional[Tuple[int, bool]]:
+        # Numpy integer and boolean columns cannot hold missing values.
+        if _numpy_dtype(column, "iub") is not None:
+            return 0, True
+        return None
+
+    def failure_mask(self, column: pd.Series) -> np.ndarray:
+        return np.asarray(column.isnull())
+
+    def fused_check(self, column: pd.Series) -> Optional[fusion.FusedCheck]:
+        return fusion.FusedCheck.non_null()
+
+
+class UniqueValidator(StatisticsValidator, KeyedValidator):
+
+    row_wise = True
+    row_local = False
+    # Value counts of the distinct values, plus the hash table factorizing
+    # them (up to about 40 bytes per distinct value).
+    column_copies = 2
+    temporary_row_bytes = 49
 
-class UniqueValidator(Validator):
     def __init__(self, mandatory: bool = True, description: str = None) -> None:
 
         if description is None:
@@ -200,14 +1092,37 @@ class UniqueValidator(Validator):
 
         super().__init__(mandatory, description)
 
-    def _evaluate(self, column: pd.Series) -> Tuple[int, bool]:
+    def _evaluate_statistics(
+        self, column: pd.Series, column_statistics: statistics.ColumnStatistics
+    ) -> Tuple[int, bool]:
 
-        non_unique = column.duplicated(keep="first").sum()
+        non_unique = len(column) - column_statistics.distinct_count
 
         return non_unique, not (non_unique)
 
+    def failure_mask(self, column: pd.Series) -> np.ndarray:
+        return np.asarray(column.duplicated(keep="first"))
+
+    def partial(self, column: pd.Series) -> Tuple[pd.Series, int]:
+        column_statistics = statistics.ColumnStatistics(column)
+        uniques = column_statistics.uniques
+        if isinstance(uniques, pd.CategoricalIndex):
+            uniques = pd.Index(uniques.to_numpy())
+        value_counts = pd.Series(column_statistics.unique_counts, index=uniques)
+        return value_counts, column_statistics.null_count
+
+    def finalize(self, state: Tuple[pd.Series, int]) -> Tuple[int, bool]:
+        value_counts, null_count = state
+        non_unique = int((value_counts - 1).sum()) + max(null_count - 1, 0)
+        return non_unique, not (non_unique)
+
+
+class PatternValidator(StatisticsValidator):
+
+    row_wise = True
+    # Object array of match results and its mask.
+    temporary_row_bytes = 9
 
-class PatternValidator(Validator):
     def __init__(
         self,
         pattern: Union[str, Pattern],
@@ -221,9 +1136,15 @@ class PatternValidator(Validator):
         super().__init__(mandatory, description)
         self.pattern = pattern
 
-    def _evaluate(self, column: pd.Series) -> Tuple[int, bool]:
+    def _evaluate_statistics(
+        self, column: pd.Series, column_statistics: statistics.ColumnStatistics
+    ) -> Tuple[int, bool]:
 
-        non_null = column.count()
+        non_null = column_statistics.non_null_count
         match_count = column.str.fullmatch(self.pattern, case=True).sum()
 
         return (non_null - match_count), not (non_null - match_count) > 0
+
+    def failure_mask(self, column: pd.Series) -> np.ndarray:
+        matches = column.str.fullmatch(self.pattern, case=True)
+        return ~np.asarray(matches.fillna(True).astype(bool))
@@ -9,6 +9,7 @@ setup(
     author_email="villanueva.alexis17@gmail.com",
     license="MIT",
     packages=["pandantic"],
+    entry_points={"console_scripts": ["pandantic=pandantic.cli:main"]},
     zip_safe=False,
     install_requires=[
         "numpy==2.1.3",
@@ -17,6 +18,11 @@ setup(
         "pytz==2022.1",
         "six==1.16.0",
     ],
+    extras_require={
+        "dask": ["dask[dataframe]>=2023.1.0"],
+        "numba": ["numba>=0.61.0"],
+        "arrow": ["pyarrow>=10.0.1"],
+    },
     setup_requires=["pytest-runner"],
     tests_require=["pytest"],
 )